@@ -0,0 +1,186 @@
+"""Audio manager — sound effects decoded once, music read ahead of time.
+
+Sound effects (short clips such as `level_up.mp3`) are decoded into a
+`pygame.mixer.Sound` the first time they are asked for and kept for the
+rest of the process, so creating a new GameEngine or firing the same
+effect again never touches the disk. `play(name)` is fire-and-forget:
+it plays the effect on a free mixer channel (Config.AUDIO_CHANNELS in
+total) and simply drops it when every channel is busy or the effect is
+already playing Config.SFX_MAX_PER_SOUND times, so a burst of combat
+sounds can neither stall a frame nor drown everything else out.
+
+Music is streamed by `pygame.mixer.music`, one track at a time. Each
+screen has a track (SCREEN_MUSIC) and each track the tracks that
+usually follow it (NEXT_TRACKS); after a track starts, those are read
+into memory on a background thread, so the next screen switch streams
+its music from RAM instead of opening and reading a multi-megabyte file
+in the middle of a frame. Only the current and the upcoming tracks are
+kept.
+
+Without an initialised mixer (headless runs, no audio device) effects
+are SilentSound and every call is a no-op.
+"""
+
+import io
+import os
+import threading
+
+import pygame
+
+from core.config import Config
+
+# screen -> (track, loops); screens not listed keep the current music
+SCREEN_MUSIC = {
+    "welcome": ("start.mp3", -1),
+    "main_menu": ("start.mp3", -1),
+    "game_window": ("game.mp3", -1),
+    "winner": ("winner.mp3", 0),
+    "game_over": ("game_over.mp3", 0),
+}
+
+# track -> tracks of the screens usually reached from it
+NEXT_TRACKS = {
+    "start.mp3": ("game.mp3",),
+    "game.mp3": ("game_over.mp3", "winner.mp3", "start.mp3"),
+    "game_over.mp3": ("start.mp3",),
+    "winner.mp3": ("start.mp3",),
+}
+
+
+class SilentSound:
+    """Stand-in for pygame.mixer.Sound when running without audio."""
+
+    def play(self, *args, **kwargs):
+        pass
+
+    def stop(self):
+        pass
+
+    def set_volume(self, *args, **kwargs):
+        pass
+
+    def get_num_channels(self):
+        return 0
+
+
+class AudioManager:
+    def __init__(self, sound_dir=None):
+        self.sound_dir = sound_dir or Config.MUSIC_DIR
+        self.max_channels = Config.AUDIO_CHANNELS
+        self.per_sound = Config.SFX_MAX_PER_SOUND
+        self.current_music = None
+        self._sounds = {}  # file -> Sound, decoded once per process
+        self._tracks = {}  # file -> bytes of a music file read ahead
+        self._lock = threading.Lock()
+        self._prefetch_gen = 0  # bumped by each prefetch; older readers stop storing
+        self._channels_set = False
+
+    @property
+    def enabled(self):
+        return pygame.mixer.get_init() is not None
+
+    def _path(self, name):
+        return os.path.join(self.sound_dir, name)
+
+    # --- Sound effects ---
+
+    def sound(self, name, volume=None):
+        """The process-wide Sound for `name` (SilentSound without audio).
+
+        `volume` is applied to the shared Sound, so it sets the level of
+        every later play of that effect too.
+        """
+        sound = self._sounds.get(name)
+        if sound is None:
+            if not self.enabled:
+                return SilentSound()
+            try:
+                sound = pygame.mixer.Sound(self._path(name))
+            except (pygame.error, OSError) as e:
+                print(f"Could not load sound {name}: {e}")
+                sound = SilentSound()
+            self._sounds[name] = sound
+        if volume is not None:
+            sound.set_volume(volume)
+        return sound
+
+    def preload(self, *names):
+        """Decode effects now (e.g. behind a loading screen) instead of on first play."""
+        for name in names:
+            self.sound(name)
+
+    def play(self, name, volume=None):
+        """Fire-and-forget an effect; returns its Channel, or None if dropped."""
+        if not self.enabled:
+            return None
+        if not self._channels_set:
+            pygame.mixer.set_num_channels(self.max_channels)
+            self._channels_set = True
+        sound = self.sound(name, volume)
+        if sound.get_num_channels() >= self.per_sound:
+            return None
+        # Sound.play returns None instead of waiting when no channel is free
+        return sound.play()
+
+    # --- Music ---
+
+    def prefetch(self, names):
+        """Read music files into memory on a background thread.
+
+        Tracks not in `names` (other than the one playing) are released.
+        """
+        keep = set(names) | {self.current_music}
+        with self._lock:
+            self._prefetch_gen += 1
+            generation = self._prefetch_gen
+            for name in list(self._tracks):
+                if name not in keep:
+                    del self._tracks[name]
+            missing = [n for n in names if n not in self._tracks]
+        if missing:
+            threading.Thread(target=self._read_tracks, args=(missing, generation), daemon=True).start()
+
+    def _read_tracks(self, names, generation):
+        for name in names:
+            try:
+                with open(self._path(name), "rb") as f:
+                    data = f.read()
+            except OSError:
+                continue  # play_music reports it if the track is ever needed
+            with self._lock:
+                if generation != self._prefetch_gen:
+                    return  # a later prefetch replaced this list; don't keep released tracks
+                self._tracks[name] = data
+
+    def play_music(self, name, loops=-1, volume=0.5):
+        if self.current_music == name or not self.enabled:
+            return
+        with self._lock:
+            data = self._tracks.get(name)
+        try:
+            if data is not None:
+                pygame.mixer.music.load(io.BytesIO(data), name)
+            else:
+                pygame.mixer.music.load(self._path(name))
+            pygame.mixer.music.set_volume(volume)
+            pygame.mixer.music.play(loops)
+            self.current_music = name
+        except (pygame.error, OSError) as e:
+            print(f"Could not play music {name}: {e}")
+            return
+        self.prefetch(NEXT_TRACKS.get(name, ()))
+
+    def play_screen_music(self, screen):
+        """Start the track of `screen`, if it has one."""
+        if screen in SCREEN_MUSIC:
+            name, loops = SCREEN_MUSIC[screen]
+            self.play_music(name, loops=loops)
+
+    def stop_music(self):
+        if self.enabled:
+            pygame.mixer.music.stop()
+        self.current_music = None
+
+
+# Shared by the screens and every GameEngine of the process
+audio = AudioManager()
@@ -0,0 +1,211 @@
+"""Asset manifest — every definition JSON parsed once and cached in one file.
+
+Startup used to list and `json.load` every file of every definition
+folder for each AssetManager (and again for the animation clock, the
+save menu...). The manifest keeps the parsed definitions of all folders
+in Config.ASSET_MANIFEST, read with a single `json.load`:
+
+  - a folder is only listed again when its mtime changed (files added,
+    removed or renamed);
+  - a file is only read again when its mtime/size changed, and only
+    re-parsed when its content hash differs;
+  - `compiled(name, build)` caches data derived from all definitions
+    (e.g. AssetManager's layouts) until any definition changes.
+
+Everything handed out is shared; callers must copy before mutating.
+"""
+
+import hashlib
+import json
+import os
+
+from core.config import Config
+
+
+class AssetManifest:
+    VERSION = 1
+
+    def __init__(self, dirs=None, path=None):
+        if dirs is None:
+            dirs = dict(Config.DIRS, item=Config.ITEM_DIR)
+        self.dirs = dirs
+        self.path = path or Config.ASSET_MANIFEST
+        self._dirs = {}  # category -> {"mtime", "files": {name: entry}}
+        self._compiled = {}  # name -> {"signature", "data"}
+        self.signature = None
+        self.reparsed = 0  # files parsed during the last refresh
+        self._loaded = False
+
+    # Loading
+    def refresh(self):
+        """Bring the manifest up to date with the definition folders."""
+        if not self._loaded:
+            self._read()
+            self._loaded = True
+
+        dirty = False
+        self.reparsed = 0
+        for category, folder in self.dirs.items():
+            if self._refresh_dir(category, folder):
+                dirty = True
+
+        signature = self._signature()
+        if signature != self.signature:
+            self.signature = signature
+            dirty = True
+        if dirty:
+            self._write()
+        return self
+
+    def _read(self):
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") != self.VERSION:
+            return
+        self._dirs = data.get("dirs", {})
+        self._compiled = data.get("compiled", {})
+        self.signature = data.get("signature")
+
+    def _write(self):
+        folder = os.path.dirname(self.path)
+        tmp = self.path + ".tmp"
+        try:
+            if folder:
+                os.makedirs(folder, exist_ok=True)
+            with open(tmp, "w") as f:
+                json.dump(
+                    {
+                        "version": self.VERSION,
+                        "signature": self.signature,
+                        "dirs": self._dirs,
+                        "compiled": self._compiled,
+                    },
+                    f,
+                )
+            os.replace(tmp, self.path)
+        except OSError as e:
+            print(f"Could not write asset manifest {self.path}: {e}")
+
+    def _refresh_dir(self, category, folder):
+        try:
+            dir_mtime = os.stat(folder).st_mtime_ns
+        except OSError:
+            return self._dirs.pop(category, None) is not None
+
+        record = self._dirs.get(category)
+        dirty = False
+        if record is None or record.get("folder") != folder:
+            record = {"folder": folder, "mtime": None, "files": {}}
+            self._dirs[category] = record
+            dirty = True
+
+        if record["mtime"] != dir_mtime:
+            # Files were added, removed or renamed: list the folder again,
+            # keeping the directory order callers have always seen
+            old = record["files"]
+            record["files"] = {
+                name: old.get(name)
+                for name in os.listdir(folder)
+                if name.endswith(".json")
+            }
+            record["mtime"] = dir_mtime
+            dirty = True
+
+        files = record["files"]
+
+        for name in list(files):
+            if self._refresh_file(folder, files, name):
+                dirty = True
+        return dirty
+
+    def _refresh_file(self, folder, files, name):
+        path = os.path.join(folder, name)
+        try:
+            st = os.stat(path)
+        except OSError:
+            del files[name]
+            return True
+
+        entry = files[name]
+        if entry and entry["mtime"] == st.st_mtime_ns and entry["size"] == st.st_size:
+            return False
+
+        try:
+            with open(path, "rb") as f:
+                raw = f.read()
+        except OSError as e:
+            print(f"Error reading definition {name}: {e}")
+            del files[name]
+            return True
+
+        digest = hashlib.sha1(raw).hexdigest()
+        if entry and entry["hash"] == digest:
+            # Touched but unchanged: keep the parsed data
+            entry["mtime"], entry["size"] = st.st_mtime_ns, st.st_size
+            return True
+
+        try:
+            data = json.loads(raw)
+        except ValueError as e:
+            print(f"Error loading definition {name}: {e}")
+            data = None
+        self.reparsed += 1
+        files[name] = {
+            "mtime": st.st_mtime_ns,
+            "size": st.st_size,
+            "hash": digest,
+            "data": data,
+        }
+        return True
+
+    def _signature(self):
+        h = hashlib.sha1()
+        for category in sorted(self._dirs):
+            for name, entry in sorted(self._dirs[category]["files"].items()):
+                h.update(f"{category}/{name}:{entry['hash'] if entry else ''};".encode())
+        return h.hexdigest()
+
+    # Lookup
+    def definitions(self, category):
+        """{file name: parsed JSON} of one folder, in directory order (broken files skipped)."""
+        record = self._dirs.get(category)
+        if not record:
+            return {}
+        return {
+            name: entry["data"]
+            for name, entry in record["files"].items()
+            if entry and entry["data"] is not None
+        }
+
+    def get(self, category, name):
+        if not name.endswith(".json"):
+            name += ".json"
+        entry = self._dirs.get(category, {}).get("files", {}).get(name)
+        return entry["data"] if entry else None
+
+    def compiled(self, name, build):
+        """`build(self)` cached in the manifest until any definition changes.
+
+        The result must be JSON-serialisable; it is returned as stored.
+        """
+        cached = self._compiled.get(name)
+        if cached and cached.get("signature") == self.signature:
+            return cached["data"]
+        data = build(self)
+        self._compiled[name] = {"signature": self.signature, "data": data}
+        self._write()
+        return data
+
+
+_shared = None
+
+
+def load_manifest():
+    """The process-wide manifest, re-validated against the folders on each call."""
+    global _shared
+    if _shared is None:
+        _shared = AssetManifest()
+    return _shared.refresh()
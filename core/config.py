@@ -7,6 +7,9 @@ class Config:
     HEX_SIZE = BASE_HEX_RADIUS * GAME_SCALE  # 48 pixels
     HEX_ASPECT_RATIO = 0.87
     CALIB_OFFSET_Y = 16 * GAME_SCALE
+    # The world is drawn at 1/RENDER_SCALE of the window and upscaled once
+    # per frame (integer, nearest neighbour); 1 draws at full resolution
+    RENDER_SCALE = GAME_SCALE
     
     # Window Settings
     WINDOW_WIDTH = 1200
@@ -16,6 +19,31 @@ class Config:
     
     # Game Logic
     VISIBLE_RADIUS = 4  # Fog of War radius
+
+    # Simulation timing: the world advances in fixed ticks, independent of FPS
+    FPS = 60
+    SIM_TICK_MS = 60  # the old per-frame animation timer fired every ~55-67 ms at 60 FPS
+    MAX_SIM_STEPS = 5  # catch-up cap per frame; older backlog is dropped
+
+    # Sprite cache budget per AssetManager (sheets, frames and variants);
+    # least recently used surfaces are dropped past it
+    SPRITE_CACHE_BYTES = 192 * 1024 * 1024
+
+    # Frame profiler (F2): frames kept for percentiles, CSV written on exit
+    PROFILE_FRAMES = 600
+    PROFILE_CSV = "frame_profile.csv"
+
+    # Asset preloader: main-thread time per frame spent on convert_alpha
+    PRELOAD_SLICE_MS = 4
+    # Main-thread time per frame GameWindow spends prebaking entity variants
+    PREBAKE_SLICE_MS = 4
+
+    # Rendered text surfaces (and wrapped layouts) kept by the UI text cache
+    TEXT_CACHE_SIZE = 512
+
+    # Audio: mixer channels, and how many copies of one effect may overlap
+    AUDIO_CHANNELS = 16
+    SFX_MAX_PER_SOUND = 3
     
     # Editor Settings (Merged)
     GRID_RANGE = 20
@@ -31,3 +59,9 @@ class Config:
         "player": "assets/definitions/player",
         "chest": "assets/definitions/chests",
     }
+    ITEM_DIR = "assets/definitions/items"
+    MUSIC_DIR = "assets/music"
+    # Parsed definitions of every folder above, rebuilt only for changed files
+    ASSET_MANIFEST = os.path.join(".cache", "asset_manifest.json")
+    # Packed images (python -m visuals.asset_bundle); loose files are used without it
+    ASSET_BUNDLE = "assets.bundle"
@@ -30,17 +30,71 @@ class HexMath:
             s = -q - r
         return int(q), int(r)
 
+    # Geometry tables, built once per (HEX_SIZE, HEX_ASPECT_RATIO, ...) key
+    _polygon_offsets = {}
+    _range_offsets = {}
+
+    @staticmethod
+    def get_hex_polygon_offsets(scale=1.0):
+        """Corner offsets ((x, y) pairs) of a hex centred on (0, 0), times `scale`."""
+        key = (Config.HEX_SIZE, Config.HEX_ASPECT_RATIO, scale)
+        offsets = HexMath._polygon_offsets.get(key)
+        if offsets is None:
+            size = Config.HEX_SIZE * scale
+            offsets = tuple(
+                (
+                    size * math.cos(math.radians(60 * i)),
+                    size * math.sin(math.radians(60 * i)) * Config.HEX_ASPECT_RATIO,
+                )
+                for i in range(6)
+            )
+            HexMath._polygon_offsets[key] = offsets
+        return offsets
+
     @staticmethod
     def get_hex_polygon(cx, cy):
         points = []
-        for i in range(6):
-            angle_rad = math.radians(60 * i)
-            vx = Config.HEX_SIZE * math.cos(angle_rad)
-            vy = Config.HEX_SIZE * math.sin(angle_rad)
+        for vx, vy in HexMath.get_hex_polygon_offsets():
             points.append(cx + vx)
-            points.append(cy + (vy * Config.HEX_ASPECT_RATIO))
+            points.append(cy + vy)
         return points
 
+    @staticmethod
+    def get_range_offsets(radius):
+        """Axial offsets (dq, dr) within `radius` hexes, sorted back to front."""
+        key = (Config.HEX_SIZE, Config.HEX_ASPECT_RATIO, radius)
+        offsets = HexMath._range_offsets.get(key)
+        if offsets is None:
+            cells = [
+                (q, r)
+                for q in range(-radius, radius + 1)
+                for r in range(max(-radius, -q - radius), min(radius, -q + radius) + 1)
+            ]
+            cells.sort(key=lambda c: HexMath.hex_to_pixel(c[0], c[1])[::-1])
+            offsets = tuple(cells)
+            HexMath._range_offsets[key] = offsets
+        return offsets
+
+    @staticmethod
+    def hexes_in_rect(left, top, right, bottom, scale=1.0):
+        """Axial coords of every hex whose centre is inside the pixel rect, back to front.
+
+        The rect is in hex_to_pixel space times `scale` (e.g. the camera's
+        view offset), so only those hexes are visited.
+        """
+        col_w = Config.HEX_SIZE * 1.5 * scale
+        row_h = Config.HEX_SIZE * math.sqrt(3) * Config.HEX_ASPECT_RATIO * scale
+
+        cells = []
+        for q in range(math.ceil(left / col_w), math.floor(right / col_w) + 1):
+            r0 = math.ceil(top / row_h - q / 2)
+            r1 = math.floor(bottom / row_h - q / 2)
+            for r in range(r0, r1 + 1):
+                cells.append((q, r))
+        # y grows with r + q / 2; ties go left to right
+        cells.sort(key=lambda c: (2 * c[1] + c[0], c[0]))
+        return cells
+
     @staticmethod
     def distance(q1, r1, q2, r2):
         return (abs(q1 - q2) + abs(q1 + r1 - q2 - r2) + abs(r1 - r2)) / 2
@@ -0,0 +1,118 @@
+"""Frame profiler — per-phase timings for the last few hundred frames.
+
+Phases are timed with `with profiler.phase("render.terrain"):` or the
+`@profiler.timed("turn")` decorator. Each frame's timings (ms) go into a
+ring buffer of Config.PROFILE_FRAMES samples; `percentiles()` gives
+p50/p95/p99 per phase for the overlay (F2) and `export_csv()` writes the
+samples out when the game exits.
+
+Disabled (the default), `phase()` returns one shared no-op context
+manager and `timed` functions call straight through, so the hooks cost
+an attribute check.
+"""
+
+import csv
+import functools
+import time
+from collections import deque
+from contextlib import nullcontext
+
+from core.config import Config
+
+_NO_TIMER = nullcontext()
+
+
+class _PhaseTimer:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = (time.perf_counter() - self.start) * 1000.0
+        current = self.profiler._current
+        current[self.name] = current.get(self.name, 0.0) + elapsed
+        return False
+
+
+class FrameProfiler:
+    def __init__(self, capacity=None, enabled=False):
+        self.samples = deque(maxlen=capacity or Config.PROFILE_FRAMES)
+        self.enabled = enabled
+        self.phases = []  # phase names in first-seen order
+        self._current = {}
+        self.frame_count = 0
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self._current = {}
+        return self.enabled
+
+    # Timing
+    def phase(self, name):
+        """Context manager adding the time spent inside to phase `name`."""
+        if not self.enabled:
+            return _NO_TIMER
+        return _PhaseTimer(self, name)
+
+    def timed(self, name):
+        """Decorator form of `phase` for whole functions."""
+        def wrap(func):
+            @functools.wraps(func)
+            def inner(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with _PhaseTimer(self, name):
+                    return func(*args, **kwargs)
+            return inner
+        return wrap
+
+    def end_frame(self):
+        """Close the current frame: its phase timings become one sample."""
+        if not self.enabled:
+            return
+        frame = self._current
+        self._current = {}
+        for name in frame:
+            if name not in self.phases:
+                self.phases.append(name)
+        self.frame_count += 1
+        self.samples.append((self.frame_count, frame))
+
+    # Reporting
+    def percentiles(self, name, points=(50, 95, 99)):
+        """(p50, p95, p99) of phase `name` in ms over the buffered frames."""
+        values = sorted(frame[name] for _, frame in self.samples if name in frame)
+        if not values:
+            return tuple(0.0 for _ in points)
+        last = len(values) - 1
+        return tuple(values[min(last, round(p / 100.0 * last))] for p in points)
+
+    def summary(self):
+        return {name: self.percentiles(name) for name in self.phases}
+
+    def export_csv(self, path=None):
+        """Write one row per buffered frame (ms per phase); returns the path or None."""
+        if not self.samples:
+            return None
+        path = path or Config.PROFILE_CSV
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame"] + self.phases)
+            for index, frame in self.samples:
+                writer.writerow(
+                    [index] + [
+                        f"{frame[name]:.3f}" if name in frame else ""
+                        for name in self.phases
+                    ]
+                )
+        return path
+
+
+# Shared by the screen manager, game window, engine and renderer
+profiler = FrameProfiler()
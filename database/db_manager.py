@@ -4,12 +4,19 @@ import json
 
 
 class DatabaseManager:
-    def __init__(self, db_file="game_data.db"):
+    def __init__(self, db_file="game_data.db", read_only=False):
         self.db_file = db_file
-        self.conn = sqlite3.connect(db_file)
+        if read_only:
+            # Inspect a save (or the default.db template) without migrating it
+            self.conn = sqlite3.connect(f"file:{db_file}?mode=ro", uri=True)
+        else:
+            self.conn = sqlite3.connect(db_file)
         self.conn.row_factory = sqlite3.Row
         self.cursor = self.conn.cursor()
-        self._check_schema()
+        # {definition path: (mtime, parsed json)} for load_monsters
+        self._monster_def_cache = {}
+        if not read_only:
+            self._check_schema()
 
     def _check_schema(self):
         """Ensures the database has the required tables."""
@@ -260,6 +267,18 @@ class DatabaseManager:
         )
         self.conn.commit()
 
+    def update_discoveries(self, session_id, tile_ids):
+        """Mark many tiles discovered in a single transaction."""
+        self.cursor.executemany(
+            """
+            INSERT INTO session_world_state (session_id, tile_id, is_discovered)
+            VALUES (?, ?, 1)
+            ON CONFLICT(session_id, tile_id) DO UPDATE SET is_discovered=1
+            """,
+            [(session_id, tile_id) for tile_id in tile_ids],
+        )
+        self.conn.commit()
+
     def unlock_level(self, session_id, level):
         self.cursor.execute("""
             INSERT INTO session_world_state (session_id, tile_id, is_unlocked)
@@ -613,12 +632,13 @@ class DatabaseManager:
     # Monsters
     # =========================
 
-    def load_monsters(self, session_id=None):
+    def load_monsters(self, session_id=None, ids=None):
         """Load all alive monsters with their equipment item data.
 
         Returns a list of dicts. Each dict has the monster columns plus
         nested item dicts for each equipment slot (weapon_item, armor_item)
-        — or None if the slot is empty.
+        — or None if the slot is empty. Pass `ids` to load only those
+        monsters (e.g. the rows just returned by add_monsters).
         """
         query = """
         SELECT m.*,
@@ -645,25 +665,21 @@ class DatabaseManager:
         LEFT JOIN items li ON m.legs_item_id = li.id
         WHERE m.is_defeated = 0
         """
-        self.cursor.execute(query)
+        params = ()
+        if ids is not None:
+            ids = list(ids)
+            if not ids:
+                return []
+            query += f" AND m.id IN ({', '.join('?' for _ in ids)})"
+            params = tuple(ids)
+        self.cursor.execute(query, params)
         results = []
 
-        monster_def_dir = os.path.join("assets", "definitions", "monsters")
-
         for raw_row in self.cursor.fetchall():
             row = dict(raw_row)
 
             # 1) load monster definition json by name
-            definition = {}
-            monster_name = row.get("name")
-            if monster_name:
-                def_path = os.path.join(monster_def_dir, monster_name)
-                if os.path.exists(def_path):
-                    try:
-                        with open(def_path, "r") as f:
-                            definition = json.load(f)
-                    except Exception as e:
-                        print(f"Error loading monster definition {monster_name}: {e}")
+            definition = self._get_monster_definition(row.get("name"))
 
             # 2) build nested equipment dicts from DB joins
             equipment_data = {}
@@ -707,6 +723,34 @@ class DatabaseManager:
 
         return results
 
+    def _get_monster_definition(self, monster_name):
+        """Return the parsed definition JSON for a monster name, or {}.
+
+        Definitions are cached per file and only re-read when the file's
+        mtime changes, so reloading many monsters does not re-parse JSON.
+        """
+        if not monster_name:
+            return {}
+        def_path = os.path.join("assets", "definitions", "monsters", monster_name)
+        try:
+            mtime = os.path.getmtime(def_path)
+        except OSError:
+            return {}
+
+        cached = self._monster_def_cache.get(def_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        try:
+            with open(def_path, "r") as f:
+                definition = json.load(f)
+        except Exception as e:
+            print(f"Error loading monster definition {monster_name}: {e}")
+            return {}
+
+        self._monster_def_cache[def_path] = (mtime, definition)
+        return definition
+
     def save_monster_equipment(self, monster_id, equipment):
         """Persist a monster's equipment slots to DB.
 
@@ -752,6 +796,32 @@ class DatabaseManager:
         )
         self.conn.commit()
 
+    def add_monsters(self, rows):
+        """Insert many monsters in one transaction and return their new ids.
+
+        rows: iterable of dicts with name, q, r, health, damage, level and
+        an optional castle_id. Ids are returned in the order of `rows`.
+        """
+        new_ids = []
+        try:
+            for row in rows:
+                self.cursor.execute(
+                    """INSERT INTO monsters (name, current_q, current_r, health, current_hp,
+                                             damage, level, is_defeated, castle_id)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, 0, ?)""",
+                    (
+                        row["name"], row["q"], row["r"],
+                        row["health"], row["health"], row["damage"],
+                        row.get("level", 1), row.get("castle_id"),
+                    ),
+                )
+                new_ids.append(self.cursor.lastrowid)
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        return new_ids
+
     def update_monster_stats(self, q, r, hp, dmg):
         """Updates health and damage of a monster at a q/r"""
         self.cursor.execute(
@@ -786,6 +856,22 @@ class DatabaseManager:
         self.cursor.execute("SELECT * FROM map_tiles")
         return [dict(row) for row in self.cursor.fetchall()]
 
+    def get_asset_refs(self):
+        """Every texture file or definition name (monsters, castles) this save
+        refers to, for the asset preloader."""
+        self.cursor.execute(
+            """
+            SELECT texture_file FROM map_tiles
+            UNION SELECT prop_texture_file FROM map_tiles
+            UNION SELECT texture_file FROM items
+            UNION SELECT texture_file FROM player_state
+            UNION SELECT asset_file FROM map_castles
+            UNION SELECT name FROM monsters WHERE is_defeated = 0
+            UNION SELECT monster_name FROM map_castle_spawns
+            """
+        )
+        return {row[0] for row in self.cursor.fetchall() if row[0]}
+
     def save_tile(self, data):
         """
         data: dict containing tile attributes
@@ -6,6 +6,7 @@ import os
 import json
 import math
 from PIL import Image, ImageTk
+from core.asset_manifest import AssetManifest
 
 
 
@@ -304,32 +305,31 @@ class AssetManager:
         self.anim_frame_cache = {}
         self.texture_layout_map = {}
         self.castle_assets = set()
+        # Parsed tile/prop definitions; only files changed since the last
+        # refresh (e.g. the one save_json just wrote) are read again
+        self.manifest = AssetManifest(
+            dirs={c: Config.DIRS[c] for c in ("tile", "prop")},
+            path=os.path.join(".cache", "editor_manifest.json"),
+        )
         self.refresh_layouts()
 
     def refresh_layouts(self):
         self.texture_layout_map = {}
+        self.manifest.refresh()
         for category in ["tile", "prop"]:
-            folder = Config.DIRS.get(category)
-            if not os.path.exists(folder):
-                continue
-            for fname in os.listdir(folder):
-                if not fname.endswith(".json"):
-                    continue
-                path = os.path.join(folder, fname)
+            for fname, data in self.manifest.definitions(category).items():
                 try:
-                    with open(path, "r") as f:
-                        data = json.load(f)
-                        tex = data.get("texture_file")
-                        if not tex and "animations" in data:
-                            tex = data["animations"].get("idle", {}).get("texture")
-                        if tex:
-                            s = data.get("prop_scale") or data.get("scale", 1.0)
-                            x = data.get("prop_x_shift") or data.get("x_shift", 0)
-                            y = data.get("prop_y_shift") or data.get("prop_shift") or data.get("y_shift", 0)
-                            star_y = data.get("star_y_offset", 50.0)
-                            self.texture_layout_map[tex] = (float(s), int(x), int(y), float(star_y))
-                            if data.get("is_castle") or "castle" in fname.lower():
-                                self.castle_assets.add(tex)
+                    tex = data.get("texture_file")
+                    if not tex and "animations" in data:
+                        tex = data["animations"].get("idle", {}).get("texture")
+                    if tex:
+                        s = data.get("prop_scale") or data.get("scale", 1.0)
+                        x = data.get("prop_x_shift") or data.get("x_shift", 0)
+                        y = data.get("prop_y_shift") or data.get("prop_shift") or data.get("y_shift", 0)
+                        star_y = data.get("star_y_offset", 50.0)
+                        self.texture_layout_map[tex] = (float(s), int(x), int(y), float(star_y))
+                        if data.get("is_castle") or "castle" in fname.lower():
+                            self.castle_assets.add(tex)
                 except Exception as e:
                     print(f"Error reading {fname}: {e}")
 
@@ -237,7 +237,7 @@ class MonkAssistant(Assistant):
         self.heal_cd_remaining = self.heal_cd_turns
         self.flip_x = (target.q < self.q)
 
-        world.effects.append(HealEffect(target))
+        world.effects.append(HealEffect.acquire(target))
         
     def decide_and_act(self, world, player):
         if not self.is_alive() or getattr(self, "is_moving", False) or self.anim_state in ("attack", "hit"):
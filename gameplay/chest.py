@@ -61,8 +61,8 @@ class Chest:
         # Opening lifecycle flags.
         self.opened = False
         self.open_complete = False
-        # The main loop calls update_animation every ~50ms, so 7 ticks
-        # is roughly a third of a second of chest sits open
+        # update_animation runs once per simulation tick (~60ms), so 7
+        # ticks is roughly 0.4 seconds of chest sits open
         self.despawn_delay_ticks = 7
         self._despawn_counter = 0
         self.remove_after_open = False
@@ -14,14 +14,25 @@ Design patterns in this module:
   - Resource lock guard: every pickup/use routes through
     world.resource_locks so interleaved operations can't double-award
     or double-consume an item.
+  - Change journal: monsters and discovered tiles are written back by
+    draining world.journal, so a turn only saves what actually changed.
+
+The real-time parts of the simulation (animation ticks that land attack
+hits and finish moves, and the per-entity AI timers) also live here as
+`tick`, one fixed simulation step of Config.SIM_TICK_MS. GameWindow runs
+as many ticks as wall time requires and the headless `step` API runs
+them back to back, so both drive exactly the same logic regardless of
+frame rate.
 """
 
 import time
+from core.profiler import profiler
 from gameplay.world import World
+from gameplay.journal import ChangeKind
+from gameplay.simulation import AnimationClock, SilentSound, random_policy
+from audio.audio_manager import audio
 from gameplay.item import Item
 from gameplay.chest import Chest
-import pygame
-import os
 import random
 
 
@@ -35,13 +46,35 @@ class GameEngine:
       - Persist player/monster state to the DB after each mutation via
         the `_safe_save_*` helpers (which swallow IO errors and surface
         them as SAVE_ERROR return codes, never as crashes).
+      - Flush the world journal after every turn so monsters that moved,
+        took damage or died and newly discovered tiles reach the DB.
       - Expose the loot notification queue for the UI to drain.
+      - Advance animations and real-time AI (`tick_animations`,
+        `tick_ai`, both run by `tick`); with `headless=True` the engine needs no display or
+        audio and `step(n_turns)` plays whole turns in a tight loop.
     """
 
-    def __init__(self, db, session_id):
+    # Journal subscriber name used for incremental persistence
+    JOURNAL_NAME = "persistence"
+    PERSISTED_CHANGES = (
+        ChangeKind.ENTITY_MOVED,
+        ChangeKind.HP_CHANGED,
+        ChangeKind.ENTITY_DIED,
+    )
+
+    # Real-time AI delays, in simulation ticks (Config.SIM_TICK_MS each).
+    # Assistants use a slightly different interval than monsters to
+    # prevent synchronized movement. Same wall-clock delays as the old
+    # per-frame timers at 60 FPS (30-40 and 25-35 frames)
+    MONSTER_AI_TICKS = (8, 11)
+    ASSISTANT_AI_TICKS = (7, 10)
+
+    def __init__(self, db, session_id, headless=False):
         self.db = db
+        self.headless = headless
         self.session_id = session_id
         self.world = World(db, session_id)
+        self.world.journal.subscribe(self.JOURNAL_NAME)
         self.world.update_fog_of_war()
         self.show_inventory = False  # toggle flag
         self.selected_index = 0  # cursor position in inventory
@@ -56,11 +89,18 @@ class GameEngine:
         # The UI layer drains this and renders them with a fade.
         self.loot_notifications_queue = []
 
-        self.level_up_sound = pygame.mixer.Sound(
-            os.path.join("assets", "music", "level_up.mp3")
-        )
+        # Headless engines resolve animations from definition metadata only
+        self.animator = AnimationClock() if headless else None
+
+        if headless:
+            self.level_up_sound = SilentSound()
+        else:
+            # Decoded once per process, shared by every engine
+            self.level_up_sound = audio.sound("level_up.mp3")
         self.level_up_sound.set_volume(0.6)
 
+        self.flush_journal()
+
     def handle_input(self, action):
         player = self.world.player
 
@@ -197,7 +237,13 @@ class GameEngine:
         player = self.world.player
         if not player:
             return
-        player.drop_item(self.selected_index, self.db, self.session_id)
+        item = None
+        if self.selected_index < len(player.inventory):
+            item = player.inventory[self.selected_index]
+        if player.drop_item(self.selected_index, self.db, self.session_id):
+            self.world.journal.record(
+                ChangeKind.ITEM_DROPPED, item, player.q, player.r
+            )
         if self.selected_index >= len(player.inventory):
             self.selected_index = max(0, len(player.inventory) - 1)
 
@@ -224,6 +270,9 @@ class GameEngine:
             chest = self.world.get_chest_at(player.q + dq, player.r + dr)
             if chest is not None and not chest.opened:
                 chest.open_chest()
+                self.world.journal.record(
+                    ChangeKind.CHEST_OPENED, chest, chest.q, chest.r
+                )
                 self._award_chest_items(chest)
                 return True
         return False
@@ -300,6 +349,9 @@ class GameEngine:
                     self.db.add_item(self.session_id, item.id)
                     self.db.remove_ground_item(item.id)
                     self.world.resource_locks.consume(resource_id)
+                    self.world.journal.record(
+                        ChangeKind.ITEM_PICKED, item, item.q, item.r
+                    )
 
                     # Track for notification
                     counts[item.name] = counts.get(item.name, 0) + 1
@@ -330,6 +382,9 @@ class GameEngine:
             return False
 
     def _safe_save_monster(self, monster):
+        # Runtime-only entities (projectiles, spawns) have no DB row
+        if getattr(monster, "id", None) is None:
+            return True
         try:
             if hasattr(self.db, "save_monster"):
                 self.db.save_monster(monster)
@@ -403,7 +458,7 @@ class GameEngine:
 
         # Spawn a chest at the monster's tile holding the loot.
         loot_chest = Chest(monster.q, monster.r, "brown_chest", items=drops)
-        self.world.chests.append(loot_chest)
+        self.world.add_chest(loot_chest)
 
         # Persistent state by saving the chest to DB
         if hasattr(self.db, "save_chest"):
@@ -504,14 +559,147 @@ class GameEngine:
         assistant_pool = ["warrior_assistant", "archer_assistant", "monk_assistant"]
         chosen_name = random.choice(assistant_pool)
 
-        self.db.add_monster(
-            chosen_name,
-            spawn_q, spawn_r, 
-            100, 10, castle.level 
-        )
-        
-        self.world.load_monsters()
+        self.world.spawn_entities([{
+            "name": chosen_name,
+            "q": spawn_q, "r": spawn_r,
+            "health": 100, "damage": 10,
+            "level": castle.level,
+        }])
                 
+    @profiler.timed("sim.animations")
+    def tick_animations(self, asset_manager=None):
+        """Advance every entity by one animation tick.
+
+        This is where queued attacks land (on their hit frame), moves
+        finish, dead monsters drop loot and finished deaths/opened chests
+        are removed. `asset_manager` only needs `anim_metadata`; it
+        defaults to the engine's own AnimationClock.
+        """
+        animator = asset_manager or self.animator
+        if animator is None:
+            animator = self.animator = AnimationClock()
+
+        world = self.world
+        player = world.player
+        if player:
+            player.update_animation(animator)
+
+        # Removals are queued and applied together by flush_removals
+        for monster in world.monsters:
+            monster.update_animation(animator)
+
+            if getattr(monster, "death_finished", False):
+                self.drop_monster_loot(monster)
+
+            if getattr(monster, "remove_after_death", False):
+                world.remove_entity(monster)
+
+        for assistant in world.assistants:
+            assistant.update_animation(animator)
+
+            if getattr(assistant, "remove_after_death", False):
+                world.remove_entity(assistant)
+
+        # Chest animations + despawn after opening
+        for chest in world.chests:
+            chest.update_animation(animator)
+            if chest.remove_after_open:
+                world.remove_entity(chest)
+
+        world.flush_removals()
+        world.update_vfx()
+
+    def tick(self, asset_manager=None, run_ai=True):
+        """Advance the simulation by one fixed step of Config.SIM_TICK_MS.
+
+        AI timers count down first so an entity that decides to act
+        starts its animation in the same tick. `run_ai=False` keeps
+        animations going while the world is paused (inventory open).
+        """
+        if run_ai:
+            self.tick_ai()
+        self.tick_animations(asset_manager)
+
+    @profiler.timed("sim.ai")
+    def tick_ai(self):
+        """Count down real-time AI timers (one per tick) and let idle entities act."""
+        world = self.world
+        player = world.player
+        if not player:
+            return
+
+        # Independent Monster AI Handling
+        for monster in world.monsters:
+            if not monster.is_alive():
+                continue
+
+            is_monster_animating = getattr(monster, "is_moving", False) or monster.anim_state in ("move", "attack", "hit")
+            if is_monster_animating:
+                continue
+
+            # Initialize real-time action timer 
+            if not hasattr(monster, "rt_action_timer"):
+                monster.rt_action_timer = random.randint(*self.MONSTER_AI_TICKS)
+
+            monster.rt_action_timer -= 1
+
+            # Trigger monster AI decision if timer reaches zero
+            if monster.rt_action_timer <= 0:
+                monster.decide_and_act(world, player)
+                monster.rt_action_timer = random.randint(*self.MONSTER_AI_TICKS)
+
+        # Independent Assistant AI Handling
+        for assistant in world.assistants:
+            if not assistant.is_alive():
+                continue
+
+            # Skip if the assistant is currently performing an action
+            is_busy = getattr(assistant, "is_moving", False) or assistant.anim_state in ("move", "attack", "hit")
+            if is_busy:
+                continue
+
+            if not hasattr(assistant, "rt_action_timer"):
+                assistant.rt_action_timer = random.randint(*self.ASSISTANT_AI_TICKS)
+
+            assistant.rt_action_timer -= 1
+
+            # Assistant AI logic: Follow player or attack nearby monsters
+            if assistant.rt_action_timer <= 0:
+                assistant.decide_and_act(world, player)
+                assistant.rt_action_timer = random.randint(*self.ASSISTANT_AI_TICKS)
+
+    def step(self, n_turns=1, policy=None, max_ticks_per_turn=200):
+        """Play `n_turns` player turns without a display.
+
+        policy(engine) returns the action string for each turn (default:
+        random_policy). After each action the world is ticked until the
+        player's move or attack animation has played out, so hits land
+        and monsters keep acting in real time. Stops early on GAME_OVER,
+        WIN or a missing player. Returns the list of run_turn results.
+        """
+        policy = policy or random_policy
+        results = []
+
+        for _ in range(n_turns):
+            player = self.world.player
+            if player is None:
+                results.append("NO_PLAYER")
+                break
+
+            result = self.run_turn(policy(self))
+            results.append(result)
+            if result in ("GAME_OVER", "WIN"):
+                break
+
+            # Let the turn play out (at least one tick so the world moves on)
+            for _ in range(max_ticks_per_turn):
+                self.tick()
+                if not (player.is_moving or player.is_attacking):
+                    break
+
+        self.flush_journal()
+        return results
+
     def process_monster_turns(self):
         """
         Run one monster turn for all alive monsters after the player takes a turn.
@@ -536,19 +724,26 @@ class GameEngine:
             result = monster.decide_and_act(self.world, player)
             logs.append(result)
 
-            # Save each monster after it acts
-            if hasattr(self.db, "save_monster"):
-                self.db.save_monster(monster)
-
             # Stop early if player died during monster actions
             if player.dead:
                 break
 
+        # Monsters that acted are saved from the journal
+        self.flush_journal()
+
         # Save player state too, because monsters may have damaged the player
         self.db.save_player(self.session_id, player)
         return logs
 
+    @profiler.timed("turn")
     def run_turn(self, action):
+        try:
+            return self._play_turn(action)
+        finally:
+            # Whatever the outcome, persist what changed during the turn
+            self.flush_journal()
+
+    def _play_turn(self, action):
         result = self.handle_input(action)
 
         if result == "GAME_OVER":
@@ -584,17 +779,66 @@ class GameEngine:
                 self.level_up_sound.play()
                 self.world.player.increase_player_hp(50)
 
-        self._save_all_monsters()
         return "TURN_DONE"
 
+    def flush_journal(self):
+        """Write everything the world journal recorded since the last flush.
+
+        Discovered tiles go to the DB in a single batch and only monsters
+        or assistants that moved, changed hp or died are saved. The player
+        is saved explicitly by each action and is skipped here. Returns
+        False if any write failed; the drained changes are then lost, so
+        the next flush does a full RESYNC (every discovered tile and
+        every monster) instead.
+        """
+        journal = getattr(self.world, "journal", None)
+        if journal is None:
+            return True
+
+        ok = self._write_changes(journal.drain(self.JOURNAL_NAME))
+        if not ok:
+            journal.resync(self.JOURNAL_NAME)
+        return ok
+
+    def _write_changes(self, changes):
+        discovered = []
+        dirty = {}  # {id(entity): entity}, keeps first-seen order
+        for change in changes:
+            if change.kind is ChangeKind.RESYNC:
+                discovered = [t.id for t in self.world.tiles.values() if t.discovered]
+                saved = self._save_discoveries(discovered)
+                return self._save_all_monsters() and saved
+            if change.kind is ChangeKind.TILE_DISCOVERED:
+                discovered.append(change.target.id)
+            elif change.kind in self.PERSISTED_CHANGES:
+                if change.target is not self.world.player:
+                    dirty[id(change.target)] = change.target
+
+        ok = self._save_discoveries(discovered)
+        for entity in dirty.values():
+            ok = self._safe_save_monster(entity) and ok
+        return ok
+
+    def _save_discoveries(self, tile_ids):
+        if not tile_ids:
+            return True
+        try:
+            self.db.update_discoveries(self.session_id, tile_ids)
+            return True
+        except Exception:
+            return False
+
     def _save_all_monsters(self):
-        """Saves the state of every monster in the world to the DB
-        every game loop. This ensures that deaths are persistent.
+        """Saves the state of every monster in the world to the DB.
+        Used when the journal backlog overflowed and per-entity changes
+        were lost.
         """
+        ok = True
         for monster in self.world.monsters:
-            self._safe_save_monster(monster)
+            ok = self._safe_save_monster(monster) and ok
         for assistant in getattr(self.world, "assistants", []):
-            self._safe_save_monster(assistant)
+            ok = self._safe_save_monster(assistant) and ok
+        return ok
             
     def check_level_completed(self):
         current_level_castles = [
@@ -0,0 +1,97 @@
+"""World change journal — a typed record of what changed since last frame.
+
+Entities, the World and the GameEngine record a Change whenever game
+state mutates (an entity moves, loses hp, dies, a tile is discovered, a
+chest is opened...). Consumers such as the persistence flush in
+GameEngine, the renderer and the HUD subscribe under a name and drain
+only their own backlog, so each of them reacts to what changed instead
+of rescanning the whole World every frame.
+
+A subscriber that falls too far behind has its backlog replaced by a
+single RESYNC change, which means "rebuild from World directly".
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Optional
+
+
+class ChangeKind(Enum):
+    ENTITY_MOVED = "entity_moved"        # data = (prev_q, prev_r)
+    HP_CHANGED = "hp_changed"            # data = previous hp
+    ENTITY_DIED = "entity_died"
+    ENTITY_SPAWNED = "entity_spawned"
+    ENTITY_REMOVED = "entity_removed"
+    TILE_DISCOVERED = "tile_discovered"  # target = Tile
+    LEVEL_UNLOCKED = "level_unlocked"    # data = unlocked level
+    ITEM_DROPPED = "item_dropped"        # target = Item
+    ITEM_PICKED = "item_picked"          # target = Item
+    CHEST_OPENED = "chest_opened"        # target = Chest
+    RESYNC = "resync"                    # backlog overflowed
+
+
+@dataclass(frozen=True)
+class Change:
+    kind: ChangeKind
+    target: Any = None
+    q: Optional[int] = None
+    r: Optional[int] = None
+    data: Any = None
+
+
+class WorldJournal:
+    """Fan-out change queue with one independent backlog per subscriber.
+
+    Recording with no subscribers is a no-op, so a World used on its own
+    (tests, tools) pays nothing for the journal.
+    """
+
+    def __init__(self, max_backlog=4096):
+        self.max_backlog = max_backlog
+        self._queues = {}  # {subscriber name: deque[Change]}
+
+    def subscribe(self, name):
+        """Start collecting changes for `name`. Re-subscribing is a no-op."""
+        self._queues.setdefault(name, deque())
+
+    def unsubscribe(self, name):
+        self._queues.pop(name, None)
+
+    def is_subscribed(self, name):
+        return name in self._queues
+
+    def record(self, kind, target=None, q=None, r=None, data=None):
+        if not self._queues:
+            return
+
+        change = Change(kind, target, q, r, data)
+        for queue in self._queues.values():
+            # Already waiting on a full resync; individual changes are moot
+            if queue and queue[0].kind is ChangeKind.RESYNC:
+                continue
+            if len(queue) >= self.max_backlog:
+                queue.clear()
+                queue.append(Change(ChangeKind.RESYNC))
+                continue
+            queue.append(change)
+
+    def resync(self, name):
+        """Replace the backlog of `name` with a single RESYNC.
+
+        For a subscriber that drained changes but could not apply them:
+        its next drain rebuilds from the World instead.
+        """
+        queue = self._queues.get(name)
+        if queue is not None:
+            queue.clear()
+            queue.append(Change(ChangeKind.RESYNC))
+
+    def drain(self, name):
+        """Return and clear every change recorded for `name` so far."""
+        queue = self._queues.get(name)
+        if not queue:
+            return []
+        changes = list(queue)
+        queue.clear()
+        return changes
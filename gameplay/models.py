@@ -1,3 +1,6 @@
+from gameplay.journal import ChangeKind
+
+
 class Tile:
     def __init__(self, data):
         self.id = data.get("id")
@@ -26,11 +29,71 @@ class Tile:
 
 
 class Entity:
+    # Set by World when the entity joins a session. Position, hp and death
+    # are properties so every mutation is recorded, wherever it happens.
+    journal = None
+    # Renderer's FrameStrip for the current texture (visuals/asset_manager.py)
+    anim_frames = None
+
+    _q = 0
+    _r = 0
+    _hp = 0
+    _dead = False
+
     def __init__(self, q, r, texture=None):
         self.q = q
         self.r = r
         self.texture = texture
 
+    def _record(self, kind, data=None):
+        if self.journal is not None:
+            self.journal.record(kind, self, self._q, self._r, data)
+
+    @property
+    def q(self):
+        return self._q
+
+    @q.setter
+    def q(self, value):
+        if value != self._q:
+            prev = (self._q, self._r)
+            self._q = value
+            self._record(ChangeKind.ENTITY_MOVED, prev)
+
+    @property
+    def r(self):
+        return self._r
+
+    @r.setter
+    def r(self, value):
+        if value != self._r:
+            prev = (self._q, self._r)
+            self._r = value
+            self._record(ChangeKind.ENTITY_MOVED, prev)
+
+    @property
+    def hp(self):
+        return self._hp
+
+    @hp.setter
+    def hp(self, value):
+        if value != self._hp:
+            prev = self._hp
+            self._hp = value
+            self._record(ChangeKind.HP_CHANGED, prev)
+
+    @property
+    def dead(self):
+        return self._dead
+
+    @dead.setter
+    def dead(self, value):
+        value = bool(value)
+        if value != self._dead:
+            self._dead = value
+            if value:
+                self._record(ChangeKind.ENTITY_DIED)
+
     # Hex utilities
     @staticmethod
     def hex_distance(q1: int, r1: int, q2: int, r2: int) -> int:
@@ -44,8 +107,43 @@ class Entity:
         for dq, dr in self.HEX_DIRS:
             yield self.q + dq, self.r + dr
 
-class CircleExplosion:
+class PooledEffect:
+    """Mixin for short-lived VFX: finished effects are recycled, not reallocated.
+
+    Spawn with `Cls.acquire(...)` (same arguments as the constructor);
+    World.update_vfx hands dead effects back with `release`. Subclasses
+    put their initial state in `reset`.
+    """
+
+    MAX_POOL = 32
+
+    @classmethod
+    def acquire(cls, *args, **kwargs):
+        free = cls.__dict__.get("_free_list")
+        if free:
+            effect = free.pop()
+            effect.reset(*args, **kwargs)
+            return effect
+        return cls(*args, **kwargs)
+
+    @classmethod
+    def release(cls, effect):
+        if "_free_list" not in cls.__dict__:
+            cls._free_list = []
+        if len(cls._free_list) < cls.MAX_POOL:
+            effect.clear()
+            cls._free_list.append(effect)
+
+    def clear(self):
+        """Drop references held by a finished effect."""
+        pass
+
+
+class CircleExplosion(PooledEffect):
     def __init__(self, q: int, r: int, color: tuple, target_radius_hex: int):
+        self.reset(q, r, color, target_radius_hex)
+
+    def reset(self, q, r, color, target_radius_hex):
         self.q = q
         self.r = r
         self.color = color
@@ -54,10 +152,12 @@ class CircleExplosion:
         
         self.current_radius = 5.0
         self.expand_speed = self.max_pixel_radius / 15.0 
+        self.frame = 0  # updates so far; indexes the renderer's baked ring frames
         self.dead = False
 
     def update(self, *args):
         self.current_radius += self.expand_speed
+        self.frame += 1
         
         if self.current_radius >= self.max_pixel_radius:
             self.dead = True
@@ -76,8 +176,11 @@ class Castle:
         self.spawn_points = []
 
 
-class HealEffect:
+class HealEffect(PooledEffect):
     def __init__(self, target):
+        self.reset(target)
+
+    def reset(self, target):
         self.target = target
         self.anim_tick = 0
         self.frame_count = 11   
@@ -89,4 +192,7 @@ class HealEffect:
         self.lifetime -= 1
         self.anim_tick += 1
         if self.lifetime <= 0:
-            self.dead = True
\ No newline at end of file
+            self.dead = True
+
+    def clear(self):
+        self.target = None
\ No newline at end of file
@@ -911,7 +911,7 @@ class SlimeMonster(Monster):
 
         # Add explosion effect in the world
         if hasattr(world, "effects"):
-            effect = CircleExplosion(self.q, self.r, color, radius)
+            effect = CircleExplosion.acquire(self.q, self.r, color, radius)
             world.effects.append(effect) 
 
         # Explosion deals 1.5x base damage
@@ -971,7 +971,8 @@ class LinearProjectile(Monster):
         with open(json_path, "r") as f:
             data = json.load(f)
         
-        data["id"] = f"fly_proj_{id(self)}"
+        # Runtime-only entity: never saved, identified by its registry handle
+        data["id"] = None
         data["current_q"] = q
         data["current_r"] = r
         data["damage"] = damage 
@@ -1184,7 +1185,7 @@ class LinearShooterMonster(Monster):
                     projectile._cached_world = world
                     projectile._cached_player = player
                     
-                    world.monsters.append(projectile)
+                    world.add_monster(projectile)
                     
                     projectile._continue_fly()
 
@@ -1206,7 +1207,8 @@ class StumpSpawn(Monster):
         with open(json_path, "r") as f:
             data = json.load(f)
             
-        data["id"] = f"stump_spawn_{id(self)}"
+        # Runtime-only entity: never saved, identified by its registry handle
+        data["id"] = None
         data["current_q"] = q
         data["current_r"] = r
         data["damage"] = damage
@@ -1352,7 +1354,7 @@ class StumpMonster(Monster):
                     spawn = StumpSpawn(self.q, self.r, self.damage, self.level)
                     spawn._cached_world = world
                     spawn._cached_player = player
-                    world.monsters.append(spawn)
+                    world.add_monster(spawn)
                     
                     # Start the tracking loop
                     spawn._get_next_tracking_step()
@@ -1445,7 +1447,8 @@ class StoneMonster(Monster):
 
             # Use the original data template of the big stone monster
             baby_data = copy.deepcopy(self.original_data)
-            baby_data["id"] = f"small_{self.color}_stone_{id(self)}_{i}"
+            # Splits are runtime-only, identified by their registry handle
+            baby_data["id"] = None
             baby_data["current_q"] = q
             baby_data["current_r"] = r
 
@@ -1461,7 +1464,7 @@ class StoneMonster(Monster):
             small_rock.y_shift_override = -16 # type: ignore
             small_rock.invert_flip = True
 
-            world.monsters.append(small_rock)
+            world.add_monster(small_rock)
 
 
 class MonsterFactory:
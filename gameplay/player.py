@@ -341,7 +341,8 @@ class Player(Entity):
 
             self.poison_tick_timer += 1
 
-            # Since update_animation is called every 50ms (from game_window),
+            # update_animation runs once per simulation tick (Config.SIM_TICK_MS),
+            # so 20 ticks is about 1.2 seconds
             if self.poison_tick_timer >= 20:
                 self.take_poison_damage(self.poison_damage_per_turn)
                 self.poison_turns_remaining -= 1
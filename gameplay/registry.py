@@ -0,0 +1,179 @@
+"""Entity registry — O(1) add/remove with stable generational handles.
+
+World keeps monsters, assistants and chests here instead of in plain
+lists. Every registered object gets an integer `handle` that stays valid
+until the object is destroyed; once its slot is reused the old handle no
+longer resolves, so a stale reference can never pick up a different
+entity. Each kind is stored densely so iteration stays a tight list walk,
+and removal swaps the last element into the hole instead of shifting.
+
+Destruction is deferred: `destroy` only queues the handle and `flush`
+(called once per frame by the owner) does the actual removal, so callers
+can destroy entities while iterating a view.
+"""
+
+
+class EntityView:
+    """Read-only, live view over the dense storage of one entity kind."""
+
+    __slots__ = ("_items",)
+
+    def __init__(self, items):
+        self._items = items
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __contains__(self, entity):
+        return entity in self._items
+
+    def __repr__(self):
+        return f"EntityView({self._items!r})"
+
+
+class EntityRegistry:
+    """Generational handle table with dense per-kind storage."""
+
+    SLOT_BITS = 24
+    SLOT_MASK = (1 << SLOT_BITS) - 1
+
+    def __init__(self):
+        self._generations = []  # slot -> current generation
+        self._entities = []  # slot -> entity, or None when free
+        self._kinds = []  # slot -> kind name
+        self._dense_index = []  # slot -> position in its kind's dense list
+        self._free_slots = []
+
+        self._dense = {}  # kind -> [entity]
+        self._dense_slots = {}  # kind -> [slot], parallel to _dense[kind]
+        self._views = {}  # kind -> EntityView
+
+        self._pending = []  # handles queued by destroy()
+        self._pending_set = set()
+
+    # Handles
+    def _slot_of(self, handle):
+        """Return the slot for a live handle, or None if it is stale."""
+        if handle is None:
+            return None
+        slot = handle & self.SLOT_MASK
+        if slot >= len(self._entities) or self._entities[slot] is None:
+            return None
+        if self._generations[slot] != handle >> self.SLOT_BITS:
+            return None
+        return slot
+
+    def is_valid(self, handle):
+        return self._slot_of(handle) is not None
+
+    def get(self, handle):
+        slot = self._slot_of(handle)
+        return None if slot is None else self._entities[slot]
+
+    def kind_of(self, handle):
+        slot = self._slot_of(handle)
+        return None if slot is None else self._kinds[slot]
+
+    # Storage
+    def _storage(self, kind):
+        if kind not in self._dense:
+            self._dense[kind] = []
+            self._dense_slots[kind] = []
+            self._views[kind] = EntityView(self._dense[kind])
+        return self._dense[kind], self._dense_slots[kind]
+
+    def view(self, kind):
+        """Live read-only sequence of every entity of `kind`."""
+        self._storage(kind)
+        return self._views[kind]
+
+    def create(self, entity, kind):
+        """Register `entity` under `kind` and return its handle.
+
+        The handle is also stored on the entity as `entity.handle`.
+        """
+        dense, dense_slots = self._storage(kind)
+
+        if self._free_slots:
+            slot = self._free_slots.pop()
+        else:
+            slot = len(self._entities)
+            self._generations.append(0)
+            self._entities.append(None)
+            self._kinds.append(None)
+            self._dense_index.append(0)
+
+        self._entities[slot] = entity
+        self._kinds[slot] = kind
+        self._dense_index[slot] = len(dense)
+        dense.append(entity)
+        dense_slots.append(slot)
+
+        handle = (self._generations[slot] << self.SLOT_BITS) | slot
+        entity.handle = handle
+        return handle
+
+    def destroy(self, handle):
+        """Queue a handle for removal at the next flush.
+
+        Returns False if the handle is stale or already queued.
+        """
+        if not self.is_valid(handle) or handle in self._pending_set:
+            return False
+        self._pending.append(handle)
+        self._pending_set.add(handle)
+        return True
+
+    def flush(self):
+        """Remove everything queued by destroy(). Returns removed entities."""
+        removed = []
+        for handle in self._pending:
+            entity = self._remove_now(handle)
+            if entity is not None:
+                removed.append(entity)
+        self._pending.clear()
+        self._pending_set.clear()
+        return removed
+
+    def clear_kind(self, kind):
+        """Immediately remove every entity of `kind`."""
+        dense, dense_slots = self._storage(kind)
+        for slot in dense_slots:
+            self._release_slot(slot)
+        dense.clear()
+        dense_slots.clear()
+
+    def _remove_now(self, handle):
+        slot = self._slot_of(handle)
+        if slot is None:
+            return None
+
+        entity = self._entities[slot]
+        dense = self._dense[self._kinds[slot]]
+        dense_slots = self._dense_slots[self._kinds[slot]]
+
+        # Swap the last element into the hole, then drop the tail
+        index = self._dense_index[slot]
+        last = len(dense) - 1
+        if index != last:
+            dense[index] = dense[last]
+            dense_slots[index] = dense_slots[last]
+            self._dense_index[dense_slots[index]] = index
+        dense.pop()
+        dense_slots.pop()
+
+        self._release_slot(slot)
+        return entity
+
+    def _release_slot(self, slot):
+        self._entities[slot] = None
+        self._kinds[slot] = None
+        # Bumping the generation invalidates every outstanding handle
+        self._generations[slot] += 1
+        self._free_slots.append(slot)
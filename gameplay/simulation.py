@@ -0,0 +1,57 @@
+"""Headless support for GameEngine — game logic without a display.
+
+Entity animations do real work: attack damage lands on a hit frame,
+tile moves finish when move_progress reaches 1.0 and death animations
+decide when loot drops. All of that only needs frame counts, which the
+renderer's AssetManager reads from the definition JSON. AnimationClock
+reads the same metadata without loading any image, so the engine can be
+ticked from bots, soak tests and balancing scripts at full speed.
+"""
+
+import random
+
+from audio.audio_manager import SilentSound  # noqa: F401
+from core.asset_manifest import load_manifest
+from core.config import Config
+
+
+class AnimationClock:
+    """Logic-only replacement for AssetManager in update_animation calls.
+
+    Exposes `anim_metadata` with the same keys as AssetManager (texture
+    and (texture, row)) but never touches pygame.
+    """
+
+    def __init__(self):
+        self.anim_metadata = {}
+        self._load_metadata()
+
+    def _load_metadata(self):
+        manifest = load_manifest()
+        for category in Config.DIRS:
+            for data in manifest.definitions(category).values():
+                for anim_data in data.get("animations", {}).values():
+                    tex = anim_data.get("texture")
+                    if not tex:
+                        continue
+                    row = anim_data.get("row", 0)
+                    meta = {"count": anim_data.get("count", 1), "row": row}
+                    self.anim_metadata[(tex, row)] = meta
+                    self.anim_metadata.setdefault(tex, meta)
+
+
+MOVE_ACTIONS = (
+    "MOVE_NORTH",
+    "MOVE_SOUTH",
+    "MOVE_WEST",
+    "MOVE_EAST",
+    "MOVE_SW",
+    "MOVE_NE",
+)
+
+
+def random_policy(engine):
+    """Default bot for GameEngine.step: wander, attack and loot at random."""
+    if random.random() < 0.15:
+        return "INTERACT"
+    return random.choice(MOVE_ACTIONS)
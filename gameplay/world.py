@@ -10,6 +10,8 @@ and engine read from each frame.
 from core.config import Config
 from core.hexmath import HexMath
 from gameplay.models import Tile, Castle
+from gameplay.journal import WorldJournal, ChangeKind
+from gameplay.registry import EntityRegistry
 from gameplay.player import Player
 from gameplay.monster import MonsterFactory
 from gameplay.item import Item
@@ -27,23 +29,31 @@ class World:
 
     Attributes:
         tiles: dict keyed by (q, r) axial coords.
-        monsters: list of Monster instances (alive and dead).
+        monsters: read-only view of Monster instances (alive and dead).
+        assistants: read-only view of Assistant instances.
         ground_items: list of Item instances lying on tiles.
-        chests: list of Chest instances, each blocking movement.
+        chests: read-only view of Chest instances, each blocking movement.
+        registry: EntityRegistry owning monsters, assistants and chests.
+            Add through add_monster/add_chest/spawn_entities and remove
+            through remove_entity; removals apply on flush_removals.
         player: the single Player for this session, or None if the save
             is corrupt.
         resource_locks: ResourceLockManager guarding pickup/use races.
         current_level: the highest level the player has unlocked.
+        journal: WorldJournal of changes since each consumer last drained.
     """
 
+    # Monster rows with these names are built as assistants
+    COMBAT_ASSISTANTS = ("warrior_assistant.json", "warrior_assistant", "archer_assistant.json", "archer_assistant")
+    HEAL_ASSISTANTS = ("monk_assistant.json", "monk_assistant")
+
     def __init__(self, db, session_id):
         self.db = db
         self.session_id = session_id
+        self.journal = WorldJournal()
+        self.registry = EntityRegistry()
         self.tiles = {}  # {(q,r): Tile}
-        self.monsters = []
-        self.assistants = []
         self.ground_items = []
-        self.chests = []
         self.castles = []
         self.player = None
        # self.current_level = 1
@@ -111,25 +121,55 @@ class World:
         castle.is_spawned = True
         self.db.update_session_castle(self.session_id, castle.id, is_spawned=1)
         
+        rows = []
         for sp in castle.spawn_points:
-            # Add to db
             tile = self.get_tile(sp["q"], sp["r"])
             lvl = tile.level if tile else castle.level
-            
-            self.db.add_monster(
-                sp["monster_name"], 
-                sp["q"], sp["r"], 
-                sp["health"], sp["damage"], 
-                lvl
-            )
-            
-            # Add monster doesnt take the castle ID so we have tp manually get it and set it
-            last_id = self.db.cursor.lastrowid
-            self.db.cursor.execute("UPDATE monsters SET castle_id=? WHERE id=?", (castle.id, last_id))
-            self.db.conn.commit()
-
-        # Reload to make sure they are taken into consideration    
-        self.load_monsters()
+            rows.append({
+                "name": sp["monster_name"],
+                "q": sp["q"], "r": sp["r"],
+                "health": sp["health"], "damage": sp["damage"],
+                "level": lvl,
+                "castle_id": castle.id,
+            })
+
+        self.spawn_entities(rows)
+
+    def spawn_entities(self, rows):
+        """Insert new monster/assistant rows and add only those to the world.
+
+        rows: dicts accepted by DatabaseManager.add_monsters. All rows are
+        written in one transaction; existing entities are left untouched.
+        Returns the newly built entities.
+        """
+        if not rows:
+            return []
+
+        new_ids = self.db.add_monsters(rows)
+        spawned = []
+        for data in self.db.load_monsters(ids=new_ids):
+            entity = self._build_entity(data)
+            self._attach(entity)
+            self.registry.create(entity, self._kind_of(entity))
+            spawned.append(entity)
+        return spawned
+
+    @staticmethod
+    def _kind_of(entity):
+        if isinstance(entity, Assistant):
+            return "assistant"
+        if isinstance(entity, Chest):
+            return "chest"
+        return "monster"
+
+    def _build_entity(self, data):
+        """Instantiate the right class for a monster row."""
+        name = data.get("name", "")
+        if name in self.COMBAT_ASSISTANTS:
+            return Assistant(data)
+        if name in self.HEAL_ASSISTANTS:
+            return MonkAssistant(data)
+        return MonsterFactory.create_monster(data)
 
     def load_world(self):
         # Use DB abstraction
@@ -152,48 +192,93 @@ class World:
         p_data = self.db.get_player_state(self.session_id)
         if p_data:
             self.player = Player(p_data)
+            self.player.journal = self.journal
 
     def load_monsters(self):
         """Load all alive monsters from DB and equip their saved gear."""
         rows = self.db.load_monsters()
 
-        COMBAT_ASSISTANTS = ["warrior_assistant.json", "warrior_assistant", "archer_assistant.json", "archer_assistant"]
-        HEAL_ASSISTANTS = ["monk_assistant.json", "monk_assistant"]
-        
         # Extract currently existing entities in memory
-        existing_monsters = {m.id: m for m in self.monsters if getattr(m, 'id', None) is not None}
-        existing_assistants = {a.id: a for a in self.assistants if getattr(a, 'id', None) is not None}
+        existing = {
+            e.id: e
+            for e in (*self.monsters, *self.assistants)
+            if getattr(e, "id", None) is not None
+        }
 
-        # Clear the old lists in preparation for reloading from the database.
-        self.monsters = []
-        self.assistants = []
+        # Clear the old entries in preparation for reloading from the database.
+        self.registry.clear_kind("monster")
+        self.registry.clear_kind("assistant")
 
         for data in rows:
-            name = data.get("name", "")
-            entity_id = data.get("id")
-            
-            if name in COMBAT_ASSISTANTS:
-                # If this assistant is already in memory, reuse the existing object.
-                if entity_id in existing_assistants:
-                    self.assistants.append(existing_assistants[entity_id])
-                else:
-                    entity = Assistant(data)
-                    self.assistants.append(entity)
-            elif name in HEAL_ASSISTANTS:
-                if entity_id in existing_assistants:
-                    self.assistants.append(existing_assistants[entity_id])
-                else:
-                    entity = MonkAssistant(data) 
-                    self.assistants.append(entity)
-
-            else:
-                # If this monster is already in memory, reuse the existing object.
-                if entity_id in existing_monsters:
-                    self.monsters.append(existing_monsters[entity_id])
-                else:
-                    # If it's a newly spawned monster (e.g., from a castle), create it.
-                    entity = MonsterFactory.create_monster(data)
-                    self.monsters.append(entity)
+            # If this entity is already in memory, reuse the existing object.
+            entity = existing.get(data.get("id"))
+            if entity is None:
+                entity = self._build_entity(data)
+                self._attach(entity)
+            self.registry.create(entity, self._kind_of(entity))
+
+    # Per-kind views over the registry. Assigning a list replaces that kind.
+    @property
+    def monsters(self):
+        return self.registry.view("monster")
+
+    @monsters.setter
+    def monsters(self, entities):
+        self._replace_kind("monster", entities)
+
+    @property
+    def assistants(self):
+        return self.registry.view("assistant")
+
+    @assistants.setter
+    def assistants(self, entities):
+        self._replace_kind("assistant", entities)
+
+    @property
+    def chests(self):
+        return self.registry.view("chest")
+
+    @chests.setter
+    def chests(self, entities):
+        self._replace_kind("chest", entities)
+
+    def _replace_kind(self, kind, entities):
+        self.registry.clear_kind(kind)
+        for entity in entities:
+            self.registry.create(entity, kind)
+
+    def _attach(self, entity):
+        """Route an entity's mutations into the journal and announce it."""
+        entity.journal = self.journal
+        self.journal.record(ChangeKind.ENTITY_SPAWNED, entity, entity.q, entity.r)
+
+    def add_monster(self, monster):
+        """Add a monster spawned at runtime (projectiles, minions, splits)."""
+        self._attach(monster)
+        return self.registry.create(monster, self._kind_of(monster))
+
+    def add_chest(self, chest):
+        handle = self.registry.create(chest, "chest")
+        self.journal.record(ChangeKind.ENTITY_SPAWNED, chest, chest.q, chest.r)
+        return handle
+
+    def remove_entity(self, entity):
+        """Queue a monster, assistant or chest for removal.
+
+        The entity stays in its view until flush_removals() runs, so this
+        is safe to call while iterating. Returns False if it was not in
+        the world (or is already queued).
+        """
+        return self.registry.destroy(getattr(entity, "handle", None))
+
+    def flush_removals(self):
+        """Apply queued removals; called once per frame by the UI loop."""
+        removed = self.registry.flush()
+        for entity in removed:
+            self.journal.record(
+                ChangeKind.ENTITY_REMOVED, entity, entity.q, entity.r
+            )
+        return removed
 
     def load_ground_items(self):
         """Load all items placed on the ground."""
@@ -222,11 +307,11 @@ class World:
                     for item_data in data.get("items", []):
                         items.append(Item(item_data))
                     
-                    self.chests.append(Chest(
+                    self.registry.create(Chest(
                         data["q"], data["r"],
                         data.get("chest_type", "brown_chest"),
                         items=items
-                    ))
+                    ), "chest")
             except Exception as e:
                 print(f"load_chests failed: {e}")
 
@@ -255,7 +340,7 @@ class World:
         # Create Item objects using the database metadata
         bread_items = [Item(bread_data) for _ in range(2)]
 
-        self.chests.append(Chest(
+        self.add_chest(Chest(
             self.player.q + 1, self.player.r, "brown_chest",
             items=bread_items,
         ))
@@ -285,26 +370,25 @@ class World:
         return self.tiles.get((q, r))
 
     def update_fog_of_war(self):
-         """Reveals tiles around the player."""
+         """Reveals tiles around the player.
+
+         Discoveries are only recorded in the journal; GameEngine writes
+         them to the DB in one batch when it flushes.
+         """
          if not self.player:
              return
 
          pq, pr = self.player.q, self.player.r
          radius = Config.VISIBLE_RADIUS
 
-         for q in range(-radius, radius + 1):
-             for r in range(-radius, radius + 1):
-                 if abs(q + r) > radius:
-                     continue
-
-                 target_q, target_r = pq + q, pr + r
-                 dist = HexMath.distance(pq, pr, target_q, target_r)
-
-                 if dist <= radius:
-                     tile = self.get_tile(target_q, target_r)
-                     if tile and not tile.discovered:
-                         tile.discovered = True
-                         self.db.update_discovery(self.session_id, tile.id)
+         # Precomputed offsets of every hex within the radius: no distance checks
+         for dq, dr in HexMath.get_range_offsets(radius):
+             tile = self.get_tile(pq + dq, pr + dr)
+             if tile and not tile.discovered:
+                 tile.discovered = True
+                 self.journal.record(
+                     ChangeKind.TILE_DISCOVERED, tile, tile.q, tile.r
+                 )
 
     def get_max_level(self):
         if not self.tiles:
@@ -343,6 +427,7 @@ class World:
             tile.unlocked = True
 
         self.current_level = next_level
+        self.journal.record(ChangeKind.LEVEL_UNLOCKED, data=next_level)
         print(f"Unlocked level {self.current_level}")
         return True
 
@@ -387,8 +472,13 @@ class World:
 
     # Update the explosion effect
     def update_vfx(self):
-        for effect in self.effects[:]: 
+        """Advance every effect; finished ones go back to their class pool."""
+        alive = []
+        for effect in self.effects:
             effect.update()
-            if effect.dead:
-                self.effects.remove(effect)
+            if not effect.dead:
+                alive.append(effect)
+            elif hasattr(type(effect), "release"):
+                type(effect).release(effect)
+        self.effects[:] = alive
     
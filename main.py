@@ -3,6 +3,12 @@ import pygame
 
 
 from ui.base_screen import Screen
+from ui.profiler_overlay import ProfilerOverlay
+from ui.resources import ResourceRegistry
+from core.config import Config
+from core.profiler import profiler
+from visuals.preloader import preloader
+from audio.audio_manager import audio
 import os
 
 
@@ -62,7 +68,6 @@ class ScreenManager:
         # used for welcome screen to switch after 5 seconds
         self.start_time = pygame.time.get_ticks()
         
-        self.current_music = None
         from core.config import Config
         import os
         import platform
@@ -96,10 +101,19 @@ class ScreenManager:
         
         self.clock = pygame.time.Clock()
         self.running = True
+        # Next present must flip the whole window (first frame, screen switch)
+        self.full_redraw = True
+        # F2: per-phase frame timings (see core/profiler.py)
+        self.profiler_overlay = ProfilerOverlay()
         #game window specific variables
         self.selected_slot = None
         self.selected_skin = None
 
+        # Fonts, asset managers... shared by the screens (see ui/resources.py)
+        self.resources = ResourceRegistry()
+        # Pooled screens (Screen.pooled) by name, reused on every later switch
+        self.screen_pool = {}
+
        
         self.available_screens = {
             "welcome": screen1.Welcome,
@@ -114,8 +128,8 @@ class ScreenManager:
 
         #start screen
         self.current_screen = self.available_screens["welcome"](self)
-        self.play_music("start.mp3")
-        self.current_music = "start.mp3"
+        audio.play_screen_music("welcome")
+        audio.preload("level_up.mp3")
 
         # part of singletone patern
         # want to avoid reinitialization 
@@ -130,50 +144,75 @@ class ScreenManager:
             except Exception as e:
                 print(f"Issue during screen cleanup:\n {e}")
 
-        self.current_screen = self.available_screens[new_screen](self)
+        screen = self.screen_pool.get(new_screen)
+        if screen is None:
+            screen_class = self.available_screens[new_screen]
+            screen = screen_class(self)
+            if getattr(screen_class, "pooled", False):
+                self.screen_pool[new_screen] = screen
+        else:
+            screen.on_enter()
+        self.current_screen = screen
+        self.full_redraw = True
 
-        
-        if new_screen == "main_menu" :
-            self.play_music("start.mp3")
-        elif new_screen == "game_window":
-            self.play_music("game.mp3")
-        elif new_screen == "winner":
-            self.play_music("winner.mp3", loops=0)
-        elif new_screen == "game_over":
-            self.play_music("game_over.mp3", loops=0) 
-        
+        # Tracks per screen live in audio/audio_manager.py (SCREEN_MUSIC)
+        audio.play_screen_music(new_screen)
 
     def run(self):
         while self.running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                    # Removed screen resize event handler
-                else:
-                    self.current_screen.handle_event(event)
-
-            self.current_screen.draw()
-            pygame.display.flip()  # Update the full display surface to the screen
+            with profiler.phase("events"):
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        self.running = False
+                        # Removed screen resize event handler
+                    elif event.type == pygame.KEYDOWN and event.key == pygame.K_F2:
+                        profiler.toggle()
+                        self.full_redraw = True
+                    else:
+                        self.current_screen.handle_event(event)
+
+            # Finish a slice of background-decoded images (see visuals/preloader.py)
+            if preloader.active:
+                with profiler.phase("preload"):
+                    preloader.step()
+
+            with profiler.phase("draw"):
+                self.current_screen.draw()
+            if profiler.enabled:
+                self.profiler_overlay.draw(self.screen)
+                self.full_redraw = True
+            with profiler.phase("present"):
+                self.present()
+            profiler.end_frame()
            
-            self.clock.tick(60)  # Limit to 60 FPS
+            # Limit the render rate; GameWindow advances the world in fixed
+            # Config.SIM_TICK_MS steps, so the frame rate doesn't change game speed
+            self.clock.tick(Config.FPS)
 
+        path = profiler.export_csv()
+        if path:
+            print(f"Frame profile written to {path}")
         pygame.quit()
         
+    def present(self):
+        """Push the frame to the window: only the dirty rects the screen reports,
+        or the full display surface when it reports None (camera moved, overlay
+        opened, new screen)."""
+        rects = None
+        if not self.full_redraw and hasattr(self.current_screen, "dirty_rects"):
+            rects = self.current_screen.dirty_rects()
+        self.full_redraw = False
+
+        if rects is None:
+            pygame.display.flip()  # Update the full display surface to the screen
+        elif rects:
+            pygame.display.update(rects)
+
     def play_music(self, filename, loops=-1, volume=0.5):
-        if self.current_music == filename:
-            return
-        try:
-            path = os.path.join("assets", "music", filename)
-            pygame.mixer.music.load(path)
-            pygame.mixer.music.set_volume(volume)
-            pygame.mixer.music.play(loops)
-            self.current_music = filename
-        except pygame.error as e:
-            print(f"Could not play music {filename}: {e}")
+        audio.play_music(filename, loops=loops, volume=volume)
 
     def stop_music(self):
-        pygame.mixer.music.stop()
-        self.current_music = None
+        audio.stop_music()
 
 if __name__ == "__main__":
     manager = ScreenManager()
@@ -0,0 +1,72 @@
+import os
+
+import pygame
+import pytest
+
+from visuals.asset_bundle import AssetBundle, bundle_key, pack
+
+
+def _make_assets(tmp_path):
+    folder = tmp_path / "assets" / "sub"
+    folder.mkdir(parents=True)
+    images = {}
+    for name, color, size in (("a.png", (255, 0, 0, 255), (3, 5)),
+                              ("b.png", (0, 128, 255, 100), (7, 2))):
+        surf = pygame.Surface(size, pygame.SRCALPHA)
+        surf.fill(color)
+        path = folder / name
+        pygame.image.save(surf, str(path))
+        images[str(path)] = (color, size)
+    (folder / "notes.txt").write_text("not an image")
+    return images
+
+
+@pytest.mark.parametrize("raw", [False, True])
+def test_pack_and_load_round_trip(tmp_path, raw):
+    images = _make_assets(tmp_path)
+    out = str(tmp_path / "assets.bundle")
+
+    assert pack(str(tmp_path / "assets"), out, raw=raw) == 2
+
+    bundle = AssetBundle(out)
+    assert len(bundle) == 2
+    for path, (color, size) in images.items():
+        assert path in bundle
+        entry = bundle.info(path)
+        assert (entry["w"], entry["h"]) == size
+        assert entry["format"] == ("raw" if raw else "png")
+        assert isinstance(bundle.data(path), memoryview)
+
+        image = bundle.load(path)
+        assert image.get_size() == size
+        assert tuple(image.get_at((1, 1))) == color
+    assert str(tmp_path / "assets" / "sub" / "notes.txt") not in bundle
+
+
+def test_changed_loose_file_is_stale(tmp_path):
+    images = _make_assets(tmp_path)
+    out = str(tmp_path / "assets.bundle")
+    pack(str(tmp_path / "assets"), out)
+    bundle = AssetBundle(out)
+    first, second = sorted(images)
+
+    assert not bundle.is_stale(first)
+    surf = pygame.Surface((4, 4), pygame.SRCALPHA)
+    pygame.image.save(surf, first)
+    os.utime(first, ns=(1, 1))
+    assert bundle.is_stale(first)
+    assert not bundle.is_stale(second)
+
+    os.remove(second)  # no loose file: the packed copy is all there is
+    assert not bundle.is_stale(second)
+
+
+def test_bundle_key_is_root_relative():
+    assert bundle_key("assets/x.png") == "assets/x.png"
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "junk.bundle"
+    path.write_bytes(b"NOPE" + bytes(12))
+    with pytest.raises(ValueError):
+        AssetBundle(str(path))
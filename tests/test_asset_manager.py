@@ -41,5 +41,95 @@ class TestAssetManagerSmoke(unittest.TestCase):
         surf2 = self.am.get_image("non_existing.png")
         self.assertEqual(surf1, surf2)
 
+    def _first_anim(self):
+        """An animation sheet that loads (convert_alpha needs a display)."""
+        if pygame.display.get_surface() is None:
+            pygame.display.set_mode((1, 1))
+        return next(
+            (k, m) for k, m in self.am.anim_metadata.items()
+            if isinstance(k, str) and self.am.get_anim_frame(k, 0) is not None
+        )
+
+    def test_anim_frames_wrap_to_one_cache_entry(self):
+        """A growing animation counter must not add new cache entries."""
+        tex, meta = self._first_anim()
+        first = self.am.get_anim_frame(tex, 0)
+        entries = len(self.am.cache)
+        again = self.am.get_anim_frame(tex, meta["count"] * 50)
+        self.assertIs(first, again)
+        self.assertEqual(len(self.am.cache), entries)
+
+    def test_variants_are_cached_by_asset_key(self):
+        """Tinted/flipped variants are built once and differ from the base frame."""
+        tex, _ = self._first_anim()
+        base = self.am.get_anim_frame(tex, 0)
+        flash = self.am.get_variant(tex, 0, (255, 50, 50), True)
+        self.assertIsNot(flash, base)
+        self.assertIs(self.am.get_variant(tex, 0, (255, 50, 50), True), flash)
+        self.assertIs(self.am.get_variant(tex, 0), base)
+
+    def test_prebaked_entity_variants_need_no_allocation(self):
+        """After prebaking, every combat variant is a cache hit and pinned."""
+        self._first_anim()
+        am = AssetManager(pixel_scale=1 / 3)  # small art: the whole prebake fits
+        self.assertGreater(am.prebake_entity_variants(), 0)
+        tex = next(t for t in am.entity_textures if am.get_anim_frame(t, 0) is not None)
+
+        misses = am.cache.misses
+        for flash in (None,) + AssetManager.FLASH_COLORS:
+            for flipped in (False, True):
+                self.assertIsNotNone(am.get_variant(tex, 0, flash, flipped))
+        self.assertEqual(am.cache.misses, misses)
+        self.assertGreater(am.cache.stats()["pinned"], 0)
+
+    def test_prebake_pins_only_whole_strips_within_half_the_budget(self):
+        """Pinned memory stays under half the budget; pinned strips are complete."""
+        self._first_anim()
+        am = AssetManager(pixel_scale=1 / 3)
+        am.cache.budget_bytes = 4 * 1024 * 1024
+        am.prebake_entity_variants()
+
+        self.assertFalse(am.prebaking)
+        self.assertGreater(am.cache.stats()["pinned"], 0)
+        self.assertLessEqual(am.cache.pinned_bytes, am.cache.budget_bytes // 2)
+        for key in list(am.cache._pinned):
+            strip = am.cache.get(key)
+            for frames in strip.variants.values():
+                self.assertNotIn(None, frames)
+
+    def test_prebake_runs_in_time_slices(self):
+        """A spent slice bakes nothing; later steps pick up where it stopped."""
+        self._first_anim()
+        am = AssetManager(pixel_scale=1 / 3)
+        am.start_prebake()
+        self.assertEqual(am.prebake_step(0), 0)
+        self.assertTrue(am.prebaking)
+        while am.prebaking:
+            am.prebake_step()
+        self.assertGreater(am.cache.stats()["pinned"], 0)
+
+    def test_sheet_is_sliced_into_one_strip(self):
+        """The first touch slices every frame; frames are then list lookups."""
+        tex, meta = self._first_anim()
+        strip = self.am.get_frames(tex)
+        self.assertEqual(strip.count, max(1, meta["count"]))
+        self.assertIs(self.am.get_frames(tex), strip)
+        self.assertIs(strip.frame(strip.count + 1), strip.frames[1 % strip.count])
+        self.assertIs(self.am.get_anim_frame(tex, 1), strip.frames[1 % strip.count])
+
+    def test_strip_variants_are_charged_to_the_cache(self):
+        """Variants built from a strip grow its sprite cache entry."""
+        tex, _ = self._first_anim()
+        am = AssetManager(pixel_scale=1 / 3)
+        strip = am.get_frames(tex)
+        before = am.cache.bytes
+        flipped = strip.variant(0, None, True)
+        self.assertIs(strip.variant(strip.count, None, True), flipped)
+        self.assertEqual(am.cache.bytes, before + am.cache.surface_bytes(flipped))
+
+    def test_definitions_declare_mini_scales(self):
+        """Stone monsters split into half-size copies, so 0.5 is prebaked."""
+        self.assertIn(0.5, self.am.entity_textures.get("Golem_1_idle.png", ()))
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,91 @@
+import json
+import os
+
+from core.asset_manifest import AssetManifest
+
+
+def _write(path, data, mtime_ns=None):
+    with open(path, "w") as f:
+        json.dump(data, f)
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def _manifest(tmp_path):
+    return AssetManifest(
+        dirs={"tile": str(tmp_path / "tiles")},
+        path=str(tmp_path / "cache" / "manifest.json"),
+    )
+
+
+def _setup(tmp_path):
+    folder = tmp_path / "tiles"
+    folder.mkdir()
+    _write(folder / "grass.json", {"name": "grass"})
+    _write(folder / "sand.json", {"name": "sand"})
+    return folder
+
+
+def test_second_load_reads_cache_only(tmp_path):
+    _setup(tmp_path)
+
+    first = _manifest(tmp_path).refresh()
+    assert first.reparsed == 2
+    assert first.get("tile", "grass") == {"name": "grass"}
+
+    second = _manifest(tmp_path).refresh()
+    assert second.reparsed == 0
+    assert set(second.definitions("tile")) == {"grass.json", "sand.json"}
+
+
+def test_edited_file_is_reparsed_and_compiled_rebuilt(tmp_path):
+    folder = _setup(tmp_path)
+    builds = []
+
+    def build(manifest):
+        builds.append(1)
+        return sorted(d["name"] for d in manifest.definitions("tile").values())
+
+    manifest = _manifest(tmp_path).refresh()
+    assert manifest.compiled("names", build) == ["grass", "sand"]
+    assert _manifest(tmp_path).refresh().compiled("names", build) == ["grass", "sand"]
+    assert len(builds) == 1
+
+    _write(folder / "sand.json", {"name": "dune"}, mtime_ns=10**18)
+    manifest = _manifest(tmp_path).refresh()
+    assert manifest.reparsed == 1
+    assert manifest.compiled("names", build) == ["dune", "grass"]
+    assert len(builds) == 2
+
+
+def test_touched_file_keeps_parsed_data(tmp_path):
+    folder = _setup(tmp_path)
+    _manifest(tmp_path).refresh()
+
+    os.utime(folder / "grass.json", ns=(10**18, 10**18))
+    manifest = _manifest(tmp_path).refresh()
+    assert manifest.reparsed == 0
+    assert manifest.get("tile", "grass") == {"name": "grass"}
+
+
+def test_added_and_removed_files(tmp_path):
+    folder = _setup(tmp_path)
+    manifest = _manifest(tmp_path).refresh()
+
+    os.remove(folder / "sand.json")
+    _write(folder / "water.json", {"name": "water"})
+    os.utime(folder, ns=(10**18, 10**18))
+    manifest.refresh()
+
+    assert manifest.reparsed == 1
+    assert set(manifest.definitions("tile")) == {"grass.json", "water.json"}
+    assert manifest.get("tile", "sand") is None
+
+
+def test_broken_file_is_skipped(tmp_path, capsys):
+    folder = _setup(tmp_path)
+    (folder / "bad.json").write_text("{not json")
+
+    manifest = _manifest(tmp_path).refresh()
+    assert "bad.json" not in manifest.definitions("tile")
+    assert "bad.json" in capsys.readouterr().out
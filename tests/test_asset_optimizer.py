@@ -0,0 +1,52 @@
+import pygame
+
+from visuals.asset_optimizer import downscale_factor, optimize_sheet
+
+
+def _sheet():
+    """4 columns x 3 rows of 16x16 cells, a 4x6 opaque block centred in
+    each used cell; row 1 is unused and column 3 is past every count."""
+    sheet = pygame.Surface((64, 48), pygame.SRCALPHA)
+    for row in (0, 2):
+        for col in range(3):
+            sheet.fill((row * 50, col * 60, 200, 255), (col * 16 + 6, row * 16 + 5, 4, 6))
+    sheet.fill((255, 255, 255, 255), (3 * 16, 0, 16, 16))  # unused frame
+    return sheet
+
+
+def test_sheet_is_packed_and_trimmed():
+    anims = [
+        {"fw": 16, "fh": 16, "count": 3, "row": 0},
+        {"fw": 16, "fh": 16, "count": 2, "row": 2},
+    ]
+    packed, rows, trim, size = optimize_sheet(_sheet(), anims)
+
+    assert rows == {0: 0, 2: 1}
+    assert trim == (6, 5)
+    assert size == (4, 6)
+    # 3 columns (longest animation) x 2 used rows of trimmed cells
+    assert packed.get_size() == (12, 12)
+    assert tuple(packed.get_at((1 * 4, 0))) == (0, 60, 200, 255)
+    assert tuple(packed.get_at((0, 6))) == (100, 0, 200, 255)
+
+
+def test_downsampled_cells_stay_whole():
+    anims = [{"fw": 16, "fh": 16, "count": 3, "row": 0}]
+    packed, _, trim, size = optimize_sheet(_sheet(), anims, k=2)
+
+    assert trim == (6, 5)
+    assert size == (2, 3)
+    assert packed.get_size() == (6, 3)
+
+
+def test_conflicting_frame_sizes_are_skipped():
+    anims = [{"fw": 16, "fh": 16}, {"fw": 8, "fh": 16}]
+    assert optimize_sheet(_sheet(), anims) is None
+
+
+def test_downscale_factor():
+    data = {"scale": 0.3, "animations": {"idle": {"texture": "a.png", "fw": 64, "fh": 64}}}
+    assert downscale_factor(data, True) == 2  # 3 does not divide 64
+    assert downscale_factor(data, False) == 1  # sheet shared
+    assert downscale_factor(dict(data, scale=1.0), True) == 1  # drawn at least 1:1
+    assert downscale_factor(dict(data, texture_file="b.png"), True) == 1
@@ -0,0 +1,44 @@
+import pygame
+
+from visuals.atlas import TextureAtlas
+
+
+def _image(w, h, color):
+    surf = pygame.Surface((w, h), pygame.SRCALPHA)
+    surf.fill(color)
+    return surf
+
+
+def test_regions_do_not_overlap():
+    atlas = TextureAtlas(page_size=64)
+    atlas.add_many({i: _image(10 + i, 12 + (i % 3) * 5, (i, 0, 0, 255)) for i in range(12)})
+
+    by_page = {}
+    for i in range(12):
+        page, area = atlas.get(i)
+        assert page.get_rect().contains(area)
+        for other in by_page.setdefault(id(page), []):
+            assert not area.colliderect(other)
+        by_page[id(page)].append(area)
+    assert len(atlas.pages) > 1
+
+
+def test_pixels_and_alpha_are_copied_exactly():
+    atlas = TextureAtlas(page_size=64)
+    image = _image(4, 4, (200, 100, 50, 128))
+    page, area = atlas.add("half", image)
+
+    assert tuple(page.get_at(area.topleft)) == (200, 100, 50, 128)
+    assert atlas.add("half", image) == (page, area)
+    assert "half" in atlas and len(atlas) == 1
+
+
+def test_oversized_image_gets_its_own_page():
+    atlas = TextureAtlas(page_size=32)
+    atlas.add("small", _image(8, 8, (1, 2, 3, 255)))
+    page, area = atlas.add("big", _image(40, 20, (1, 2, 3, 255)))
+
+    assert page.get_size() == (40, 20)
+    assert area.topleft == (0, 0)
+    atlas.add("small2", _image(8, 8, (1, 2, 3, 255)))
+    assert atlas.get("small2")[0] is atlas.get("small")[0]
@@ -0,0 +1,86 @@
+import time
+
+import pygame
+
+from audio.audio_manager import AudioManager, SilentSound
+
+
+class FakeSound:
+    loads = 0
+
+    def __init__(self, path):
+        FakeSound.loads += 1
+        self.playing = 0
+        self.volume = None
+
+    def set_volume(self, volume):
+        self.volume = volume
+
+    def get_num_channels(self):
+        return self.playing
+
+    def play(self):
+        self.playing += 1
+        return "channel"
+
+
+def _manager(monkeypatch, tmp_path, enabled=True):
+    FakeSound.loads = 0
+    monkeypatch.setattr(pygame.mixer, "Sound", FakeSound)
+    monkeypatch.setattr(pygame.mixer, "get_init", lambda: (44100, -16, 2) if enabled else None)
+    monkeypatch.setattr(pygame.mixer, "set_num_channels", lambda n: None)
+    return AudioManager(str(tmp_path))
+
+
+def test_sounds_are_decoded_once(monkeypatch, tmp_path):
+    audio = _manager(monkeypatch, tmp_path)
+
+    first = audio.sound("hit.ogg", volume=0.6)
+    assert audio.sound("hit.ogg") is first
+    assert FakeSound.loads == 1
+    assert first.volume == 0.6
+
+
+def test_play_drops_past_the_per_sound_limit(monkeypatch, tmp_path):
+    audio = _manager(monkeypatch, tmp_path)
+    audio.per_sound = 2
+
+    assert audio.play("hit.ogg") == "channel"
+    assert audio.play("hit.ogg") == "channel"
+    assert audio.play("hit.ogg") is None
+    assert audio.sound("hit.ogg").playing == 2
+
+
+def test_no_mixer_is_silent(monkeypatch, tmp_path):
+    audio = _manager(monkeypatch, tmp_path, enabled=False)
+
+    assert isinstance(audio.sound("hit.ogg"), SilentSound)
+    assert audio.play("hit.ogg") is None
+    assert FakeSound.loads == 0
+
+
+def test_prefetch_reads_tracks_and_releases_old_ones(monkeypatch, tmp_path):
+    (tmp_path / "a.mp3").write_bytes(b"aaa")
+    (tmp_path / "b.mp3").write_bytes(b"bbb")
+    audio = _manager(monkeypatch, tmp_path)
+
+    audio.prefetch(["a.mp3", "missing.mp3"])
+    deadline = time.time() + 2
+    while "a.mp3" not in audio._tracks and time.time() < deadline:
+        time.sleep(0.01)
+    assert audio._tracks == {"a.mp3": b"aaa"}
+
+    audio.prefetch(["b.mp3"])
+    assert "a.mp3" not in audio._tracks
+
+
+def test_outdated_prefetch_reader_does_not_store(monkeypatch, tmp_path):
+    (tmp_path / "a.mp3").write_bytes(b"aaa")
+    audio = _manager(monkeypatch, tmp_path)
+
+    audio.prefetch([])
+    stale = audio._prefetch_gen
+    audio.prefetch([])
+    # A reader started by the first prefetch finishes after the second one
+    audio._read_tracks(["a.mp3"], stale)
+    assert "a.mp3" not in audio._tracks
@@ -0,0 +1,74 @@
+from pathlib import Path
+from database.db_manager import DatabaseManager
+from gameplay.world import World
+from gameplay.assistant import Assistant
+
+
+def _make_db(tmp_path, monkeypatch):
+    """Returns a DatabaseManager with a session and one tile."""
+    project_root = Path(__file__).parent.parent
+    monkeypatch.chdir(project_root)
+    db = DatabaseManager(db_file=str(tmp_path / "test_spawn.db"))
+    db.cursor.execute(
+        "INSERT INTO map_tiles (q, r, tile_type, is_spawn) VALUES (0, 0, 'grass', 1)"
+    )
+    db.conn.commit()
+    return db
+
+
+def _row(name, q, r, castle_id=None):
+    return {
+        "name": name, "q": q, "r": r,
+        "health": 20, "damage": 4, "level": 1,
+        "castle_id": castle_id,
+    }
+
+
+def test_add_monsters_returns_ids_in_order(tmp_path, monkeypatch):
+    db = _make_db(tmp_path, monkeypatch)
+
+    ids = db.add_monsters([_row("Goblin", 1, 1, castle_id=3), _row("Orc", 2, 2)])
+
+    assert len(ids) == 2
+    rows = db.cursor.execute(
+        "SELECT id, name, castle_id, current_hp FROM monsters ORDER BY id"
+    ).fetchall()
+    assert [r["id"] for r in rows] == ids
+    assert [r["name"] for r in rows] == ["Goblin", "Orc"]
+    assert [r["castle_id"] for r in rows] == [3, None]
+    assert all(r["current_hp"] == 20 for r in rows)
+    db.close()
+
+
+def test_load_monsters_filters_by_ids(tmp_path, monkeypatch):
+    db = _make_db(tmp_path, monkeypatch)
+    db.add_monsters([_row("Goblin", 1, 1)])
+    new_ids = db.add_monsters([_row("Orc", 2, 2)])
+
+    rows = db.load_monsters(ids=new_ids)
+
+    assert [r["name"] for r in rows] == ["Orc"]
+    assert db.load_monsters(ids=[]) == []
+    db.close()
+
+
+def test_world_spawn_entities_keeps_existing_objects(tmp_path, monkeypatch):
+    db = _make_db(tmp_path, monkeypatch)
+    sid = db.create_session(1)
+    db.add_monsters([_row("Goblin", 1, 1)])
+
+    world = World(db, sid)
+    existing = world.monsters[0]
+
+    spawned = world.spawn_entities([
+        _row("Orc", 2, 2, castle_id=5),
+        _row("monk_assistant", 3, 3),
+    ])
+
+    assert len(spawned) == 2
+    assert world.monsters[0] is existing
+    assert [m.name for m in world.monsters] == ["Goblin", "Orc"]
+    assert world.monsters[1].castle_id == 5
+    assert len(world.assistants) == 1
+    assert isinstance(world.assistants[0], Assistant)
+    db.close()
@@ -0,0 +1,44 @@
+import os
+from types import SimpleNamespace
+
+import pygame
+
+from ui import decorations
+from ui.resources import ResourceRegistry
+from ui.save_menu import SaveSelectMenu
+
+GRASS = os.path.join(decorations.HEX_TILES, "Grass.png")
+
+
+def test_decoration_is_built_once(monkeypatch):
+    decorations.clear()
+    loads = []
+    real = decorations.load_image
+    monkeypatch.setattr(decorations, "load_image", lambda p: loads.append(p) or real(p))
+
+    first = decorations.decoration(GRASS, 20, 1.5)
+    assert decorations.decoration(GRASS, 20, 1.5) is first
+    assert decorations.decoration(GRASS, 10, 1.5) is not first
+    assert len(loads) == 2
+
+
+def test_compose_paints_once():
+    calls = []
+    background = decorations.compose((40, 30), lambda s: calls.append(s) or s.fill((1, 2, 3)))
+
+    assert calls == [background]
+    assert background.get_size() == (40, 30)
+    assert tuple(background.get_at((5, 5)))[:3] == (1, 2, 3)
+
+
+def test_save_menu_caches_slot_existence(tmp_path, monkeypatch):
+    pygame.font.init()
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "game_data_2.db").write_bytes(b"")
+    manager = SimpleNamespace(width=800, height=600, resources=ResourceRegistry())
+    menu = SaveSelectMenu(manager)
+
+    assert menu.slot_exists == {1: False, 2: True, 3: False}
+
+    menu._delete_save(2)
+    assert menu.slot_exists[2] is False
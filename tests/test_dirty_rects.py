@@ -0,0 +1,107 @@
+from types import SimpleNamespace
+
+import pygame
+
+import main
+from core.config import Config
+from ui.game_window import GameWindow
+
+
+class FakeDisplay:
+    def __init__(self, monkeypatch):
+        self.flips = 0
+        self.updates = []
+        monkeypatch.setattr(main.pygame.display, "flip", self.flip)
+        monkeypatch.setattr(main.pygame.display, "update", self.update)
+
+    def flip(self):
+        self.flips += 1
+
+    def update(self, rects):
+        self.updates.append(rects)
+
+
+def _manager(rects):
+    screen = SimpleNamespace(dirty_rects=lambda: rects)
+    return SimpleNamespace(full_redraw=False, current_screen=screen)
+
+
+def test_present_pushes_only_dirty_rects(monkeypatch):
+    display = FakeDisplay(monkeypatch)
+    rects = [pygame.Rect(10, 10, 30, 30)]
+
+    main.ScreenManager.present(_manager(rects))
+    main.ScreenManager.present(_manager([]))  # nothing changed: nothing sent
+
+    assert display.flips == 0
+    assert display.updates == [rects]
+
+
+def test_present_flips_when_asked_or_after_switch(monkeypatch):
+    display = FakeDisplay(monkeypatch)
+    switched = _manager([pygame.Rect(0, 0, 5, 5)])
+    switched.full_redraw = True
+
+    main.ScreenManager.present(_manager(None))
+    main.ScreenManager.present(switched)
+
+    assert display.flips == 2
+    assert switched.full_redraw is False
+
+
+def _window(world_rects):
+    player = SimpleNamespace(
+        hp=10, max_hp=10, hunger=5, max_hunger=10, total_damage=3,
+        total_defense=1, equipment={"weapon": object()}, q=0, r=0, hearts=3,
+    )
+    window = SimpleNamespace(
+        renderer=SimpleNamespace(dirty_rects=world_rects),
+        engine=SimpleNamespace(
+            show_inventory=False,
+            world=SimpleNamespace(player=player, current_level=1),
+        ),
+        HUD_HEIGHT=GameWindow.HUD_HEIGHT,
+        _hud_key=None,
+        _castle_progress=None,
+        _loot_rect=None,
+        _last_loot_rect=None,
+        _inventory_was_open=False,
+    )
+    window._current_hud_key = lambda: GameWindow._current_hud_key(window)
+    return window
+
+
+def test_hud_band_is_sent_only_when_it_changes():
+    sprite = pygame.Rect(100, 100, 20, 20)
+    window = _window([sprite])
+    hud = pygame.Rect(0, 0, Config.WINDOW_WIDTH, GameWindow.HUD_HEIGHT)
+
+    assert GameWindow._collect_dirty_rects(window) == [sprite, hud]
+    assert GameWindow._collect_dirty_rects(window) == [sprite]
+
+    window.engine.world.player.hp = 7
+    assert GameWindow._collect_dirty_rects(window) == [sprite, hud]
+
+
+def test_inventory_overlay_forces_full_flips():
+    window = _window([])
+    GameWindow._collect_dirty_rects(window)
+
+    window.engine.show_inventory = True
+    assert GameWindow._collect_dirty_rects(window) is None
+    window.engine.show_inventory = False
+    # the frame that removes the overlay still redraws everything
+    assert GameWindow._collect_dirty_rects(window) is None
+    assert GameWindow._collect_dirty_rects(window) == []
+
+
+def test_fading_loot_text_is_cleared_after_it_ends():
+    window = _window([])
+    GameWindow._collect_dirty_rects(window)
+    loot = pygame.Rect(600, 280, 80, 24)
+
+    window._loot_rect = loot
+    assert GameWindow._collect_dirty_rects(window) == [loot]
+    window._loot_rect = None
+    assert GameWindow._collect_dirty_rects(window) == [loot]
+    assert GameWindow._collect_dirty_rects(window) == []
@@ -0,0 +1,85 @@
+from gameplay.registry import EntityRegistry
+from gameplay.world import World
+from gameplay.monster import Monster
+from conftest import initialize_level_unlocks_for_test
+
+
+class Thing:
+    def __init__(self, name):
+        self.name = name
+
+
+def test_create_and_get_by_handle():
+    registry = EntityRegistry()
+    a = Thing("a")
+
+    handle = registry.create(a, "monster")
+
+    assert a.handle == handle
+    assert registry.get(handle) is a
+    assert registry.kind_of(handle) == "monster"
+    assert list(registry.view("monster")) == [a]
+
+
+def test_destroy_is_deferred_until_flush():
+    registry = EntityRegistry()
+    a, b = Thing("a"), Thing("b")
+    registry.create(a, "monster")
+    registry.create(b, "monster")
+
+    assert registry.destroy(a.handle) is True
+    assert registry.destroy(a.handle) is False  # already queued
+    assert a in registry.view("monster")
+
+    assert registry.flush() == [a]
+    assert list(registry.view("monster")) == [b]
+
+
+def test_swap_remove_keeps_remaining_entities_reachable():
+    registry = EntityRegistry()
+    things = [Thing(str(i)) for i in range(5)]
+    for t in things:
+        registry.create(t, "monster")
+
+    registry.destroy(things[1].handle)
+    registry.flush()
+
+    view = registry.view("monster")
+    assert len(view) == 4
+    assert set(view) == {things[0], things[2], things[3], things[4]}
+    # every survivor can still be removed through its handle
+    for t in (things[4], things[0]):
+        registry.destroy(t.handle)
+    registry.flush()
+    assert set(view) == {things[2], things[3]}
+
+
+def test_stale_handle_does_not_resolve_after_slot_reuse():
+    registry = EntityRegistry()
+    a = Thing("a")
+    old_handle = registry.create(a, "monster")
+    registry.destroy(old_handle)
+    registry.flush()
+
+    b = Thing("b")
+    new_handle = registry.create(b, "chest")
+
+    assert new_handle != old_handle
+    assert registry.get(old_handle) is None
+    assert registry.destroy(old_handle) is False
+    assert registry.get(new_handle) is b
+
+
+def test_world_views_and_deferred_removal(db):
+    initialize_level_unlocks_for_test(db, 1)
+    world = World(db, 1)
+
+    goblin = Monster({"name": "Goblin", "current_q": 1, "current_r": 0})
+    world.add_monster(goblin)
+    assert list(world.monsters) == [goblin]
+
+    world.remove_entity(goblin)
+    assert goblin in world.monsters
+
+    assert world.flush_removals() == [goblin]
+    assert len(world.monsters) == 0
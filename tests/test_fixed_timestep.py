@@ -0,0 +1,92 @@
+from types import SimpleNamespace
+
+from core.config import Config
+from core.hexmath import HexMath
+from ui.game_window import GameWindow
+from visuals.renderer import GameRenderer
+
+
+class FakeEngine:
+    def __init__(self):
+        self.ticks = 0
+        self.ai_ticks = 0
+
+    def tick(self, asset_manager=None, run_ai=True):
+        self.ticks += 1
+        if run_ai:
+            self.ai_ticks += 1
+
+
+def _window():
+    """Just the state GameWindow._run_simulation touches."""
+    clock = SimpleNamespace(elapsed=0)
+    clock.get_time = lambda: clock.elapsed
+    return SimpleNamespace(
+        manager=SimpleNamespace(clock=clock),
+        engine=FakeEngine(),
+        assets=None,
+        frame_index=0,
+        sim_accumulator=0,
+        sim_alpha=0.0,
+    )
+
+
+def _run_frames(window, frame_ms, total_ms, run_ai=True):
+    for _ in range(total_ms // frame_ms):
+        window.manager.clock.elapsed = frame_ms
+        GameWindow._run_simulation(window, run_ai)
+
+
+def test_tick_count_is_independent_of_frame_rate():
+    fast, slow = _window(), _window()
+
+    _run_frames(fast, 10, 3000)  # 100 FPS
+    _run_frames(slow, 30, 3000)  # ~33 FPS
+
+    expected = 3000 // Config.SIM_TICK_MS
+    assert fast.engine.ticks == expected
+    assert slow.engine.ticks == expected
+    assert fast.frame_index == expected
+
+
+def test_catch_up_is_capped_and_backlog_dropped():
+    window = _window()
+
+    window.manager.clock.elapsed = Config.SIM_TICK_MS * 40 + 10
+    GameWindow._run_simulation(window, True)
+
+    assert window.engine.ticks == Config.MAX_SIM_STEPS
+    assert window.sim_accumulator < Config.SIM_TICK_MS
+    assert 0.0 <= window.sim_alpha < 1.0
+
+
+def test_paused_world_still_animates():
+    window = _window()
+
+    _run_frames(window, Config.SIM_TICK_MS, Config.SIM_TICK_MS * 4, run_ai=False)
+
+    assert window.engine.ticks == 4
+    assert window.engine.ai_ticks == 0
+
+
+def test_renderer_interpolates_between_ticks():
+    mover = SimpleNamespace(
+        q=1, r=0, is_moving=True,
+        move_from_q=0, move_from_r=0, move_to_q=1, move_to_r=0,
+        move_progress=0.5, move_speed=0.25,
+    )
+    from_px, _ = HexMath.hex_to_pixel(0, 0)
+    to_px, _ = HexMath.hex_to_pixel(1, 0)
+
+    renderer = GameRenderer.__new__(GameRenderer)
+    renderer.px = 1.0  # full resolution: world pixels are HexMath pixels
+
+    x_tick, _ = renderer._entity_pixel(mover, 0.0)
+    x_mid, _ = renderer._entity_pixel(mover, 0.5)
+
+    assert x_tick == from_px + (to_px - from_px) * 0.5
+    assert x_mid == from_px + (to_px - from_px) * 0.625
+
+    mover.move_progress = 1.0
+    x_end, _ = renderer._entity_pixel(mover, 0.9)
+    assert x_end == to_px
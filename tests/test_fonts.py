@@ -0,0 +1,44 @@
+import pygame
+
+from ui.fonts import FontRegistry, TextCache, wrap_text
+
+
+def _font():
+    pygame.font.init()
+    return pygame.font.Font(None, 20)
+
+
+def test_fonts_are_loaded_once():
+    pygame.font.init()
+    fonts = FontRegistry()
+
+    assert fonts.get("Arial", 18) is fonts.get("Arial", 18)
+    assert fonts.get("Arial", 18, bold=True) is not fonts.get("Arial", 18)
+    assert len(fonts) == 2
+
+
+def test_text_is_rendered_once_and_evicted_lru():
+    font = _font()
+    cache = TextCache(max_entries=2)
+
+    hp = cache.render(font, "HP: 10/10", (255, 80, 80))
+    assert cache.render(font, "HP: 10/10", (255, 80, 80)) is hp
+    assert cache.render(font, "HP: 10/10", (0, 0, 0)) is not hp
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    cache.render(font, "HP: 10/10", (255, 80, 80))  # most recent again
+    cache.render(font, "HP: 9/10", (255, 80, 80))  # evicts the black one
+    assert cache.render(font, "HP: 10/10", (255, 80, 80)) is hp
+    assert len(cache) == 2
+
+
+def test_wrap_is_cached_and_matches_uncached():
+    font = _font()
+    cache = TextCache()
+    text = "a fairly long item description " + "x" * 60
+
+    lines = cache.wrap(text, font, 120)
+    assert list(lines) == wrap_text(text, font, 120)
+    assert all(font.size(line)[0] <= 120 for line in lines)
+    assert cache.wrap(text, font, 120) is lines
+    assert wrap_text("", font, 120) == [""]
@@ -0,0 +1,90 @@
+import pygame
+
+from gameplay.engine import GameEngine
+from gameplay.item import Item
+from gameplay.monster import Monster
+from gameplay.simulation import AnimationClock, SilentSound
+from conftest import initialize_level_unlocks_for_test
+
+
+def _sword():
+    return Item({
+        "id": 1, "name": "Sword", "item_type": "weapon",
+        "slot": "weapon", "base_damage": 10,
+    })
+
+
+def _no_audio(*args, **kwargs):
+    raise AssertionError("headless engine must not load sounds")
+
+
+def test_headless_engine_does_not_load_audio(db, monkeypatch):
+    initialize_level_unlocks_for_test(db, 1)
+    monkeypatch.setattr(pygame.mixer, "Sound", _no_audio)
+
+    engine = GameEngine(db, 1, headless=True)
+
+    assert isinstance(engine.level_up_sound, SilentSound)
+    assert isinstance(engine.animator, AnimationClock)
+
+
+def test_animation_clock_reads_frame_counts():
+    clock = AnimationClock()
+
+    assert clock.anim_metadata
+    assert all(meta["count"] >= 1 for meta in clock.anim_metadata.values())
+
+
+def test_step_moves_player_and_finishes_animation(db):
+    initialize_level_unlocks_for_test(db, 1)
+    engine = GameEngine(db, 1, headless=True)
+    player = engine.world.player
+
+    results = engine.step(1, policy=lambda e: "MOVE_EAST")
+
+    assert results == ["TURN_DONE"]
+    assert (player.q, player.r) == (1, 0)
+    assert not player.is_moving
+
+
+def test_step_lands_attack_on_hit_frame(db):
+    initialize_level_unlocks_for_test(db, 1)
+    engine = GameEngine(db, 1, headless=True)
+    player = engine.world.player
+    player.equipment["weapon"] = _sword()
+
+    goblin = Monster({
+        "name": "Goblin", "current_q": 1, "current_r": 0,
+        "health": 100, "damage": 1,
+    })
+    engine.world.add_monster(goblin)
+
+    engine.step(1, policy=lambda e: "MOVE_EAST")
+
+    assert goblin.hp < 100
+    assert not player.is_attacking
+
+
+def test_step_runs_many_turns(db):
+    initialize_level_unlocks_for_test(db, 1)
+    engine = GameEngine(db, 1, headless=True)
+    # A tough monster keeps level 1 from being completed
+    engine.world.add_monster(Monster({
+        "name": "Boulder", "current_q": 3, "current_r": 0,
+        "health": 10 ** 6, "damage": 0, "level": 1,
+    }))
+
+    results = engine.step(60)
+
+    assert len(results) == 60
+
+
+def test_step_stops_on_win(db):
+    initialize_level_unlocks_for_test(db, 1)
+    engine = GameEngine(db, 1, headless=True)
+
+    # No monsters or castles: every level completes immediately
+    results = engine.step(50, policy=lambda e: "MOVE_EAST")
+
+    assert results[-1] == "WIN"
+    assert len(results) < 50
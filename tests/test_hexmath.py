@@ -7,3 +7,45 @@ def test_hex_pixel_conversion():
     rq, rr = HexMath.pixel_to_hex(px, py)
 
     assert (q, r) == (rq, rr), f"Expected ({q}, {r}), got ({rq}, {rr})"
+
+
+def test_polygon_table_matches_corners():
+    offsets = HexMath.get_hex_polygon_offsets()
+    poly = HexMath.get_hex_polygon(10, 20)
+
+    assert len(offsets) == 6
+    assert poly[0::2] == [10 + x for x, _ in offsets]
+    assert poly[1::2] == [20 + y for _, y in offsets]
+    assert HexMath.get_hex_polygon_offsets() is offsets
+    half = HexMath.get_hex_polygon_offsets(0.5)
+    assert half[0][0] == offsets[0][0] * 0.5
+
+
+def test_range_offsets_cover_the_radius_back_to_front():
+    radius = 4
+    offsets = HexMath.get_range_offsets(radius)
+    expected = {
+        (q, r)
+        for q in range(-radius, radius + 1)
+        for r in range(-radius, radius + 1)
+        if HexMath.distance(0, 0, q, r) <= radius
+    }
+
+    assert set(offsets) == expected and len(offsets) == len(expected)
+    ys = [HexMath.hex_to_pixel(q, r)[1] for q, r in offsets]
+    assert ys == sorted(ys)
+
+
+def test_hexes_in_rect_visits_only_the_rect():
+    left, top, right, bottom = -130.0, -75.5, 210.0, 160.0
+    cells = HexMath.hexes_in_rect(left, top, right, bottom)
+    expected = set()
+    for q in range(-20, 21):
+        for r in range(-20, 21):
+            x, y = HexMath.hex_to_pixel(q, r)
+            if left <= x <= right and top <= y <= bottom:
+                expected.add((q, r))
+
+    assert set(cells) == expected and len(cells) == len(expected)
+    ys = [HexMath.hex_to_pixel(q, r)[1] for q, r in cells]
+    assert ys == sorted(ys)
@@ -0,0 +1,87 @@
+import os
+import time
+
+import pygame
+
+from core.config import Config
+from visuals.preloader import AssetPreloader, CLOUD_PATHS, save_paths
+
+
+def _finish(loader, timeout=10.0):
+    deadline = time.time() + timeout
+    while loader.step() and time.time() < deadline:
+        time.sleep(0.001)
+
+
+def test_preload_decodes_in_background_and_converts_on_step():
+    pygame.display.set_mode((1, 1))
+    loader = AssetPreloader()
+    paths = CLOUD_PATHS[:2] + ["assets/does_not_exist.png"]
+
+    loader.start(paths)
+    assert loader.total == 3
+    _finish(loader)
+
+    assert not loader.active
+    assert loader.progress == 1.0
+    assert set(loader.surfaces) == set(CLOUD_PATHS[:2])
+    preloaded = loader.surfaces[CLOUD_PATHS[0]]
+    assert loader.load(CLOUD_PATHS[0]) is preloaded
+    assert CLOUD_PATHS[0] not in loader.surfaces  # handed over to the caller
+
+    # Loaded or handed-over paths are not queued again
+    loader.start(CLOUD_PATHS[:2])
+    assert loader.total == 3
+
+
+def test_early_load_drops_the_late_worker_result():
+    pygame.display.set_mode((1, 1))
+    loader = AssetPreloader()
+    loader.start(CLOUD_PATHS[:1])
+    surface = loader.load(CLOUD_PATHS[0])  # before step() converted it
+
+    _finish(loader)
+    assert surface is not None
+    assert not loader.active
+    assert loader.surfaces == {}
+
+
+def test_step_respects_time_budget():
+    pygame.display.set_mode((1, 1))
+    loader = AssetPreloader()
+    loader.start(CLOUD_PATHS[:4])
+    while loader._decoded.qsize() < 4:
+        time.sleep(0.001)
+
+    loader.step(budget_ms=0)
+    assert loader.done == 0
+    _finish(loader)
+    assert loader.done == 4
+
+
+def test_save_paths_follow_the_save(db):
+    db.cursor.execute(
+        "INSERT INTO monsters (name, current_q, current_r) VALUES ('green_slime.json', 0, 0)"
+    )
+    db.conn.commit()
+
+    paths = save_paths(db.db_file)
+    assert paths[:len(CLOUD_PATHS)] == CLOUD_PATHS
+    # Monster names resolve to the sheets of their definition
+    assert os.path.join(Config.ASSET_DIR, "Green_Slime-Idle.png") in paths
+    assert all(os.path.isfile(p) for p in paths)
+
+
+def test_released_paths_are_queued_again():
+    pygame.display.set_mode((1, 1))
+    loader = AssetPreloader()
+    loader.load(CLOUD_PATHS[0])
+
+    loader.start(CLOUD_PATHS[:1])
+    assert loader.total == 0  # claimed by the caller's cache
+
+    loader.release(CLOUD_PATHS[0])
+    loader.start(CLOUD_PATHS[:1])
+    assert loader.total == 1
+    _finish(loader)
+    assert CLOUD_PATHS[0] in loader.surfaces
@@ -0,0 +1,63 @@
+import csv
+
+from core.profiler import FrameProfiler
+
+
+def test_disabled_profiler_records_nothing():
+    prof = FrameProfiler(capacity=10)
+
+    first = prof.phase("render")
+    with first:
+        pass
+    prof.end_frame()
+
+    assert prof.phase("hud") is first  # one shared no-op context
+    assert len(prof.samples) == 0
+
+
+def test_phases_accumulate_per_frame():
+    prof = FrameProfiler(capacity=10, enabled=True)
+
+    @prof.timed("turn")
+    def turn():
+        return "OK"
+
+    with prof.phase("render"):
+        pass
+    with prof.phase("render"):
+        pass
+    assert turn() == "OK"
+    prof.end_frame()
+
+    (index, frame), = prof.samples
+    assert index == 1
+    assert set(frame) == {"render", "turn"}
+    assert prof.phases == ["render", "turn"]
+
+
+def test_ring_buffer_and_percentiles():
+    prof = FrameProfiler(capacity=100, enabled=True)
+    for ms in range(1, 151):
+        prof._current = {"render": float(ms)}
+        prof.end_frame()
+
+    assert len(prof.samples) == 100  # oldest 50 frames dropped
+    p50, p95, p99 = prof.percentiles("render")
+    assert (p50, p95, p99) == (101.0, 145.0, 149.0)  # frames 51..150
+    assert prof.percentiles("missing") == (0.0, 0.0, 0.0)
+
+
+def test_export_csv(tmp_path):
+    prof = FrameProfiler(capacity=10, enabled=True)
+    prof._current = {"render": 2.5}
+    prof.end_frame()
+    prof._current = {"render": 1.0, "inventory": 4.0}
+    prof.end_frame()
+
+    path = prof.export_csv(tmp_path / "frames.csv")
+    rows = list(csv.reader(open(path)))
+
+    assert rows[0] == ["frame", "render", "inventory"]
+    assert rows[1] == ["1", "2.500", ""]
+    assert rows[2] == ["2", "1.000", "4.000"]
+    assert FrameProfiler(capacity=10).export_csv(tmp_path / "none.csv") is None
@@ -0,0 +1,56 @@
+from visuals.scene import (
+    DrawRecord, SceneGraph, RANK_PROP, RANK_PLAYER, RANK_MONSTER,
+)
+
+
+def _order(scene, top=-1000, bottom=1000):
+    return [rec.ref for rec in scene.walk(top, bottom)]
+
+
+def test_walk_is_back_to_front():
+    scene = SceneGraph()
+    scene.add(DrawRecord("entity", "front", RANK_MONSTER), 0, 40.0)
+    scene.add(DrawRecord("prop", "back", RANK_PROP), 10, -12.5)
+    scene.add(DrawRecord("entity", "middle", RANK_PLAYER), -5, 3.2)
+
+    assert _order(scene) == ["back", "middle", "front"]
+
+
+def test_ties_are_broken_by_rank():
+    scene = SceneGraph()
+    scene.add(DrawRecord("entity", "monster", RANK_MONSTER), 0, 10.0)
+    scene.add(DrawRecord("prop", "prop", RANK_PROP), 0, 10.0)
+    scene.add(DrawRecord("entity", "player", RANK_PLAYER), 0, 10.0)
+
+    assert _order(scene) == ["prop", "player", "monster"]
+
+
+def test_move_rebuckets_only_when_the_row_changes():
+    scene = SceneGraph()
+    mover = DrawRecord("entity", "mover", RANK_MONSTER)
+    other = DrawRecord("entity", "other", RANK_MONSTER)
+    scene.add(mover, 0, 5.1)
+    scene.add(other, 0, 5.5)
+
+    scene.move(mover, 3, 5.9)  # same row, now in front of `other`
+    assert mover.row == 5 and mover.x == 3
+    assert _order(scene) == ["other", "mover"]
+
+    scene.move(mover, 3, 20.0)
+    assert mover.row == 20
+    assert list(scene.walk(5, 5)) == [other]
+    assert len(scene) == 2
+
+
+def test_remove_and_walk_range():
+    scene = SceneGraph()
+    records = [DrawRecord("prop", y, RANK_PROP) for y in range(0, 100, 10)]
+    for rec in records:
+        scene.add(rec, 0, rec.ref)
+
+    scene.remove(records[3])
+    scene.remove(records[3])  # removing twice is harmless
+
+    assert _order(scene, 15, 55) == [20, 40, 50]
+    assert len(scene) == 9
+    assert records[3].row is None
@@ -0,0 +1,90 @@
+from types import SimpleNamespace
+
+import pygame
+
+import main
+from ui.base_screen import Screen
+from ui.resources import MENU_FONT, ResourceRegistry
+
+
+class _Menu(Screen):
+    pooled = True
+    built = 0
+
+    def __init__(self, manager):
+        super().__init__(manager)
+        type(self).built += 1
+        self.buttons = [SimpleNamespace(is_hovered=True)]
+        self.font = manager.resources.get("font", object)
+
+    def draw(self):
+        pass
+
+    def handle_event(self, event):
+        pass
+
+
+class _Game(_Menu):
+    pooled = False
+    built = 0
+
+
+def _manager():
+    return SimpleNamespace(
+        available_screens={"menu": _Menu, "game": _Game},
+        screen_pool={},
+        resources=ResourceRegistry(),
+        full_redraw=False,
+    )
+
+
+def test_pooled_screens_are_reused():
+    _Menu.built = _Game.built = 0
+    manager = _manager()
+
+    for name in ("menu", "game", "menu", "game", "menu"):
+        main.ScreenManager.switch_screen(manager, name)
+
+    assert _Menu.built == 1
+    assert _Game.built == 2
+    assert manager.current_screen is manager.screen_pool["menu"]
+    assert manager.current_screen.buttons[0].is_hovered is False  # reset by on_enter
+
+
+def test_resources_are_shared_between_screens():
+    manager = _manager()
+    main.ScreenManager.switch_screen(manager, "game")
+    first = manager.current_screen
+    main.ScreenManager.switch_screen(manager, "game")
+
+    assert manager.current_screen is not first
+    assert manager.current_screen.font is first.font
+
+
+def test_registry_builds_once_until_released():
+    registry = ResourceRegistry()
+    calls = []
+    value = registry.get("k", lambda: calls.append(1) or object())
+
+    assert registry.get("k", object) is value
+    registry.release("k")
+    assert "k" not in registry
+    assert registry.get("k", lambda: calls.append(1) or object()) is not value
+    assert len(calls) == 2
+
+
+def test_registry_fonts_can_be_released_and_cleared():
+    pygame.font.init()
+    registry = ResourceRegistry()
+    font = registry.font(20)
+
+    assert registry.font(20) is font
+    registry.release(("font", MENU_FONT, 20))
+    assert registry.font(20) is not font
+
+    registry.fonts.get("Arial", 18)
+    registry.text.render(font, "hp", (255, 255, 255))
+    registry.clear()
+    assert ("font", MENU_FONT, 20) not in registry
+    assert len(registry.fonts) == 0
+    assert len(registry.text) == 0
@@ -0,0 +1,104 @@
+import pygame
+
+from visuals.sprite_cache import SpriteCache
+
+
+def _surf(w=10, h=10):
+    return pygame.Surface((w, h), pygame.SRCALPHA)
+
+
+def test_bytes_follow_surface_dimensions():
+    cache = SpriteCache(budget_bytes=10_000)
+    cache.put("a", _surf(10, 10))
+    cache.put("b", _surf(5, 4))
+
+    assert cache.bytes == (100 + 20) * 4
+    cache.put("a", _surf(2, 2))  # replacing an entry re-charges it
+    assert cache.bytes == (4 + 20) * 4
+
+
+def test_least_recently_used_is_evicted_first():
+    cache = SpriteCache(budget_bytes=3 * 400)
+    for key in ("a", "b", "c"):
+        cache.put(key, _surf())
+    cache.get("a")  # "b" is now the oldest
+
+    cache.put("d", _surf())
+
+    assert "b" not in cache
+    assert all(k in cache for k in ("a", "c", "d"))
+    assert cache.evictions == 1
+    assert cache.bytes <= cache.budget_bytes
+
+
+def test_counters_and_report():
+    cache = SpriteCache(budget_bytes=1000)
+    cache.put("a", _surf(2, 2))
+
+    assert cache.get("a") is not None
+    assert cache.get("missing") is None
+    stats = cache.stats()
+
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+    assert "hit 1 miss 1" in cache.report()
+
+
+def test_pinned_entries_survive_eviction():
+    cache = SpriteCache(budget_bytes=400)
+    cache.put("pinned", _surf(), pinned=True)
+    cache.put("other", _surf())
+
+    assert "pinned" in cache
+    assert "other" not in cache
+
+
+def test_pin_keeps_an_existing_entry():
+    cache = SpriteCache(budget_bytes=800)
+    cache.put("a", _surf())
+    cache.pin("a")
+    cache.put("b", _surf())
+    cache.put("c", _surf())
+
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+    assert cache.stats()["pinned"] == 1
+
+
+def test_grown_entries_are_charged_and_kept():
+    cache = SpriteCache(budget_bytes=1000)
+    cache.put("strip", ["frames"], size=400)
+    cache.put("b", _surf())
+    cache.grow("strip", 300)
+
+    assert cache.bytes <= 1000
+    assert "strip" in cache  # in use: survives its own growth
+    assert "b" not in cache  # now the least recently used
+    cache.grow("missing", 100)
+    assert cache.bytes == 700
+
+
+def test_growing_a_pinned_entry_unpins_it():
+    cache = SpriteCache(budget_bytes=1000)
+    cache.put("strip", ["frames"], pinned=True, size=400)
+    cache.grow("strip", 300)
+
+    assert cache.pinned_bytes == 0
+    assert cache.stats()["pinned"] == 0
+    assert cache.bytes == 700
+    cache.put("big", ["frames"], size=600)
+    assert "strip" not in cache  # back in the LRU, evicted like any entry
+
+
+def test_on_evict_reports_dropped_keys():
+    dropped = []
+    cache = SpriteCache(budget_bytes=300 * 4, on_evict=dropped.append)
+    cache.put("a", _surf())
+    cache.put("a", _surf())  # replaced, not evicted
+    cache.put("b", _surf())
+    cache.put("c", _surf(), pinned=True)
+    assert dropped == []
+
+    cache.put("d", _surf())
+    assert dropped == ["a"]
+    cache.clear()
+    assert sorted(dropped) == ["a", "b", "c", "d"]
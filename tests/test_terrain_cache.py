@@ -0,0 +1,101 @@
+import pygame
+from types import SimpleNamespace
+
+from core.hexmath import HexMath
+from visuals.terrain_cache import TerrainChunkCache
+
+
+def _world(radius=12):
+    tiles = {}
+    for q in range(-radius, radius + 1):
+        for r in range(-radius, radius + 1):
+            tiles[(q, r)] = SimpleNamespace(q=q, r=r)
+    return SimpleNamespace(tiles=tiles)
+
+
+class Painter:
+    """draw_tile stand-in that records which tiles were baked."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, surface, world, tile, x, y):
+        self.calls.append((tile.q, tile.r))
+        pygame.draw.circle(surface, (255, 255, 255), (int(x), int(y)), 4)
+
+
+def test_chunks_are_baked_once_and_reused():
+    painter = Painter()
+    cache = TerrainChunkCache(painter)
+    cache.bind(_world())
+    screen = pygame.Surface((400, 300))
+
+    cache.draw(screen, -200, -150)
+    baked = len(painter.calls)
+    cache.draw(screen, -200, -150)
+
+    assert baked > 0
+    assert len(painter.calls) == baked
+    # the tile at the origin lands at the screen centre
+    assert screen.get_at((200, 150))[:3] == (255, 255, 255)
+
+
+def test_discovery_rebakes_only_nearby_chunks():
+    painter = Painter()
+    cache = TerrainChunkCache(painter)
+    cache.bind(_world())
+    screen = pygame.Surface((1200, 800))
+    cache.draw(screen, -600, -400)
+    chunk_count = len(cache)
+    painter.calls.clear()
+
+    cache.invalidate_tile(0, 0)
+    cache.draw(screen, -600, -400)
+
+    assert (0, 0) in painter.calls
+    px, py = HexMath.hex_to_pixel(0, 0)
+    assert len(cache._chunks_near(px, py)) < chunk_count
+
+
+def test_far_chunks_are_evicted():
+    cache = TerrainChunkCache(Painter())
+    cache.bind(_world(radius=40))
+    screen = pygame.Surface((400, 300))
+
+    cache.draw(screen, -200, -150)
+    near = set(cache._chunks)
+    cache.draw(screen, 5000, 5000)
+
+    assert not near & set(cache._chunks)
+
+
+def test_binding_another_world_drops_chunks():
+    painter = Painter()
+    cache = TerrainChunkCache(painter)
+    screen = pygame.Surface((400, 300))
+    cache.bind(_world())
+    cache.draw(screen, -200, -150)
+
+    cache.bind(_world())
+
+    assert len(cache) == 0
+
+
+def test_level_unlock_rebakes_only_that_levels_chunks():
+    painter = Painter()
+    cache = TerrainChunkCache(painter)
+    world = _world(radius=30)
+    for tile in world.tiles.values():
+        tile.level = 2 if tile.q > 20 else 1
+    cache.bind(world)
+    screen = pygame.Surface((400, 300))
+    cache.draw(screen, -200, -150)  # around the origin: level 1 only
+    painter.calls.clear()
+
+    cache.invalidate_level(2)
+    cache.draw(screen, -200, -150)
+    assert painter.calls == []
+
+    cache.invalidate_level(1)
+    cache.draw(screen, -200, -150)
+    assert painter.calls
@@ -0,0 +1,78 @@
+from types import SimpleNamespace
+
+from gameplay.world import World
+from gameplay.models import CircleExplosion, HealEffect
+from visuals.vfx import VFXLibrary
+
+
+class NoSheets:
+    """Asset manager without the star/heal sheets."""
+
+    def get_image(self, *args, **kwargs):
+        return None
+
+
+def _run_vfx(effects):
+    world = SimpleNamespace(effects=effects)
+    World.update_vfx(world)
+    return world.effects
+
+
+def test_finished_effects_are_reused():
+    CircleExplosion._free_list = []
+    first = CircleExplosion.acquire(0, 0, (255, 0, 0), 1)
+    effects = [first]
+    while effects:
+        effects = _run_vfx(effects)
+
+    second = CircleExplosion.acquire(3, 4, (0, 255, 0), 2)
+
+    assert second is first
+    assert (second.q, second.r, second.color) == (3, 4, (0, 255, 0))
+    assert second.frame == 0 and not second.dead
+
+
+def test_released_heal_effect_drops_its_target():
+    HealEffect._free_list = []
+    target = object()
+    effect = HealEffect.acquire(target)
+    effect.dead = True
+
+    _run_vfx([effect])
+
+    assert effect.target is None
+    assert HealEffect.acquire(target) is effect
+
+
+def test_explosion_frames_are_baked_once_per_kind():
+    vfx = VFXLibrary(NoSheets())
+    a = CircleExplosion(0, 0, (255, 100, 0), 2)
+    b = CircleExplosion(5, 5, (255, 100, 0), 2)
+    a.update()
+    b.update()
+
+    ring = vfx.explosion_frame(a)
+
+    assert ring is not None
+    assert vfx.explosion_frame(b) is ring
+    assert ring.get_width() == int(a.max_pixel_radius * 2)
+
+
+def test_explosion_frame_follows_radius_until_it_fades():
+    vfx = VFXLibrary(NoSheets())
+    effect = CircleExplosion(0, 0, (50, 255, 50), 1)
+    seen = []
+    while not effect.dead:
+        effect.update()
+        if not effect.dead:
+            seen.append(vfx.explosion_frame(effect))
+
+    assert seen and all(frame is not None for frame in seen)
+    assert len(set(map(id, seen))) == len(seen)
+
+
+def test_missing_sheets_fall_back_to_none():
+    vfx = VFXLibrary(NoSheets())
+
+    assert vfx.star_frame(7) is None
+    assert vfx.heal_frame(HealEffect(object())) is None
@@ -0,0 +1,158 @@
+from unittest.mock import Mock
+
+from gameplay.journal import WorldJournal, ChangeKind
+from gameplay.world import World
+from gameplay.engine import GameEngine
+from gameplay.monster import Monster
+from conftest import initialize_level_unlocks_for_test
+
+
+monster_data = {
+    "id": 7,
+    "name": "Goblin",
+    "current_q": 1,
+    "current_r": 0,
+    "health": 30,
+    "damage": 8,
+}
+
+
+# =============================================
+# WorldJournal
+# =============================================
+
+
+def test_journal_without_subscribers_records_nothing():
+    journal = WorldJournal()
+    journal.record(ChangeKind.LEVEL_UNLOCKED, data=2)
+
+    journal.subscribe("late")
+    assert journal.drain("late") == []
+
+
+def test_journal_fans_out_to_each_subscriber():
+    journal = WorldJournal()
+    journal.subscribe("a")
+    journal.subscribe("b")
+
+    journal.record(ChangeKind.LEVEL_UNLOCKED, data=2)
+
+    assert [c.data for c in journal.drain("a")] == [2]
+    assert journal.drain("a") == []
+    # "b" keeps its own backlog
+    assert [c.kind for c in journal.drain("b")] == [ChangeKind.LEVEL_UNLOCKED]
+
+
+def test_journal_overflow_collapses_to_resync():
+    journal = WorldJournal(max_backlog=3)
+    journal.subscribe("slow")
+
+    for level in range(10):
+        journal.record(ChangeKind.LEVEL_UNLOCKED, data=level)
+
+    changes = journal.drain("slow")
+    assert [c.kind for c in changes] == [ChangeKind.RESYNC]
+
+
+# =============================================
+# Entity mutations
+# =============================================
+
+
+def test_entity_mutations_are_recorded():
+    journal = WorldJournal()
+    journal.subscribe("test")
+    monster = Monster(dict(monster_data))
+    monster.journal = journal
+
+    monster.q = 2
+    monster.take_damage(999)
+
+    kinds = [c.kind for c in journal.drain("test")]
+    assert kinds[0] == ChangeKind.ENTITY_MOVED
+    assert ChangeKind.HP_CHANGED in kinds
+    assert kinds[-1] == ChangeKind.ENTITY_DIED
+
+
+def test_unchanged_values_are_not_recorded():
+    journal = WorldJournal()
+    journal.subscribe("test")
+    monster = Monster(dict(monster_data))
+    monster.journal = journal
+
+    monster.q = monster.q
+    monster.hp = monster.hp
+
+    assert journal.drain("test") == []
+
+
+# =============================================
+# World and engine
+# =============================================
+
+
+def test_fog_of_war_records_discoveries_without_writing(db):
+    initialize_level_unlocks_for_test(db, 1)
+    world = World(db, 1)
+    world.journal.subscribe("test")
+
+    world.update_fog_of_war()
+
+    discovered = [c.target for c in world.journal.drain("test")
+                  if c.kind is ChangeKind.TILE_DISCOVERED]
+    assert discovered
+    assert all(t.discovered for t in discovered)
+
+    row = db.cursor.execute(
+        "SELECT COUNT(*) FROM session_world_state WHERE session_id=1 AND is_discovered=1"
+    ).fetchone()
+    assert row[0] == 0
+
+
+def test_engine_flush_persists_discoveries(db):
+    initialize_level_unlocks_for_test(db, 1)
+    engine = GameEngine(db, 1)
+
+    discovered = {t.id for t in engine.world.tiles.values() if t.discovered}
+    rows = db.cursor.execute(
+        "SELECT tile_id FROM session_world_state WHERE session_id=1 AND is_discovered=1"
+    ).fetchall()
+
+    assert discovered
+    assert {row[0] for row in rows} == discovered
+
+
+def test_engine_flush_saves_only_changed_monsters(db):
+    initialize_level_unlocks_for_test(db, 1)
+    engine = GameEngine(db, 1)
+
+    idle = Monster(dict(monster_data, id=1))
+    hurt = Monster(dict(monster_data, id=2, current_q=2))
+    engine.world.add_monster(idle)
+    engine.world.add_monster(hurt)
+    engine.db = Mock()
+
+    hurt.take_damage(5)
+    engine.flush_journal()
+
+    engine.db.save_monster.assert_called_once_with(hurt)
+
+
+def test_failed_flush_is_retried_as_a_resync(db):
+    initialize_level_unlocks_for_test(db, 1)
+    engine = GameEngine(db, 1)
+
+    hurt = Monster(dict(monster_data, id=2, current_q=2))
+    engine.world.add_monster(hurt)
+    engine.db = Mock()
+    engine.db.save_monster.side_effect = RuntimeError("disk full")
+
+    hurt.take_damage(5)
+    assert engine.flush_journal() is False
+
+    engine.db.save_monster.side_effect = None
+    engine.db.save_monster.reset_mock()
+    assert engine.flush_journal() is True
+    engine.db.save_monster.assert_any_call(hurt)
+    discovered = {t.id for t in engine.world.tiles.values() if t.discovered}
+    assert set(engine.db.update_discoveries.call_args[0][1]) == discovered
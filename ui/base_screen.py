@@ -2,8 +2,17 @@ from abc import ABC, abstractmethod
 
 # Base class for all screens in the application. Each screen must implement the draw and handle_event methods
 class Screen(ABC):
+    # Screens without per-visit state are built once and reused by ScreenManager
+    pooled = False
+
     def __init__(self, manager):
         self.manager = manager
+
+    def on_enter(self):
+        """Called when a pooled screen is shown again; resets hover highlights."""
+        for button in getattr(self, "buttons", ()):
+            if hasattr(button, "is_hovered"):
+                button.is_hovered = False
     
     @abstractmethod
     def draw(self): 
@@ -14,4 +23,8 @@ class Screen(ABC):
     @abstractmethod
     def handle_event(self, event): 
         """ must be implemented by the subclass to handle user inputs"""
-        pass     
\ No newline at end of file
+        pass     
+
+    def dirty_rects(self):
+        """Screen areas changed by the last draw(), or None to flip the whole window."""
+        return None
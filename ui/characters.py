@@ -6,12 +6,15 @@ from pygame.draw import rect
 
 import ui.button
 from ui.base_screen import Screen
+from ui.decorations import HEX_TILES, compose, draw_decoration
 
 # Constants
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))  # directory of this script
 
 
 class Characters(Screen):
+    pooled = True
+
     def __init__(self, manager):
         super().__init__(manager)
 
@@ -32,6 +35,9 @@ class Characters(Screen):
         self.button_names = ["character_1", "character_2"]
         self.buttons = self.create_buttons()
 
+        # everything but the buttons is static: painted once per visit
+        self.background = compose((self.manager.width, self.manager.height), self.draw_background)
+
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
@@ -60,10 +66,7 @@ class Characters(Screen):
 
         button_height = 45
         button_width = 250
-        button_font = pygame.font.Font(
-            os.path.join(BASE_DIR, "..", "assets", "fonts", "Jersey10-Regular.ttf"),
-            size=30,
-        )
+        button_font = self.manager.resources.font(30)
 
         # GRID SETTINGS
         cols = 2  # Balanced for 2 characters
@@ -101,32 +104,29 @@ class Characters(Screen):
 
         return buttons
 
-    def draw(self):
+    def draw_background(self, surface):
         """
-        Draw the welcome screen with title and images.
-        Input: None
+        Paint the title, images and characters.
+        Input: surface(pygame.Surface): the background surface
         Output: None
         """
-        self.manager.screen.fill(
+        surface.fill(
             self.manager.bg_color
         )  # fill covers the previous screen
 
         # text
-        pygame.font.init()
-        font = pygame.font.Font(
-            os.path.join(BASE_DIR, "..", "assets", "fonts", "Jersey10-Regular.ttf"),
-            size=150,
-        )
+        font = self.manager.resources.font(150)
 
         text = font.render("CHARACTERS", True, self.manager.text_color_green)
         position = self.manager.width // 2, 130
         rect = text.get_rect(center=position)
-        self.manager.screen.blit(source=text, dest=rect)
+        surface.blit(source=text, dest=rect)
 
         # title images
         center_x = self.manager.width // 2
         for image_name, dx, dy, angle, scale in self.decoration_images:
-            self.draw_image(image_name, center_x + dx, dy, angle, scale)
+            draw_decoration(surface, os.path.join(HEX_TILES, image_name),
+                            center_x + dx, dy, angle, scale)
 
         # character images
         # character images directly above buttons
@@ -135,39 +135,21 @@ class Characters(Screen):
         for img_name, btn in zip(self.character_images, self.buttons):
             char_x = btn.rect.x + btn.rect.width // 2
             ground_y = btn.rect.top
-            self.draw_character(img_name, char_x, ground_y)
+            self.draw_character(surface, img_name, char_x, ground_y)
 
-        # buttons
-        for button in self.buttons:
-            button.draw(self.manager.screen)
-
-    def draw_image(self, image_name: str, x: int, y: int, angle: int, scale: float):
+    def draw(self):
         """
-        draw image on the screen
-        Inputs:
-            image_name(str): name of the image file
-            x(int): x position
-            y(int): y position
-            angle(int): rotation angle in degrees
-            scale(float): scaling factor (e.g., 0.5 for half size, 2 for double size)
+        Draw the character selection screen.
+        Input: None
         Output: None
         """
-        # path
-        hex_image_path = os.path.join(
-            BASE_DIR, "..", "assets", "assetBank", "Hex Tiles", image_name
-        )
-        image = pygame.image.load(hex_image_path)
+        self.manager.screen.blit(self.background, (0, 0))
 
-        # adjust image
-        original_w, original_h = image.get_size()
-        scaled_image = pygame.transform.scale(
-            image, (int(original_w * scale), int(original_h * scale))
-        )
-        rotated_image = pygame.transform.rotate(scaled_image, angle)
-        rect = rotated_image.get_rect(center=(x, y))
-        self.manager.screen.blit(rotated_image, rect)
+        # buttons
+        for button in self.buttons:
+            button.draw(self.manager.screen)
 
-    def draw_character(self, image_name, x, y):
+    def draw_character(self, surface, image_name, x, y):
         path = os.path.join(
             BASE_DIR,
             "..",
@@ -195,4 +177,4 @@ class Characters(Screen):
         # Align by the ground positions (x, y - 15 {just so it doesnt stick to the button}).
         rect = image.get_rect(midbottom=(x, y - 15))
 
-        self.manager.screen.blit(image, rect)
+        surface.blit(image, rect)
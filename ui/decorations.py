@@ -0,0 +1,63 @@
+"""Menu decorations — static screen art composited once per screen.
+
+The menus draw a handful of hex tiles (and the end screens a castle),
+each loaded, scaled and rotated. Doing that in every `draw()` meant a
+PNG decode and two transforms per tile per frame. Instead:
+
+  - `decoration(path, angle, scale)` returns the transformed image,
+    built once per process and shared by every screen and visit;
+  - each screen paints everything that never changes (fill colour,
+    decorations, titles) into one opaque surface with `compose()` when
+    it is created, and `draw()` starts with a single blit of it.
+
+Paint order inside the background is the screen's original draw order,
+so the result is pixel-identical to drawing everything every frame.
+"""
+
+import os
+
+import pygame
+
+from visuals.asset_bundle import load_image
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ASSET_BANK = os.path.join(BASE_DIR, "..", "assets", "assetBank")
+HEX_TILES = os.path.join(ASSET_BANK, "Hex Tiles")
+CASTLES = os.path.join(ASSET_BANK, "Castles")
+
+_images = {}  # (path, angle, scale) -> scaled and rotated Surface
+
+
+def decoration(path, angle, scale):
+    """`path` scaled by `scale` then rotated by `angle` degrees (cached)."""
+    key = (path, angle, scale)
+    image = _images.get(key)
+    if image is None:
+        image = load_image(path)
+        if pygame.display.get_surface() is not None:
+            image = image.convert_alpha()
+        w, h = image.get_size()
+        image = pygame.transform.scale(image, (int(w * scale), int(h * scale)))
+        image = pygame.transform.rotate(image, angle)
+        _images[key] = image
+    return image
+
+
+def draw_decoration(surface, path, x, y, angle, scale):
+    """Blit a decoration centred at (x, y)."""
+    image = decoration(path, angle, scale)
+    surface.blit(image, image.get_rect(center=(x, y)))
+
+
+def compose(size, paint):
+    """Opaque surface of `size` painted once by `paint(surface)`."""
+    background = pygame.Surface(size)
+    if pygame.display.get_surface() is not None:
+        background = background.convert()
+    paint(background)
+    return background
+
+
+def clear():
+    """Forget every cached decoration (e.g. after the art changed)."""
+    _images.clear()
@@ -4,25 +4,27 @@ import pygame
 import os
 import ui.button
 from ui.base_screen import Screen
+from ui.decorations import CASTLES, HEX_TILES, compose, draw_decoration
 
 
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
 class EndScreen(Screen):
+    pooled = True
     title = ""
     decoration_images = []
 
     def __init__(self, manager):
         super().__init__(manager)
         self.buttons = self.create_buttons()
+        # title and images never change: painted once per visit
+        self.background = compose((self.manager.width, self.manager.height), self.draw_background)
 
     def create_buttons(self):
         button_height = 50
         button_width = 150
-        button_font = pygame.font.Font(
-            os.path.join(BASE_DIR, '..', 'assets', 'fonts', 'Jersey10-Regular.ttf'), size=30
-        )
+        button_font = self.manager.resources.font(30)
         x = ((self.manager.width / 3) + 50) - (button_width / 2)
         y = (self.manager.height / 2) - (button_height / 2)
         return [ui.button.Button(
@@ -41,17 +43,16 @@ class EndScreen(Screen):
             if button.handle_event(event) == "play_again":
                 self.manager.switch_screen("main_menu")
 
-    def draw(self):
+    def draw_background(self, surface):
         """
-        Draw the welcome screen with title and images.
-        Input: None
+        Paint the title and images of the end screen.
+        Input: surface(pygame.Surface): the background surface
         Output: None
         """
-        self.manager.screen.fill(self.manager.bg_color) #fill covers the previous screen
+        surface.fill(self.manager.bg_color) #fill covers the previous screen
 
         # text
-        pygame.font.init()
-        font = pygame.font.Font(os.path.join(BASE_DIR, '..', 'assets', 'fonts', 'Jersey10-Regular.ttf'), size=210)
+        font = self.manager.resources.font(210)
 
         from ui.game_over import GameOver
 
@@ -61,28 +62,24 @@ class EndScreen(Screen):
             text = font.render("WINNER!", True, self.manager.text_color_green)
 
         rect = text.get_rect(midtop=(1/4 * self.manager.width + 200, self.manager.height // 4)) # middle
-        self.manager.screen.blit(source=text, dest=rect) 
+        surface.blit(source=text, dest=rect) 
         
         # images
         for image_name, x, y, angle, scale in self.decoration_images:
-            self.draw_image(image_name, x, y, angle, scale)
+            if "sprite1" in image_name:
+                path = os.path.join(CASTLES, image_name)
+            else:
+                path = os.path.join(HEX_TILES, image_name)
+                x = x * self.manager.width
+                y = y * self.manager.height
+            draw_decoration(surface, path, x, y, angle, scale)
+
+    def draw(self):
+        self.manager.screen.blit(self.background, (0, 0))
 
         for button in self.buttons:
             button.draw(self.manager.screen)
 
-    def draw_image(self, image_name, x, y, angle, scale):
-        if "sprite1" in image_name:
-            path = os.path.join(BASE_DIR, '..', 'assets', 'assetBank', 'Castles', image_name)
-        else:
-            path = os.path.join(BASE_DIR, '..', 'assets', 'assetBank', 'Hex Tiles', image_name)
-            x = x * self.manager.width
-            y = y * self.manager.height
-        image = pygame.image.load(path)
-        w, h = image.get_size()
-        scaled = pygame.transform.scale(image, (int(w * scale), int(h * scale)))
-        rotated = pygame.transform.rotate(scaled, angle)
-        self.manager.screen.blit(rotated, rotated.get_rect(center=(x, y)))
-
 
 
         
\ No newline at end of file
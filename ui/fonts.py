@@ -0,0 +1,141 @@
+"""Fonts and rendered text, each built once.
+
+`pygame.font.SysFont` scans the system font list and `Font.render`
+rasterises the string, so calling them per frame for text that has not
+changed (HUD stats, inventory labels) is wasted work:
+
+  - FontRegistry loads each (face, size, bold) once;
+  - TextCache keeps rendered surfaces keyed by (font, text, colour,
+    background) and wrapped line layouts keyed by (font, text, width),
+    in LRUs of Config.TEXT_CACHE_SIZE entries. A HUD value is only
+    rendered again when its string changes; the old surface ages out.
+
+Both live in the ScreenManager's ResourceRegistry (`resources.fonts`,
+`resources.text`), shared by every screen.
+"""
+
+from collections import OrderedDict
+
+import pygame
+
+from core.config import Config
+
+
+class FontRegistry:
+    def __init__(self):
+        self._fonts = {}
+
+    def get(self, name, size, bold=False):
+        """System font `name` (e.g. "Arial") at `size`, loaded once."""
+        key = (name, size, bold)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = pygame.font.SysFont(name, size, bold=bold)
+        return font
+
+    def clear(self):
+        self._fonts.clear()
+
+    def __len__(self):
+        return len(self._fonts)
+
+
+def split_long_word(word, font, max_width):
+    """Split one word that is wider than `max_width` into parts that fit."""
+    parts = []
+    current_part = ""
+
+    for char in word:
+        # If the current character makes the line too long, split here
+        candidate = f"{current_part}{char}"
+        if font.size(candidate)[0] <= max_width or not current_part:
+            current_part = candidate
+        else:
+            parts.append(current_part)
+            current_part = char
+
+    if current_part:
+        # Append any remaining characters as the last part
+        parts.append(current_part)
+    return parts
+
+
+def wrap_text(text, font, max_width):
+    """Split `text` into lines that fit within `max_width` pixels."""
+    words = text.split()
+    if not words:
+        return [""]
+
+    wrapped_lines = []
+    current_line = ""
+
+    for word in words:
+        # A word too long for a line by itself is split character by character
+        if font.size(word)[0] > max_width:
+            if current_line:
+                wrapped_lines.append(current_line)
+                current_line = ""
+
+            wrapped_lines.extend(split_long_word(word, font, max_width))
+            continue
+
+        candidate = word if not current_line else f"{current_line} {word}"
+        if font.size(candidate)[0] <= max_width:
+            current_line = candidate
+        else:
+            wrapped_lines.append(current_line)
+            current_line = word
+
+    if current_line:
+        wrapped_lines.append(current_line)
+    return wrapped_lines
+
+
+class TextCache:
+    def __init__(self, max_entries=None):
+        self.max_entries = max_entries or Config.TEXT_CACHE_SIZE
+        self._surfaces = OrderedDict()  # (font, text, color, background) -> Surface
+        self._layouts = OrderedDict()  # (font, text, max_width) -> tuple of lines
+        self.hits = 0
+        self.misses = 0
+
+    def _lookup(self, table, key):
+        value = table.get(key)
+        if value is not None:
+            table.move_to_end(key)
+            self.hits += 1
+        else:
+            self.misses += 1
+        return value
+
+    def _store(self, table, key, value):
+        table[key] = value
+        if len(table) > self.max_entries:
+            table.popitem(last=False)
+        return value
+
+    def render(self, font, text, color, background=None):
+        """Antialiased `font.render(text, True, color, background)`, cached.
+
+        The surface is shared: blit it, never draw on it.
+        """
+        key = (font, text, tuple(color), background and tuple(background))
+        surface = self._lookup(self._surfaces, key)
+        if surface is None:
+            surface = self._store(self._surfaces, key, font.render(text, True, color, background))
+        return surface
+
+    def wrap(self, text, font, max_width):
+        """`wrap_text(text, font, max_width)`, measured once per distinct input."""
+        key = (font, text, max_width)
+        lines = self._lookup(self._layouts, key)
+        if lines is None:
+            lines = self._store(self._layouts, key, tuple(wrap_text(text, font, max_width)))
+        return lines
+
+    def clear(self):
+        self._surfaces.clear()
+        self._layouts.clear()
+
+    def __len__(self):
+        return len(self._surfaces) + len(self._layouts)
@@ -3,6 +3,7 @@ import sys
 import os
 from ui.button import Button
 from ui.base_screen import Screen
+from ui.decorations import HEX_TILES, compose, draw_decoration
 
 # Constants
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))  # directory of this script
@@ -12,33 +13,16 @@ ORIGINAL_SCREEN_W = 1512
 ORIGINAL_SCREEN_H = 982
 
 class GameRules(Screen):
+    pooled = True
+
     def __init__(self, manager):
         super().__init__(manager)
 
-        # Fonts
-        self.title_font = pygame.font.Font(
-            os.path.join(BASE_DIR, "..", "assets", "fonts", "Jersey10-Regular.ttf"),
-        150,
-        )
-        self.goal_font = pygame.font.Font(
-            os.path.join(BASE_DIR, "..", "assets", "fonts", "Jersey10-Regular.ttf"),
-            60,
-        )
-
-        self.rules_font = pygame.font.Font(
-            os.path.join(BASE_DIR, "..", "assets", "fonts", "Jersey10-Regular.ttf"),
-            40,
-        )
-
-        self.rules_font = pygame.font.Font(
-            os.path.join(BASE_DIR, "..", "assets", "fonts", "Jersey10-Regular.ttf"),
-            40,
-        )
-
-        self.button_font = pygame.font.Font(
-            os.path.join(BASE_DIR, "..", "assets", "fonts", "Jersey10-Regular.ttf"),
-            40,
-        )
+        # Fonts (shared through the ScreenManager's resource registry)
+        self.title_font = self.manager.resources.font(150)
+        self.goal_font = self.manager.resources.font(60)
+        self.rules_font = self.manager.resources.font(40)
+        self.button_font = self.manager.resources.font(40)
 
         # green
         self.rules_text = [
@@ -67,6 +51,9 @@ class GameRules(Screen):
 
         self.create_button()
 
+        # decorations, title and rules never change: painted once per visit
+        self.background = compose((self.manager.width, self.manager.height), self.draw_background)
+
         #create button
     def create_button(self):
             self.next_button = Button(
@@ -84,18 +71,18 @@ class GameRules(Screen):
 
             self.buttons = [self.next_button]
 
-    def draw(self):
-
-        self.manager.screen.fill(self.manager.bg_color) #fill covers the previous screen
+    def draw_background(self, surface):
+        surface.fill(self.manager.bg_color) #fill covers the previous screen
 
         # Draw decorative images
         for image_name, x, y, angle, scale in self.decoration_images:
-            self.draw_image(image_name, int(x * self.manager.width), int(y * self.manager.height), angle, scale)
+            draw_decoration(surface, os.path.join(HEX_TILES, image_name),
+                            int(x * self.manager.width), int(y * self.manager.height), angle, scale)
 
         # Title
         title = self.title_font.render("GAME RULES", True, self.manager.text_color_white)
         title_rect = title.get_rect(center=(self.manager.width // 2, 100))
-        self.manager.screen.blit(title, title_rect)
+        surface.blit(title, title_rect)
 
         # Rules text
         start_y = 280
@@ -105,21 +92,15 @@ class GameRules(Screen):
             font = self.goal_font if i == 0 else self.rules_font  
             text_surface = font.render(line, True, self.manager.text_color_green) 
             text_rect = text_surface.get_rect(center=(self.manager.width // 2, start_y + i * line_gap))
-            self.manager.screen.blit(text_surface, text_rect)
+            surface.blit(text_surface, text_rect)
+
+    def draw(self):
+        self.manager.screen.blit(self.background, (0, 0))
 
         # Draw buttons
         for button in self.buttons:
             button.draw(self.manager.screen)
 
-    def draw_image(self, image_name: str, x: int, y: int, angle: int, scale: float):
-        image_path = os.path.join(BASE_DIR, '..', 'assets', 'assetBank', 'Hex Tiles', image_name)
-        image = pygame.image.load(image_path).convert_alpha()
-        original_w, original_h = image.get_size()
-        scaled_image = pygame.transform.scale(image, (int(original_w * scale), int(original_h * scale)))
-        rotated_image = pygame.transform.rotate(scaled_image, angle)
-        rect = rotated_image.get_rect(center=(x, y))
-        self.manager.screen.blit(rotated_image, rect)
-
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
@@ -1,17 +1,21 @@
 import pygame
 from core.config import Config
 from core.hexmath import HexMath
+from core.profiler import profiler
 from database.db_manager import DatabaseManager
 from gameplay.engine import GameEngine
+from gameplay.journal import ChangeKind
 from visuals.asset_manager import AssetManager
 from visuals.renderer import GameRenderer
 from ui.button import Button
 from ui.base_screen import Screen
-import random
 import os
 
 
 class GameWindow(Screen):
+    # Height of the top HUD band (stat bar, level badge, castle progress)
+    HUD_HEIGHT = 100
+
     def __init__(self, manager, slot_id=1, selected_skin=None):
         super().__init__(manager)
 
@@ -53,13 +57,34 @@ class GameWindow(Screen):
         # (check if inventory only has the starting weapon or less)
         if not self.engine.world.chests and len(self.engine.world.player.inventory) <= 1:
             self.engine.world.spawn_chest()
-        self.assets = AssetManager()
-        self.renderer = GameRenderer(self.assets)
-
-        self.font = pygame.font.SysFont("Arial", 18)
-        self.loot_font = pygame.font.SysFont("Arial", 22, bold=True)
+        # One full-resolution asset manager for the HUD, the inventory and
+        # the world sprites (the renderer derives base-resolution tiles
+        # from it), shared through the manager's registry so its sprite
+        # cache survives from one session to the next
+        resources = manager.resources
+        self.assets = resources.get("assets", AssetManager)
+        # The renderer's chunks, atlas and draw lists belong to this world
+        self.renderer = GameRenderer(self.assets, Config.RENDER_SCALE)
+        # Every flash/flip variant of every entity frame is built a slice
+        # per frame from update() (and pinned in the sprite cache) so
+        # combat never allocates surfaces; on later sessions they are
+        # already there
+        self.assets.start_prebake()
+
+        # Fonts are loaded once per process; HUD and inventory strings are
+        # rendered through the shared text cache, so only changed values
+        # are rasterised again
+        self.font = resources.fonts.get("Arial", 18)
+        self.loot_font = resources.fonts.get("Arial", 22, bold=True)
+        self.title_font = resources.fonts.get("Arial", 28, bold=True)
+        self.small_font = resources.fonts.get("Arial", 16)
+        self.text = resources.text
         self.frame_index = 0
-        self.anim_timer = 0
+        # Fixed-timestep simulation: wall time accumulates and is consumed
+        # in Config.SIM_TICK_MS steps; sim_alpha is the leftover fraction
+        # of a tick, used by the renderer to interpolate moves
+        self.sim_accumulator = 0
+        self.sim_alpha = 0.0
         self.inventory_scroll_offset = 0 # tracks how far the inventory list is scrolled
         self.inventory_last_selected_index = self.engine.selected_index
         
@@ -73,6 +98,22 @@ class GameWindow(Screen):
         self.active_loot_notification = None
         self.loot_notification_duration_ms = 1000  # 1 second fade
 
+        # Alive castle monsters per castle id, kept current from the journal
+        self.engine.world.journal.subscribe("hud")
+        self.castle_alive_counts = {}
+        self._recount_castle_monsters()
+
+        # Dirty rectangles reported to ScreenManager (None = flip everything)
+        self._dirty = None
+        self._hud_key = None
+        self._castle_progress = None  # (castle id, defeated, total) shown in the HUD
+        self._loot_rect = None
+        self._last_loot_rect = None
+        self._inventory_was_open = False
+
+        # F3 shows sprite cache occupancy
+        self.show_cache_stats = False
+
     
 
     def handle_event(self, event):
@@ -146,6 +187,11 @@ class GameWindow(Screen):
                 else:
                     self.manager.switch_screen("main_menu")
 
+            # Sprite cache occupancy overlay (debug)
+            elif event.key == pygame.K_F3:
+                self.show_cache_stats = not self.show_cache_stats
+                self.manager.full_redraw = True  # clear the overlay when it closes
+
             # Open/Close Inventory should strictly be a single key press
             elif event.key == pygame.K_i or event.key == pygame.K_TAB:
                 action = "INVENTORY"
@@ -169,63 +215,22 @@ class GameWindow(Screen):
 
     def cleanup(self):
         if hasattr(self, "db") and self.db:
+            self.engine.flush_journal()
             self.db.close()
                     
     def update(self):
-        # Loot notifications: per-frame (not tied to 50ms anim tick) so fade is smooth
-        self._update_loot_notifications(self.manager.clock.get_time())
-
-        # Animation tick
-        self.anim_timer += self.manager.clock.get_time()
-        if self.anim_timer > 50:
-            self.anim_timer = 0
-            self.frame_index += 1
-
-            # player animation
-            player = self.engine.world.player
-            if player:
-                player.update_animation(self.assets)
-
-            # Update all monnster's sprite frames and handle death cleanup
-            monsters_to_remove = []
-
-            for monster in self.engine.world.monsters:
-                monster.update_animation(self.assets)
-
-                if getattr(monster, "death_finished", False):
-                    self.engine.drop_monster_loot(monster)
+        if self.assets.prebaking:
+            with profiler.phase("prebake"):
+                self.assets.prebake_step()
 
-                if getattr(monster, "remove_after_death", False):
-                    monsters_to_remove.append(monster)
-
-            for monster in monsters_to_remove:
-                if monster in self.engine.world.monsters:
-                    self.engine.world.monsters.remove(monster)
-
-            # Update all assistant's sprite frames and handle death cleanup
-            assistants_to_remove = []
-
-            for assistant in getattr(self.engine.world, "assistants", []):
-                assistant.update_animation(self.assets)
-
-                if getattr(assistant, "remove_after_death", False):
-                    assistants_to_remove.append(assistant)
-
-            for assistant in assistants_to_remove:
-                if assistant in self.engine.world.assistants:
-                    self.engine.world.assistants.remove(assistant)
+        # Loot notifications: per-frame (not tied to the simulation tick) so fade is smooth
+        self._update_loot_notifications(self.manager.clock.get_time())
 
-            # Chest animations + despawn after opening
-            chests_to_remove = []
-            for chest in self.engine.world.chests:
-                chest.update_animation(self.assets)
-                if chest.remove_after_open:
-                    chests_to_remove.append(chest)
-            for chest in chests_to_remove:
-                self.engine.world.chests.remove(chest)
+        is_inventory_open = getattr(self.engine, "show_inventory", False)
 
-            if hasattr(self.engine.world, "update_vfx"):
-                self.engine.world.update_vfx()
+        # Simulation ticks: animations, loot drops, death cleanup, VFX and
+        # (unless the inventory pauses the world) monster/assistant AI
+        self._run_simulation(not is_inventory_open)
 
         # Implement real-time ARPG 
         player = self.engine.world.player
@@ -234,7 +239,6 @@ class GameWindow(Screen):
         
         # Check current status
         is_player_animating = getattr(player, "is_moving", False) or getattr(player, "is_attacking", False)
-        is_inventory_open = getattr(self.engine, "show_inventory", False)
 
         # Only process game actions if the inventory is closed
         if not is_inventory_open:
@@ -302,51 +306,50 @@ class GameWindow(Screen):
                         
                         return
 
-            # Independent Monster AI Handling
-            for monster in self.engine.world.monsters:
-                if not monster.is_alive():
-                    continue
-
-                is_monster_animating = getattr(monster, "is_moving", False) or monster.anim_state in ("move", "attack", "hit")
-                if is_monster_animating:
-                    continue
-
-                # Initialize real-time action timer 
-                if not hasattr(monster, "rt_action_timer"):
-                    monster.rt_action_timer = random.randint(30, 40) 
-                
-                monster.rt_action_timer -= 1
-
-                # Trigger monster AI decision if timer reaches zero
-                if monster.rt_action_timer <= 0:
+    def _run_simulation(self, run_ai):
+        """Run as many fixed simulation ticks as the elapsed wall time covers.
 
-                    monster.decide_and_act(self.engine.world, player)
-                    monster.rt_action_timer = random.randint(30, 40)
-            
-            # Independent Assistant AI Handling
-            for assistant in getattr(self.engine.world, "assistants", []):
-                if not assistant.is_alive():
-                    continue
-
-                # Skip if the assistant is currently performing an action
-                is_busy = getattr(assistant, "is_moving", False) or assistant.anim_state in ("move", "attack", "hit")
-                if is_busy:
-                    continue
-
-                # Initialize or decrement the real-time action timer
-                if not hasattr(assistant, "rt_action_timer"):
-                    # Slightly different interval than monsters to prevent synchronized movement
-                    assistant.rt_action_timer = random.randint(25, 35) 
-                
-                assistant.rt_action_timer -= 1
+        At most Config.MAX_SIM_STEPS ticks run per frame; anything beyond
+        that (a long hitch or loading a save) is dropped instead of making
+        the world fast-forward to catch up.
+        """
+        tick_ms = Config.SIM_TICK_MS
+        self.sim_accumulator += self.manager.clock.get_time()
 
-                # Execute AI decision-making when timer hits zero
-                if assistant.rt_action_timer <= 0:
-                    # Assistant AI logic: Follow player or attack nearby monsters
-                    assistant.decide_and_act(self.engine.world, player)
-                    
-                    # Reset timer for the next action cycle
-                    assistant.rt_action_timer = random.randint(25, 35)
+        steps = 0
+        while self.sim_accumulator >= tick_ms and steps < Config.MAX_SIM_STEPS:
+            self.sim_accumulator -= tick_ms
+            self.frame_index += 1
+            self.engine.tick(self.assets, run_ai=run_ai)
+            steps += 1
+
+        if self.sim_accumulator >= tick_ms:
+            self.sim_accumulator %= tick_ms
+
+        self.sim_alpha = self.sim_accumulator / tick_ms
+
+    def _recount_castle_monsters(self):
+        counts = {}
+        for m in self.engine.world.monsters:
+            castle_id = getattr(m, "castle_id", None)
+            if castle_id is not None and m.is_alive():
+                counts[castle_id] = counts.get(castle_id, 0) + 1
+        self.castle_alive_counts = counts
+
+    def _sync_castle_counts(self):
+        """Apply spawn/death changes to the castle counts instead of rescanning."""
+        counts = self.castle_alive_counts
+        for change in self.engine.world.journal.drain("hud"):
+            if change.kind is ChangeKind.RESYNC:
+                self._recount_castle_monsters()
+                return
+            castle_id = getattr(change.target, "castle_id", None)
+            if castle_id is None:
+                continue
+            if change.kind is ChangeKind.ENTITY_SPAWNED and change.target.is_alive():
+                counts[castle_id] = counts.get(castle_id, 0) + 1
+            elif change.kind is ChangeKind.ENTITY_DIED:
+                counts[castle_id] = max(0, counts.get(castle_id, 0) - 1)
 
     def _update_loot_notifications(self, dt_ms):
         """Advance the active notification and pull the next one off the queue."""
@@ -368,6 +371,7 @@ class GameWindow(Screen):
     def _draw_loot_notification(self):
         """Draw the active floating loot text above the player with a fade."""
         notif = self.active_loot_notification
+        self._loot_rect = None
         if notif is None:
             return
 
@@ -378,9 +382,7 @@ class GameWindow(Screen):
         # Rise a little as it fades (10px over the full duration)
         y_offset = int(progress * 10)
 
-        text_surf = self.loot_font.render(
-            notif["text"], True, (255, 236, 140)
-        )
+        text_surf = self.text.render(self.loot_font, notif["text"], (255, 236, 140))
         # Per-pixel alpha requires a scratch surface
         faded = pygame.Surface(text_surf.get_size(), pygame.SRCALPHA)
         faded.blit(text_surf, (0, 0))
@@ -392,21 +394,88 @@ class GameWindow(Screen):
         cy = self.manager.screen.get_height() // 2
         rect = faded.get_rect(center=(cx, cy - 80 - y_offset))
         self.manager.screen.blit(faded, rect)
+        self._loot_rect = rect
 
     def draw(self):
-        self.update()
+        with profiler.phase("update"):
+            self.update()
         # Render World
-        self.renderer.render(self.manager.screen, self.engine.world, self.frame_index)
+        with profiler.phase("render"):
+            self.renderer.render(
+                self.manager.screen, self.engine.world, self.frame_index, self.sim_alpha
+            )
 
         # Render UI Overlay
-        self._draw_ui()
+        with profiler.phase("hud"):
+            self._draw_ui()
 
-        # Loot pickup text (drawn after world, before inventory overlay)
-        self._draw_loot_notification()
+            # Loot pickup text (drawn after world, before inventory overlay)
+            self._draw_loot_notification()
 
         # inventory
         if self.engine.show_inventory:
-            self._draw_inventory()
+            with profiler.phase("inventory"):
+                self._draw_inventory()
+
+        if self.show_cache_stats:
+            self._draw_cache_stats()
+
+        self._dirty = self._collect_dirty_rects()
+
+    def dirty_rects(self):
+        return self._dirty
+
+    def _collect_dirty_rects(self):
+        """World blits that changed, plus the HUD band and loot text when they did.
+
+        Falls back to a full flip (None) when the renderer asks for one or
+        while the inventory overlay is (or just was) open.
+        """
+        world_rects = self.renderer.dirty_rects
+        inventory_open = bool(self.engine.show_inventory)
+        full = (
+            world_rects is None
+            or inventory_open
+            or self._inventory_was_open
+            or getattr(self, "show_cache_stats", False)
+        )
+        self._inventory_was_open = inventory_open
+
+        hud_key = self._current_hud_key()
+        hud_changed = hud_key != self._hud_key
+        self._hud_key = hud_key
+
+        loot_rects = [r for r in (self._last_loot_rect, self._loot_rect) if r]
+        self._last_loot_rect = self._loot_rect
+
+        if full:
+            return None
+        rects = list(world_rects) + loot_rects
+        if hud_changed:
+            rects.append(pygame.Rect(0, 0, Config.WINDOW_WIDTH, self.HUD_HEIGHT))
+        return rects
+
+    def _current_hud_key(self):
+        """Everything the top HUD band shows; it is only re-sent when this changes."""
+        p = self.engine.world.player
+        if not p:
+            return None
+        return (
+            p.hp, p.max_hp, p.hunger, p.max_hunger,
+            p.total_damage, p.total_defense, bool(p.equipment.get("weapon")),
+            p.q, p.r, getattr(p, "hearts", 0),
+            self.engine.world.current_level, self._castle_progress,
+        )
+
+    def _draw_cache_stats(self):
+        """Debug overlay: sprite cache entries, memory and hit/miss/evict counters."""
+        lines = [self.assets.cache.report()]
+        y = Config.WINDOW_HEIGHT - 24 * len(lines) - 10
+        for line in lines:
+            # counters change every frame: not worth caching
+            surf = self.font.render(line, True, (200, 255, 200), (0, 0, 0))
+            self.manager.screen.blit(surf, (10, y))
+            y += 24
 
     # Helper function which draws a rounded rectangle, keep all inentory panel box consistent
     def _draw_panel_box(self, rect, fill, border, border_width=2):
@@ -421,20 +490,16 @@ class GameWindow(Screen):
 
     # Top part of inventory page
     def _draw_inventory_header(self, panel_rect, player):
-        # Create two font size for this part
-        title_font = pygame.font.SysFont("Arial", 28, bold=True)
-        small_font = pygame.font.SysFont("Arial", 16)
-
         # Dispaly title, control instruction and player info
-        title = title_font.render("Inventory", True, (236, 228, 204))
-        controls = small_font.render(
+        title = self.text.render(self.title_font, "Inventory", (236, 228, 204))
+        controls = self.text.render(
+            self.small_font,
             "1 left click: to select   2 left clicks/F: to Equip/Unequip   Wheel: Scroll   I/ESC: Close",
-            True,
             (162, 169, 178),
         )
-        summary = self.font.render(
+        summary = self.text.render(
+            self.font,
             f"ATK: {player.total_damage}   DEF: {player.total_defense}",
-            True,
             (162, 204, 198),
         )
 
@@ -448,15 +513,15 @@ class GameWindow(Screen):
         self._draw_panel_box(rect, (31, 34, 40), (84, 90, 98))
 
         # Title
-        list_title = self.font.render("Items", True, (210, 214, 220))
+        list_title = self.text.render(self.font, "Items", (210, 214, 220))
         self.manager.screen.blit(list_title, (rect.x + 16, rect.y + 12))
 
         # Empty state
         if not items:
             self.inventory_scroll_offset = 0
             self.inventory_last_selected_index = self.engine.selected_index
-            empty = self.font.render("Your inventory is empty.", True, (145, 150, 158))
-            hint = self.font.render("Pick up items to see them here.", True, (105, 112, 121))
+            empty = self.text.render(self.font, "Your inventory is empty.", (145, 150, 158))
+            hint = self.text.render(self.font, "Pick up items to see them here.", (105, 112, 121))
             self.manager.screen.blit(empty, (rect.x + 16, rect.y + 52))
             self.manager.screen.blit(hint, (rect.x + 16, rect.y + 78))
             return
@@ -490,11 +555,7 @@ class GameWindow(Screen):
         if len(items) > visible_count:
             # Show scroll range indicator
             end_item = min(len(items), self.inventory_scroll_offset + visible_count)
-            range_text = self.font.render(
-                f"{end_item} / {len(items)}",
-                True,
-                (145, 150, 158),
-            )
+            range_text = self.text.render(self.font, f"{end_item} / {len(items)}", (145, 150, 158))
             self.manager.screen.blit(
                 range_text,
                 (rect.right - range_text.get_width() - 16, rect.y + 12),
@@ -546,7 +607,7 @@ class GameWindow(Screen):
                 letter = item.name[0].upper()
 
                 # Draw the letter in the center of the icon
-                letter_surf = self.font.render(letter, True, (100, 105, 115))
+                letter_surf = self.text.render(self.font, letter, (100, 105, 115))
                 letter_rect = letter_surf.get_rect(center=icon_rect.center)
                 self.manager.screen.blit(letter_surf, letter_rect)
 
@@ -558,13 +619,13 @@ class GameWindow(Screen):
             show_quantity = item.quantity > 1 and not item.is_equippable
             qty_text = f" x{item.quantity}" if show_quantity else ""
             
-            name = self.font.render(f"{item.name}{qty_text}", True, name_color)
+            name = self.text.render(self.font, f"{item.name}{qty_text}", name_color)
             meta_bits = [item.type.title()]
             if item.is_equippable and item.slot:
                 meta_bits.append(item.slot.title())
             if item.equipped:
                 meta_bits.append("Equipped")
-            meta = self.font.render("  |  ".join(meta_bits), True, meta_color)
+            meta = self.text.render(self.font, "  |  ".join(meta_bits), meta_color)
 
             self.manager.screen.blit(name, (row_rect.x + text_x_offset, row_rect.y + 10))
             self.manager.screen.blit(meta, (row_rect.x + text_x_offset, row_rect.y + 28))
@@ -573,7 +634,7 @@ class GameWindow(Screen):
     def _draw_equipment_summary(self, rect, player):
         self._draw_panel_box(rect, (31, 34, 40), (84, 90, 98))
 
-        title = self.font.render("Equipped", True, (210, 214, 220))
+        title = self.text.render(self.font, "Equipped", (210, 214, 220))
         self.manager.screen.blit(title, (rect.x + 16, rect.y + 12))
 
         # Define display labels for each equipment slot
@@ -597,11 +658,7 @@ class GameWindow(Screen):
                 label = "(No Weapon Equipped)"
                 color = (255, 120, 120) # Red warning
             
-            slot_surf = self.font.render(
-                f"{slot_labels[slot_name]}: {label}",
-                True,
-                color,
-            )
+            slot_surf = self.text.render(self.font, f"{slot_labels[slot_name]}: {label}", color)
             self.manager.screen.blit(slot_surf, (rect.x + 16, line_y))
             line_y += 28
 
@@ -637,66 +694,20 @@ class GameWindow(Screen):
         return lines
 
     def _wrap_text(self, text, font, max_width):
-        # word-wrapping function that splits text into lines that fit within max_width
-        words = text.split()
-        if not words:
-            return [""]
-
-        wrapped_lines = []
-        current_line = ""
-
-        for word in words:
-            # If a single word is too long to fit on a line by itself, we need to split it character by character
-            if font.size(word)[0] > max_width:
-                if current_line:
-                    wrapped_lines.append(current_line)
-                    current_line = ""
-
-                wrapped_lines.extend(self._split_long_word(word, font, max_width))
-                continue
-
-            candidate = word if not current_line else f"{current_line} {word}"
-            if font.size(candidate)[0] <= max_width:
-                current_line = candidate
-            else:
-                wrapped_lines.append(current_line)
-                current_line = word
-
-        if current_line:
-            # Append any remaining text as the last line
-            wrapped_lines.append(current_line)
-        return wrapped_lines
-
-    def _split_long_word(self, word, font, max_width):
-        # Split a single long word into parts that fit within max_width
-        parts = []
-        current_part = ""
-
-        for char in word:
-            # If the current character makes the line too long, split here
-            candidate = f"{current_part}{char}"
-            if font.size(candidate)[0] <= max_width or not current_part:
-                current_part = candidate
-            else:
-                parts.append(current_part)
-                current_part = char
-
-        if current_part:
-            # Append any remaining characters as the last part
-            parts.append(current_part)
-        return parts
+        # word-wrapping into lines that fit within max_width, measured once per text
+        return self.text.wrap(text, font, max_width)
 
     # Right bottom of inventory page
     def _draw_selected_item_details(self, rect, item):
         self._draw_panel_box(rect, (31, 34, 40), (84, 90, 98))
 
-        title = self.font.render("Details", True, (210, 214, 220))
+        title = self.text.render(self.font, "Details", (210, 214, 220))
         self.manager.screen.blit(title, (rect.x + 16, rect.y + 12))
 
         # If an item is selected, display its name, type and details. Otherwise show a hint to select an item
         if item:
-            name = self.font.render(item.name, True, (236, 228, 204))
-            item_type = self.font.render(item.type.title(), True, (244, 214, 147))
+            name = self.text.render(self.font, item.name, (236, 228, 204))
+            item_type = self.text.render(self.font, item.type.title(), (244, 214, 147))
             self.manager.screen.blit(name, (rect.x + 16, rect.y + 44))
             self.manager.screen.blit(item_type, (rect.x + 16, rect.y + 68))
             line_y = rect.y + 102
@@ -736,7 +747,7 @@ class GameWindow(Screen):
                     self.manager.screen.blit(icon_img, (rect.x + 16, icon_y))
                     icon_img = None # Only draw icon once per logical line
                 
-                surf = self.font.render(wrapped_line, True, color)
+                surf = self.text.render(self.font, wrapped_line, color)
                 self.manager.screen.blit(surf, (text_x, line_y))
                 line_y += line_height
 
@@ -749,18 +760,18 @@ class GameWindow(Screen):
         # Simple Stat Bar
         pygame.draw.rect(self.manager.screen, (30, 30, 30), (0, 0, Config.WINDOW_WIDTH, 40))
 
-        hp_text = self.font.render(f"HP: {p.hp}/{p.max_hp}", True, (255, 80, 80))
-        hunger_text = self.font.render(
-            f"Hunger: {p.hunger}/{p.max_hunger}", True, (255, 160, 50)
+        hp_text = self.text.render(self.font, f"HP: {p.hp}/{p.max_hp}", (255, 80, 80))
+        hunger_text = self.text.render(
+            self.font, f"Hunger: {p.hunger}/{p.max_hunger}", (255, 160, 50)
         )
-        dmg_text = self.font.render(f"ATK: {p.total_damage}", True, (255, 200, 100))
+        dmg_text = self.text.render(self.font, f"ATK: {p.total_damage}", (255, 200, 100))
         # Add unarmed warning to HUD if no weapon
         unarmed_warning = None
         if not p.equipment.get("weapon"):
-            unarmed_warning = self.font.render("(Unarmed!)", True, (255, 100, 100))
+            unarmed_warning = self.text.render(self.font, "(Unarmed!)", (255, 100, 100))
 
-        def_text = self.font.render(f"DEF: {p.total_defense}", True, (100, 200, 255))
-        loc_text = self.font.render(f"Q:{p.q} R:{p.r}", True, (200, 200, 200))
+        def_text = self.text.render(self.font, f"DEF: {p.total_defense}", (100, 200, 255))
+        loc_text = self.text.render(self.font, f"Q:{p.q} R:{p.r}", (200, 200, 200))
 
         self.manager.screen.blit(hp_text, (20, 10))
         self.manager.screen.blit(hunger_text, (150, 10))
@@ -795,13 +806,15 @@ class GameWindow(Screen):
         pygame.draw.rect(self.manager.screen, border_color, badge_rect, 3, border_radius=12)
 
         # Text
-        level_text = self.font.render(f"LEVEL {level}", True, text_color)
+        level_text = self.text.render(self.font, f"LEVEL {level}", text_color)
 
         # Center text
         text_rect = level_text.get_rect(center=badge_rect.center)
         self.manager.screen.blit(level_text, text_rect)
 
         # Castle Progress HUD
+        self._sync_castle_counts()
+        self._castle_progress = None
         nearby_unconquered_castles = []
         for c in self.engine.world.castles:
             if c.level == self.engine.world.current_level and c.is_spawned and not c.is_conquered:
@@ -813,10 +826,11 @@ class GameWindow(Screen):
             target_castle = nearby_unconquered_castles[0]
             
             total_monsters = len(target_castle.spawn_points)
-            alive_monsters = len([m for m in self.engine.world.monsters if m.castle_id == target_castle.id and m.is_alive()])
+            alive_monsters = self.castle_alive_counts.get(target_castle.id, 0)
             defeated_monsters = max(0, total_monsters - alive_monsters)
+            self._castle_progress = (target_castle.id, defeated_monsters, total_monsters)
             
-            progress_text = self.font.render(f"Castle: {defeated_monsters}/{total_monsters} Monsters Defeated", True, (255, 236, 140))
+            progress_text = self.text.render(self.font, f"Castle: {defeated_monsters}/{total_monsters} Monsters Defeated", (255, 236, 140))
             
             bar_w = max(300, progress_text.get_width() + 40)
             bar_h = 40
@@ -855,11 +869,13 @@ class GameWindow(Screen):
 
     # Inventory screen with 3 sections
     def _draw_inventory(self):
-        # Semi-transparent dark overlay
-        overlay = pygame.Surface(
-            (Config.WINDOW_WIDTH, Config.WINDOW_HEIGHT), pygame.SRCALPHA
-        )
-        overlay.fill((0, 0, 0, 160))
+        # Semi-transparent dark overlay (built once per window size)
+        size = (Config.WINDOW_WIDTH, Config.WINDOW_HEIGHT)
+        overlay = getattr(self, "_inventory_overlay", None)
+        if overlay is None or overlay.get_size() != size:
+            overlay = pygame.Surface(size, pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, 160))
+            self._inventory_overlay = overlay
         self.manager.screen.blit(overlay, (0, 0))
 
         # Main panel
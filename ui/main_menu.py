@@ -3,6 +3,7 @@ import sys
 import os
 from ui.button import Button
 from ui.base_screen import Screen
+from ui.decorations import HEX_TILES, compose, draw_decoration
 
 # Constants
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))  # directory of this script
@@ -13,6 +14,8 @@ ORIGINAL_SCREEN_H = 982
 
 
 class MainMenu(Screen):
+    pooled = True
+
     def __init__(self, manager):
         super().__init__(manager)
      
@@ -31,8 +34,8 @@ class MainMenu(Screen):
 
          # text and font
         pygame.font.init()
-        self.title_font = pygame.font.Font(os.path.join(BASE_DIR, '..', 'assets', 'fonts', 'Jersey10-Regular.ttf'), size=150)
-        self.button_font = pygame.font.Font(os.path.join(BASE_DIR, '..', 'assets', 'fonts', 'Jersey10-Regular.ttf'), size=50)
+        self.title_font = self.manager.resources.font(150)
+        self.button_font = self.manager.resources.font(50)
 
         # Button sizes
         self.button_width = 420
@@ -42,6 +45,9 @@ class MainMenu(Screen):
         # Create buttons
         self.create_button()
 
+        # decorations and title never change: painted once per visit
+        self.background = compose((self.manager.width, self.manager.height), self.draw_background)
+
     def create_button(self):
         center_x = self.manager.width // 2
         self.title_y = 68
@@ -92,36 +98,24 @@ class MainMenu(Screen):
 
         self.buttons = [self.play_button, self.rules_button, self.quit_button]
 
-    def draw_image(self, image_name: str, x: int, y: int, angle: int, scale: float):
+    def draw_background(self, surface):
         """
-        Draw image on the screen.
+        Paint the static part of the menu (fill, decorations, title).
         """
-        image_path = os.path.join(BASE_DIR, '..', 'assets', 'assetBank', 'Hex Tiles', image_name)
-
-        image = pygame.image.load(image_path).convert_alpha()
-
-        original_w, original_h = image.get_size()
-        scaled_image = pygame.transform.scale(
-            image, (int(original_w * scale), int(original_h * scale))
-        )
-        rotated_image = pygame.transform.rotate(scaled_image, angle)
-        rect = rotated_image.get_rect(center=(x, y))
-
-        self.manager.screen.blit(rotated_image, rect)
-
-    def draw(self):
-        self.manager.screen.fill(self.manager.bg_color)
+        surface.fill(self.manager.bg_color)
 
         # Draw decorative images
         for image_name, x, y, angle, scale in self.decoration_images:
-            self.draw_image(image_name, int(x * self.manager.width), int(y * self.manager.height), angle, scale)
-
-
+            draw_decoration(surface, os.path.join(HEX_TILES, image_name),
+                            int(x * self.manager.width), int(y * self.manager.height), angle, scale)
 
         # Main menu title
         title = self.title_font.render("MAIN MENU", True, self.manager.text_color_green)
         title_rect = title.get_rect(center=(self.manager.width // 2, 120))
-        self.manager.screen.blit(title, title_rect)
+        surface.blit(title, title_rect)
+
+    def draw(self):
+        self.manager.screen.blit(self.background, (0, 0))
 
         # Draw buttons
         for button in self.buttons:
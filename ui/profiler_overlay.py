@@ -0,0 +1,35 @@
+import pygame
+from core.profiler import profiler
+
+
+# F2 overlay: p50/p95/p99 (ms) of every profiled phase over the buffered frames
+class ProfilerOverlay:
+    REFRESH_FRAMES = 15  # percentiles are re-sorted a few times per second, not every frame
+
+    def __init__(self):
+        self.font = None
+        self._lines = []
+        self._age = self.REFRESH_FRAMES
+
+    def draw(self, screen):
+        if self.font is None:
+            self.font = pygame.font.SysFont("Consolas", 16)
+
+        self._age += 1
+        if self._age >= self.REFRESH_FRAMES:
+            self._age = 0
+            self._lines = [f"{'phase':<16}{'p50':>8}{'p95':>8}{'p99':>8}"]
+            for name, (p50, p95, p99) in profiler.summary().items():
+                self._lines.append(f"{name:<16}{p50:8.2f}{p95:8.2f}{p99:8.2f}")
+            self._lines.append(f"{len(profiler.samples)} frames")
+
+        line_h = 18
+        box = pygame.Rect(10, 110, 360, line_h * len(self._lines) + 12)
+        panel = pygame.Surface(box.size, pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 180))
+        screen.blit(panel, box)
+
+        y = box.y + 6
+        for line in self._lines:
+            screen.blit(self.font.render(line, True, (200, 255, 200)), (box.x + 8, y))
+            y += line_h
@@ -0,0 +1,55 @@
+"""Shared screen resources — created once, owned by the ScreenManager.
+
+ScreenManager creates a screen object on every switch, so anything a
+screen built in `__init__` (fonts, asset managers and their sprite
+caches) used to be rebuilt on every visit. Screens now ask the
+manager's ResourceRegistry for those objects by key:
+
+    self.assets = manager.resources.get("assets", AssetManager)
+
+and the factory runs only the first time that key is requested. The
+registry lives as long as the ScreenManager, so e.g. the world sprite
+cache (with its prebaked combat variants) survives between sessions.
+Screens keep only per-visit state themselves. Menu fonts are ordinary
+entries, keyed ("font", path, size); system fonts and rendered text
+have their own caches, `fonts` and `text` (see ui/fonts.py). `clear()`
+empties all three.
+"""
+
+import os
+
+import pygame
+
+from ui.fonts import FontRegistry, TextCache
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+MENU_FONT = os.path.join(BASE_DIR, "..", "assets", "fonts", "Jersey10-Regular.ttf")
+
+
+class ResourceRegistry:
+    def __init__(self):
+        self._items = {}
+        self.fonts = FontRegistry()
+        self.text = TextCache()
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def get(self, key, factory):
+        """The object registered under `key`, built by `factory()` on first use."""
+        if key not in self._items:
+            self._items[key] = factory()
+        return self._items[key]
+
+    def font(self, size, path=MENU_FONT):
+        """Shared pygame Font for a font file (the menu font by default) and size."""
+        return self.get(("font", path, size), lambda: pygame.font.Font(path, size))
+
+    def release(self, key):
+        """Drop one resource; the next `get` builds it again."""
+        self._items.pop(key, None)
+
+    def clear(self):
+        self._items.clear()
+        self.fonts.clear()
+        self.text.clear()
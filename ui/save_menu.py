@@ -1,28 +1,27 @@
 import pygame
 import sys
 import os
-import json
 import shutil
-from visuals.asset_manager import AssetManager
+from core.asset_manifest import load_manifest
+from visuals.preloader import preloader
 import ui.button
 
 # state design pattern
 from ui.base_screen import Screen
+from ui.decorations import HEX_TILES, compose, draw_decoration
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
 
 class SaveSelectMenu(Screen):
+    pooled = True
+
     def __init__(self, manager):
         super().__init__(manager)
-        font_path = os.path.join(
-            BASE_DIR, "..", "assets", "fonts", "Jersey10-Regular.ttf"
-        )
-        self.title_font = pygame.font.Font(font_path, 140)
-        self.button_font = pygame.font.Font(font_path, 50)
-        self.confirm_font = pygame.font.Font(font_path, 80)
+        self.title_font = self.manager.resources.font(140)
+        self.button_font = self.manager.resources.font(50)
+        self.confirm_font = self.manager.resources.font(80)
 
-        self.am = AssetManager()
         self._load_skins()
         self.current_skin_idx = 0
 
@@ -46,6 +45,9 @@ class SaveSelectMenu(Screen):
         self.slots = [1, 2, 3]
         self.buttons = []
         self._create_buttons()
+        # slot -> save file exists; refreshed only when a save is created or deleted
+        self.slot_exists = {}
+        self._refresh_slots()
 
         self.decoration_images = [
             ("Water_Duck.png", -365, 75, 5, 2.3999999999999995),
@@ -55,43 +57,48 @@ class SaveSelectMenu(Screen):
             ("Snow_Trees.png", 373, 76, 10, 2.4999999999999996),
             ("Grass_Plants2.png", 470, 145, 25, 1.5999999999999996),
         ]
+        # decorations and title never change: painted once per visit
+        self.background = compose((self.manager.width, self.manager.height), self.draw_background)
+        self.overlay = None  # darkening layer of the delete confirmation
 
-    def draw_image(self, image_name: str, x: int, y: int, angle: int, scale: float):
+    def draw_background(self, surface):
         """
-        Draw image on the screen.
+        Paint the static part of the menu (fill, decorations, title).
         """
-        image_path = os.path.join(
-            BASE_DIR, "..", "assets", "assetBank", "Hex Tiles", image_name
-        )
+        surface.fill(self.bg_color)
+        center_x = self.manager.width // 2
+        for image_name, dx, dy, angle, scale in self.decoration_images:
+            draw_decoration(surface, os.path.join(HEX_TILES, image_name),
+                            center_x + dx, dy, angle, scale)
 
-        image = pygame.image.load(image_path).convert_alpha()
+        # Title
+        title_surf = self.title_font.render("SAVED GAMES", True, self.text_color)
+        title_rect = title_surf.get_rect(center=(self.manager.width // 2, 120))
+        surface.blit(title_surf, title_rect)
 
-        original_w, original_h = image.get_size()
-        scaled_image = pygame.transform.scale(
-            image, (int(original_w * scale), int(original_h * scale))
-        )
-        rotated_image = pygame.transform.rotate(scaled_image, angle)
-        rect = rotated_image.get_rect(center=(x, y))
+    def on_enter(self):
+        # Saves may have been created since the last visit
+        super().on_enter()
+        self.confirm_delete_slot = None
+        self._refresh_slots()
 
-        self.manager.screen.blit(rotated_image, rect)
+    def _refresh_slots(self):
+        for slot in self.slots:
+            self.slot_exists[slot] = os.path.exists(f"game_data_{slot}.db")
 
     def _load_skins(self):
         self.skins = []
-        player_def_dir = "assets/definitions/player"
-        if os.path.exists(player_def_dir):
-            for f in os.listdir(player_def_dir):
-                if f.endswith(".json"):
-                    try:
-                        with open(os.path.join(player_def_dir, f), "r") as jf:
-                            data = json.load(jf)
-                            skin_name = data.get("name", f.replace(".json", ""))
-                            tex = data.get("texture_file")
-                            if not tex and "animations" in data:
-                                tex = data["animations"].get("idle", {}).get("texture")
-                            if tex:
-                                self.skins.append({"name": skin_name, "texture": tex})
-                    except Exception as e:
-                        print(f"Error loading skin {f}: {e}")
+        # Player definitions come parsed from the asset manifest
+        for f, data in load_manifest().definitions("player").items():
+            try:
+                skin_name = data.get("name", f.replace(".json", ""))
+                tex = data.get("texture_file")
+                if not tex and "animations" in data:
+                    tex = data["animations"].get("idle", {}).get("texture")
+                if tex:
+                    self.skins.append({"name": skin_name, "texture": tex})
+            except Exception as e:
+                print(f"Error loading skin {f}: {e}")
 
         if not self.skins:
             self.skins.append({"name": "Default", "texture": None})
@@ -134,23 +141,14 @@ class SaveSelectMenu(Screen):
             )
 
     def draw(self):
-        self.manager.screen.fill(self.bg_color)
-        center_x = self.manager.width // 2
-        for image_name, dx, dy, angle, scale in self.decoration_images:
-            self.draw_image(image_name, center_x + dx, dy, angle, scale)
-
-        # Title
-        title_surf = self.title_font.render("SAVED GAMES", True, self.text_color)
-        title_rect = title_surf.get_rect(center=(self.manager.width // 2, 120))
-        self.manager.screen.blit(title_surf, title_rect)
+        self.manager.screen.blit(self.background, (0, 0))
 
         mouse_pos = pygame.mouse.get_pos()
 
         for btn in self.buttons:
             # Check if the save file exists
             slot = btn["value"]
-            target_db = f"game_data_{slot}.db"
-            file_exists = os.path.exists(target_db)
+            file_exists = self.slot_exists[slot]
 
             rect = btn["rect"]
             is_hover = rect.collidepoint(mouse_pos)
@@ -181,10 +179,11 @@ class SaveSelectMenu(Screen):
 
     def _draw_confirmation(self):
         # Darken background
-        overlay = pygame.Surface((self.manager.width, self.manager.height))
-        overlay.set_alpha(180)
-        overlay.fill((0, 0, 0))
-        self.manager.screen.blit(overlay, (0, 0))
+        if self.overlay is None:
+            self.overlay = pygame.Surface((self.manager.width, self.manager.height))
+            self.overlay.set_alpha(180)
+            self.overlay.fill((0, 0, 0))
+        self.manager.screen.blit(self.overlay, (0, 0))
 
         msg = f"Delete Save Slot {self.confirm_delete_slot}?"
         text_surf = self.confirm_font.render(msg, True, (255, 255, 255))
@@ -242,6 +241,7 @@ class SaveSelectMenu(Screen):
                 print(f"Error deleting {filename}: {e}")
         else:
             print(f"File {filename} does not exist.")
+        self._refresh_slots()
 
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
@@ -265,13 +265,12 @@ class SaveSelectMenu(Screen):
                     for btn in self.buttons:
                         # Check if the save file exists
                         slot = btn["value"]
-                        target_db = f"game_data_{slot}.db"
-                        file_exists = os.path.exists(target_db)
+                        file_exists = self.slot_exists[slot]
 
                         if btn["rect"].collidepoint(event.pos):
                             if btn["type"] == "slot":
                                 target_db = f"game_data_{slot}.db"
-                                is_new_game = not os.path.exists(target_db)
+                                is_new_game = not file_exists
 
                                 if is_new_game:
                                     if os.path.exists("default.db"):
@@ -279,12 +278,15 @@ class SaveSelectMenu(Screen):
                                             f"Creating new save slot {slot} from default.db..."
                                         )
                                         shutil.copy("default.db", target_db)
+                                        self._refresh_slots()
                                     else:
                                         print(
                                             "No default.db found! Starting with empty database."
                                         )
 
                                 self.manager.selected_slot = slot
+                                # start decoding this save's sheets (no-op for the ones already preloaded)
+                                preloader.start_for_save(target_db)
 
                                 if is_new_game:
                                     # Make archer default for now (until we have more characters)
@@ -4,6 +4,8 @@ import os
 from pygame.draw import rect
 
 from ui.base_screen import Screen
+from ui.decorations import HEX_TILES, compose, draw_decoration
+from visuals.preloader import preloader
 
 # Constants
 BASE_DIR = os.path.dirname(os.path.abspath(__file__)) # directory of this script
@@ -12,6 +14,10 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__)) # directory of this script
 ORIGINAL_SCREEN_W = 1536
 ORIGINAL_SCREEN_H = 1024
 
+# the welcome screen stays up at least this long, and waits for the preloader up to MAX_WAIT_MS
+MIN_WAIT_MS = 4000
+MAX_WAIT_MS = 10000
+
 class Welcome(Screen):
     def __init__(self, manager):
         super().__init__(manager)
@@ -36,41 +42,72 @@ class Welcome(Screen):
             "WELCOME",
             "BEYOND"
         ]
+
+        # title and images never change: painted once, only the progress bar is redrawn
+        self.background = compose((self.manager.width, self.manager.height), self.draw_background)
+
+        # decode the sprite sheets of the last played save while the title is up
+        preloader.start_for_save()
     
     def handle_event(self, event):  
         pass
     
-    def draw(self):
+    def draw_background(self, surface):
         """
-        Draw the welcome screen with title and images.
-        Input: None
+        Paint the title and images of the welcome screen.
+        Input: surface(pygame.Surface): the background surface
         Output: None
         """
-        self.manager.screen.fill(self.manager.bg_color) # fill backgroud 
+        surface.fill(self.manager.bg_color) # fill backgroud 
 
-        self.draw_title()
+        self.draw_title(surface)
 
         # images
         for image_name, x, y, angle, scale in self.decoration_images:
             # convert relative x and y to absolute position based on current screen size
-            self.draw_image(image_name, int(x * self.manager.width), int(y * self.manager.height), angle, scale)
+            draw_decoration(surface, os.path.join(HEX_TILES, image_name),
+                            int(x * self.manager.width), int(y * self.manager.height), angle, scale)
+
+    def draw(self):
+        """
+        Draw the welcome screen with title and images.
+        Input: None
+        Output: None
+        """
+        self.manager.screen.blit(self.background, (0, 0))
 
+        self.draw_progress()
 
         # timing logic
         current_time = pygame.time.get_ticks()
         elapsed = current_time - self.manager.start_time
        
-        if elapsed >= 4000:  # 4000 ms = 4 seconds
+        if elapsed >= MIN_WAIT_MS and (not preloader.active or elapsed >= MAX_WAIT_MS):
             self.manager.switch_screen("main_menu")
 
-    def draw_title(self):
+    def draw_progress(self):
         """
-        draw title on the screen
+        draw the asset preloading progress bar at the bottom of the screen
         Input: None
         Output: None
         """
-        pygame.font.init()
-        font = pygame.font.Font(os.path.join(BASE_DIR, '..', 'assets', 'fonts', 'Jersey10-Regular.ttf'), size=210)
+        if not preloader.total:
+            return
+        width = self.manager.width // 3
+        height = 12
+        bar = pygame.Rect((self.manager.width - width) // 2, int(self.manager.height * 0.85), width, height)
+        rect(self.manager.screen, self.manager.text_color_white, bar, 2)
+        filled = bar.inflate(-4, -4)
+        filled.width = int(filled.width * preloader.progress)
+        rect(self.manager.screen, self.manager.text_color_green, filled)
+
+    def draw_title(self, surface):
+        """
+        draw title on the screen
+        Input: surface(pygame.Surface): where to draw it
+        Output: None
+        """
+        font = self.manager.resources.font(210)
         
         rendered_texts = []
         for text in self.texts:
@@ -95,28 +132,5 @@ class Welcome(Screen):
         # loop is used to adjust the y offset
         for text in rendered_texts:
             rect = text.get_rect(midtop=(self.manager.width // 2, y_offset)) # middle
-            self.manager.screen.blit(source=text, dest=rect) 
+            surface.blit(source=text, dest=rect) 
             y_offset += text.get_height() + spacing
-    
-    def draw_image(self, image_name: str, x: int, y: int, angle: int, scale: float):
-        """
-        draw image on the screen
-        Inputs:
-            image_name(str): name of the image file 
-            x(int): x position
-            y(int): y position
-            angle(int): rotation angle in degrees
-            scale(float): scaling factor (e.g., 0.5 for half size, 2 for double size)
-        Output: None
-        """
-        # path
-        image_path = os. path.join(BASE_DIR, '..', 'assets', 'assetBank', 'Hex Tiles', image_name)
-        
-        image = pygame.image.load(image_path)
-        
-        # adjust image
-        original_w, original_h = image.get_size()
-        scaled_image = pygame.transform.scale(image, (int(original_w * scale), int(original_h * scale)))
-        rotated_image = pygame.transform.rotate(scaled_image, angle)
-        rect = rotated_image.get_rect(center=(x, y))
-        self.manager.screen.blit(rotated_image, rect)
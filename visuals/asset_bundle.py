@@ -0,0 +1,200 @@
+"""Asset bundle — every image of `assets/` packed into one memory-mapped file.
+
+Loading loose files costs an `exists` + `open` per PNG, which adds up on
+cold caches and network home directories. `pack()` (run offline, see
+the command at the bottom) writes Config.ASSET_BUNDLE:
+
+    b"HXAB" | version (u32) | index length (u32) | index JSON | payloads
+
+The index maps each image's path relative to the project root
+("assets/assetBank/clouds/Cloud 1.png") to its payload offset (from the
+aligned end of the header), size, decoded width/height, format
+("png", the original file, or "raw", RGBA pixels, larger but never
+decoded) and the size and mtime of the source file. Payloads are
+16-byte aligned.
+
+At runtime the bundle is mmapped once; `load_image(path)` reads from it
+without copying ("raw" payloads become a surface over the mapped bytes)
+and falls back to the loose file when there is no bundle or the image
+is not in it, so development needs no packing step. An entry whose
+loose file has since changed size or mtime is stale: the loose file is
+used instead and a warning to re-pack is printed once.
+"""
+
+import io
+import json
+import mmap
+import os
+import struct
+import sys
+
+import pygame
+
+from core.config import Config
+
+MAGIC = b"HXAB"
+VERSION = 2
+HEADER = struct.Struct("<4sII")
+ALIGN = 16
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def bundle_key(path):
+    """Index name of a file: its path relative to the project root, with '/'."""
+    return os.path.relpath(os.path.abspath(path), ROOT).replace(os.sep, "/")
+
+
+def pack(asset_dir=None, out_path=None, raw=False):
+    """Write every PNG under `asset_dir` into one bundle; returns the entry count."""
+    asset_dir = asset_dir or Config.ASSET_DIR
+    out_path = out_path or Config.ASSET_BUNDLE
+
+    index = {}
+    payloads = []
+    offset = 0
+    for folder, _, files in sorted(os.walk(asset_dir)):
+        for name in sorted(files):
+            if not name.lower().endswith(".png"):
+                continue
+            path = os.path.join(folder, name)
+            try:
+                image = pygame.image.load(path)
+            except (pygame.error, OSError) as e:
+                print(f"Skipping {path}: {e}")
+                continue
+            if raw:
+                data = pygame.image.tobytes(image, "RGBA")
+            else:
+                with open(path, "rb") as f:
+                    data = f.read()
+            stat = os.stat(path)
+            index[bundle_key(path)] = {
+                "offset": offset,
+                "size": len(data),
+                "w": image.get_width(),
+                "h": image.get_height(),
+                "format": "raw" if raw else "png",
+                "src_size": stat.st_size,
+                "src_mtime": stat.st_mtime_ns,
+            }
+            payloads.append(data)
+            offset += len(data) + (-len(data) % ALIGN)
+
+    header = json.dumps(index).encode()
+    padding = -(HEADER.size + len(header)) % ALIGN
+
+    tmp = out_path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(header)))
+        f.write(header)
+        f.write(b"\0" * padding)
+        for data in payloads:
+            f.write(data)
+            f.write(b"\0" * (-len(data) % ALIGN))
+    os.replace(tmp, out_path)
+    return len(index)
+
+
+class AssetBundle:
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, index_len = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self._map.close()
+            raise ValueError(f"{path} is not a version {VERSION} asset bundle")
+        self._view = memoryview(self._map)
+        self.index = json.loads(bytes(self._view[HEADER.size:HEADER.size + index_len]))
+        # Offsets in the index count from the (aligned) end of the header
+        self._base = HEADER.size + index_len
+        self._base += -self._base % ALIGN
+
+    def __contains__(self, path):
+        return bundle_key(path) in self.index
+
+    def is_stale(self, path):
+        """True when the loose file of `path` changed since it was packed."""
+        entry = self.index[bundle_key(path)]
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False  # shipped without loose files
+        return (stat.st_size, stat.st_mtime_ns) != (entry["src_size"], entry["src_mtime"])
+
+    def __len__(self):
+        return len(self.index)
+
+    def info(self, path):
+        """Index entry (offset, size, w, h, format) of `path`, or None."""
+        return self.index.get(bundle_key(path))
+
+    def data(self, path):
+        """Payload of `path` as a memoryview into the mapped file (no copy)."""
+        entry = self.index[bundle_key(path)]
+        start = self._base + entry["offset"]
+        return self._view[start:start + entry["size"]]
+
+    def load(self, path):
+        """Surface for `path` (not converted to the display format)."""
+        entry = self.index[bundle_key(path)]
+        data = self.data(path)
+        if entry["format"] == "raw":
+            return pygame.image.frombuffer(data, (entry["w"], entry["h"]), "RGBA")
+        return pygame.image.load(io.BytesIO(data), bundle_key(path))
+
+
+_bundle = None
+_checked = False
+_fresh = {}  # path -> bundle entry is up to date (checked once per path)
+_warned = False
+
+
+def get_bundle():
+    """The mapped Config.ASSET_BUNDLE, or None (loose files) if there is none."""
+    global _bundle, _checked
+    if not _checked:
+        _checked = True
+        if os.path.exists(Config.ASSET_BUNDLE):
+            try:
+                _bundle = AssetBundle(Config.ASSET_BUNDLE)
+            except (OSError, ValueError) as e:
+                print(f"Ignoring asset bundle: {e}")
+    return _bundle
+
+
+def _in_bundle(path):
+    """The bundle if it has an up-to-date copy of `path`, else None."""
+    global _warned
+    bundle = get_bundle()
+    if bundle is None or path not in bundle:
+        return None
+    fresh = _fresh.get(path)
+    if fresh is None:
+        fresh = _fresh[path] = not bundle.is_stale(path)
+        if not fresh and not _warned:
+            _warned = True
+            print(f"{bundle.path} is out of date ({path} changed), using loose files "
+                  "for changed images; re-run python -m visuals.asset_bundle")
+    return bundle if fresh else None
+
+
+def asset_exists(path):
+    return _in_bundle(path) is not None or os.path.exists(path)
+
+
+def load_image(path):
+    """Image from the bundle if it has an up-to-date copy, else from the loose file."""
+    bundle = _in_bundle(path)
+    if bundle is not None:
+        return bundle.load(path)
+    return pygame.image.load(path)
+
+
+if __name__ == "__main__":
+    # python -m visuals.asset_bundle [--raw] [output]
+    args = sys.argv[1:]
+    use_raw = "--raw" in args
+    args = [a for a in args if a != "--raw"]
+    count = pack(out_path=args[0] if args else None, raw=use_raw)
+    print(f"Packed {count} images into {args[0] if args else Config.ASSET_BUNDLE}")
@@ -1,74 +1,190 @@
+import math
 import os
-import json
+import time
+from collections import deque
+
 import pygame
+from core.asset_manifest import load_manifest
 from core.config import Config
+from visuals.asset_bundle import asset_exists
+from visuals.preloader import preloader
+from visuals.sprite_cache import SpriteCache
+
+
+def make_variant(img, flash_color=None, flipped=False, mini_scale=1.0):
+    """Copy of `img` tinted with `flash_color` (multiply), mirrored and/or shrunk."""
+    if flash_color is not None:
+        img = img.copy()  # make a copy of origin img
+        img.fill(flash_color, special_flags=pygame.BLEND_RGB_MULT)
+
+    if flipped:
+        img = pygame.transform.flip(img, True, False)
+
+    # Get the size after scaling
+    if mini_scale != 1.0:
+        new_w = max(1, int(img.get_width() * mini_scale))
+        new_h = max(1, int(img.get_height() * mini_scale))
+        img = pygame.transform.smoothscale(img, (new_w, new_h))
+    return img
+
+
+class FrameStrip:
+    """Every frame of one (texture, row) animation, pre-scaled.
+
+    Drawing a frame is `strip.frames[tick % strip.count]`. Tinted,
+    mirrored or shrunk copies are built per frame on first use and kept
+    in `variants`; the sprite cache is charged for them as they appear.
+    A strip evicted from the cache stays valid for whoever still holds it,
+    but variants built on it are no longer charged, so holders should
+    re-fetch it once `strip.key not in cache`.
+    """
+
+    __slots__ = ("texture", "row", "frames", "count", "variants", "bytes", "_cache", "key")
+
+    def __init__(self, texture, row, frames, cache=None, key=None):
+        self.texture = texture
+        self.row = row
+        self.frames = frames
+        self.count = len(frames)
+        self.variants = {}  # (flash_color, flipped, mini_scale) -> [surface or None]
+        self.bytes = sum(SpriteCache.surface_bytes(f) for f in frames)
+        self._cache = cache
+        self.key = key
+
+    def frame(self, tick):
+        return self.frames[tick % self.count]
+
+    def variant(self, tick, flash_color=None, flipped=False, mini_scale=1.0):
+        index = tick % self.count
+        if flash_color is None and not flipped and mini_scale == 1.0:
+            return self.frames[index]
+
+        frames = self.variants.get((flash_color, flipped, mini_scale))
+        if frames is None:
+            frames = self.variants[(flash_color, flipped, mini_scale)] = [None] * self.count
+        img = frames[index]
+        if img is not None:
+            return img
+
+        img = frames[index] = make_variant(self.frames[index], flash_color, flipped, mini_scale)
+        size = SpriteCache.surface_bytes(img)
+        self.bytes += size
+        if self._cache is not None:
+            self._cache.grow(self.key, size)
+        return img
+
 
 class AssetManager:
-    def __init__(self):
-        self.cache = {}
+    # Multiply tints used by the renderer when an entity flashes
+    FLASH_POISON = (180, 50, 255)
+    FLASH_DAMAGE = (255, 50, 50)
+    FLASH_HEAL = (50, 255, 50)
+    FLASH_COLORS = (FLASH_POISON, FLASH_DAMAGE, FLASH_HEAL)
+
+    def __init__(self, pixel_scale=1.0):
+        # Multiplies every sprite/tile scale (1.0 in the game: the
+        # renderer asks for base-resolution tiles with a smaller scale)
+        self.pixel_scale = pixel_scale
+        # Sheets, scaled frames and tinted/flipped variants share one
+        # bounded LRU (Config.SPRITE_CACHE_BYTES)
+        self.cache = SpriteCache(on_evict=self._release_sheet)
         self.layouts = {}  # Map: texture_filename -> (scale, y_shift)
         self.anim_metadata = {}  # Map: texture_filename -> {fw, fh, count}
         self.castle_assets = set()
+        # Animation sheets of entities (monsters, players, assistants) ->
+        # extra mini scales their definition declares; their variants are
+        # built up front by start_prebake() / prebake_step()
+        self.entity_textures = {}
+        self._prebake_queue = deque()  # entity textures left to prebake
+        self._baking = None  # [strip, next frame, mini scales] in progress
         self._load_layouts()
 
     def _load_layouts(self):
-        """Scans definition files."""
-        # Using Config.DIRS values
-        search_dirs = list(Config.DIRS.values())
+        """Layouts, animation metadata, castles and entity sheets.
 
-        for d in search_dirs:
-            if not os.path.exists(d):
-                continue
+        Compiled once from the definition files and cached in the asset
+        manifest (core/asset_manifest.py) until a definition changes.
+        """
+        compiled = load_manifest().compiled("asset_layouts", AssetManager._compile_layouts)
 
-            for f in os.listdir(d):
-                if f.endswith(".json"):
-                    try:
-                        with open(os.path.join(d, f), "r") as jf:
-                            data = json.load(jf)
-                            
-                            # Caching metadata for animations
-                            if "animations" in data:
-                                for anim_name, anim_data in data["animations"].items():
-                                    tex = anim_data.get("texture")
-                                    if tex:
-                                        # Per-(texture, row) metadata so one sheet
-                                        # can host multiple animation tracks
-                                        row = anim_data.get("row", 0)
-                                        self.anim_metadata[(tex, row)] = {
-                                            "fw": anim_data.get("fw", 32),
-                                            "fh": anim_data.get("fh", 32),
-                                            "count": anim_data.get("count", 1),
-                                            "scale": data.get("scale", 1.0),
-                                            "x_shift": data.get("x_shift", 0),
-                                            "y_shift": data.get("y_shift", 0),
-                                            "row": row,
-                                        }
-                                        # Legacy single-row lookup still works
-                                        if tex not in self.anim_metadata:
-                                            self.anim_metadata[tex] = self.anim_metadata[(tex, row)]
-                                        self.layouts[tex] = (
-                                            float(data.get("scale", 1.0)),
-                                            int(data.get("x_shift", 0)),
-                                            int(data.get("y_shift", 0)),
-                                            50.0  # Default star_y_offset for non-castle entities
-                                        )
-                            
-                            tex = data.get("texture_file")
-                            if not tex and "animations" in data:
-                                tex = data["animations"].get("idle", {}).get("texture")
-
-                            if tex:
-                                s = data.get("prop_scale") or data.get("scale", 1.0)
-                                x = data.get("prop_x_shift") or data.get("x_shift", 0)
-                                y = data.get("prop_y_shift") or data.get("prop_shift") or data.get("y_shift", 0)
-                                star_y = data.get("star_y_offset", 50.0)
-                                self.layouts[tex] = (float(s), int(x), int(y), float(star_y))
-                                
-                                # Detect castles for separate rendering pass
-                                if data.get("is_castle") or "castle" in f.lower():
-                                    self.castle_assets.add(tex)
-                    except Exception as e:
-                        print(f"Error loading layout {f}: {e}")
+        self.layouts = {tex: tuple(layout) for tex, layout in compiled["layouts"].items()}
+        for tex, row, meta in compiled["anim"]:
+            self.anim_metadata[(tex, row)] = meta
+            # Legacy single-row lookup still works (first track of the sheet)
+            self.anim_metadata.setdefault(tex, meta)
+        self.castle_assets = set(compiled["castles"])
+        self.entity_textures = {
+            tex: tuple(scales) for tex, scales in compiled["entities"].items()
+        }
+
+    @staticmethod
+    def _compile_layouts(manifest):
+        """Scans definition files (JSON-serialisable result, see _load_layouts)."""
+        layouts = {}
+        anim = []  # [texture, row, metadata] in definition order
+        castles = []
+        entities = {}
+
+        for category in Config.DIRS:
+            # Monster/player definitions are entities unless they say otherwise
+            entity_dir = category in ("monster", "player")
+
+            for f, data in manifest.definitions(category).items():
+                try:
+                    is_entity = data.get("is_entity", entity_dir)
+                    mini_scales = data.get("mini_scales", [])
+
+                    # Caching metadata for animations
+                    for anim_name, anim_data in data.get("animations", {}).items():
+                        tex = anim_data.get("texture")
+                        if not tex:
+                            continue
+                        # Per-(texture, row) metadata so one sheet
+                        # can host multiple animation tracks
+                        row = anim_data.get("row", 0)
+                        anim.append([tex, row, {
+                            "fw": anim_data.get("fw", 32),
+                            "fh": anim_data.get("fh", 32),
+                            "count": anim_data.get("count", 1),
+                            "scale": data.get("scale", 1.0),
+                            "x_shift": data.get("x_shift", 0),
+                            "y_shift": data.get("y_shift", 0),
+                            "row": row,
+                        }])
+                        if is_entity and row == 0:
+                            known = entities.get(tex, [])
+                            entities[tex] = sorted(set(known) | set(mini_scales))
+                        layouts[tex] = [
+                            float(data.get("scale", 1.0)),
+                            int(data.get("x_shift", 0)),
+                            int(data.get("y_shift", 0)),
+                            50.0  # Default star_y_offset for non-castle entities
+                        ]
+
+                    tex = data.get("texture_file")
+                    if not tex and "animations" in data:
+                        tex = data["animations"].get("idle", {}).get("texture")
+
+                    if tex:
+                        s = data.get("prop_scale") or data.get("scale", 1.0)
+                        x = data.get("prop_x_shift") or data.get("x_shift", 0)
+                        y = data.get("prop_y_shift") or data.get("prop_shift") or data.get("y_shift", 0)
+                        star_y = data.get("star_y_offset", 50.0)
+                        layouts[tex] = [float(s), int(x), int(y), float(star_y)]
+
+                        # Detect castles for separate rendering pass
+                        if data.get("is_castle") or "castle" in f.lower():
+                            castles.append(tex)
+                except Exception as e:
+                    print(f"Error loading layout {f}: {e}")
+
+        return {"layouts": layouts, "anim": anim, "castles": castles, "entities": entities}
+
+    @staticmethod
+    def _release_sheet(key):
+        # A decoded sheet left the cache: the preloader may queue it again
+        if key[0] == "sheet":
+            preloader.release(os.path.join(Config.ASSET_DIR, key[1]))
 
     def get_layout(self, filename):
         """Returns (scale, x_shift, y_shift, star_y_offset) for a given texture file."""
@@ -77,67 +193,74 @@ class AssetManager:
     def is_castle(self, filename):
         return filename in self.castle_assets
 
-    def get_anim_frame(self, filename, frame_index=0, row=0):
-        """Extracts and scales a specific frame from a sprite sheet.
+    def get_frames(self, filename, row=0):
+        """`FrameStrip` of every frame of one (texture, row) animation.
 
-        `row` selects the horizontal strip inside a multi-row sheet
-        (e.g. chest sheet has 8 rows for 4 colors x 2 states).
+        The whole strip is sliced and scaled in one pass the first time the
+        sheet is touched; entities keep the strip (`entity.anim_frames`)
+        and index it directly. Returns None for unknown or missing sheets.
         """
-        if not filename:
-            return None
-
-        meta_key = (filename, row) if (filename, row) in self.anim_metadata else filename
-        if meta_key not in self.anim_metadata:
-            return self.get_image(filename)  # Fallback to static
+        key = ("strip", filename, row)
+        strip = self.cache.get(key)
+        if strip is not None:
+            return strip
 
-        meta = self.anim_metadata[meta_key]
+        meta = self.anim_metadata.get((filename, row)) or self.anim_metadata.get(filename)
+        if not filename or meta is None:
+            return None
         path = os.path.join(Config.ASSET_DIR, filename)
-
-        # Key includes frame_index + row so we cache each frame individually
-        key = (filename, frame_index, row, "anim")
-        if key in self.cache:
-            return self.cache[key]
-
-        if not os.path.exists(path):
+        if not asset_exists(path):
             return None
 
         try:
             # Helper to load raw sheet
-            if filename not in self.cache:
-                 self.cache[filename] = pygame.image.load(path).convert_alpha()
-
-            sheet = self.cache[filename]
+            sheet = self.cache.get(("sheet", filename))
+            if sheet is None:
+                # Decoded ahead of time by the preloader when possible
+                sheet = self.cache.put(("sheet", filename), preloader.load(path))
 
             fw = meta["fw"]
             fh = meta["fh"]
-            count = meta["count"]
             scale = meta["scale"]
+            target_w = max(1, int(fw * scale * self.pixel_scale))
+            target_h = max(1, int(fh * scale * self.pixel_scale))
 
-            safe_idx = frame_index % max(1, count)
-            x = safe_idx * fw
             y = row * fh
-
-            # Extract subsurface
-            if x + fw > sheet.get_width():
-                x = 0
             if y + fh > sheet.get_height():
                 y = 0
 
-            frame_surf = sheet.subsurface((x, y, fw, fh))
-            
-            # Scale
-            target_w = int(fw * scale)
-            target_h = int(fh * scale)
-            
-            scaled_surf = pygame.transform.scale(frame_surf, (target_w, target_h))
-            
-            self.cache[key] = scaled_surf
-            return scaled_surf
-            
+            frames = []
+            for i in range(max(1, meta["count"])):
+                x = i * fw
+                # Frames past the sheet's edge repeat the first one
+                if x + fw > sheet.get_width():
+                    x = 0
+                frame_surf = sheet.subsurface((x, y, fw, fh))
+                frames.append(pygame.transform.scale(frame_surf, (target_w, target_h)))
         except Exception as e:
             print(f"Anim Error {filename}: {e}")
             return None
 
+        strip = FrameStrip(filename, row, frames, self.cache, key)
+        self.cache.put(key, strip, size=strip.bytes)
+        return strip
+
+    def get_anim_frame(self, filename, frame_index=0, row=0):
+        """Extracts and scales a specific frame from a sprite sheet.
+
+        `row` selects the horizontal strip inside a multi-row sheet
+        (e.g. chest sheet has 8 rows for 4 colors x 2 states).
+        """
+        if not filename:
+            return None
+
+        strip = self.get_frames(filename, row)
+        if strip is not None:
+            return strip.frames[frame_index % strip.count]
+        if filename not in self.anim_metadata and (filename, row) not in self.anim_metadata:
+            return self.get_image(filename)  # Fallback to static
+        return None
+
     def get_image(self, filename, scale=None, scale_to_tile=True):
         if not filename:
             return None
@@ -150,22 +273,26 @@ class AssetManager:
             scale, _, _, _ = self.get_layout(filename)
             
         key = (filename, scale, scale_to_tile)
-        if key in self.cache:
-            return self.cache[key]
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
 
         path = os.path.join(Config.ASSET_DIR, filename)
-        if not os.path.exists(path):
+        if not asset_exists(path):
             return None
 
         try:
-            raw_img = pygame.image.load(path).convert_alpha()
+            # One decoded copy per file, shared by every scale (and sheet users)
+            raw_img = self.cache.get(("sheet", filename))
+            if raw_img is None:
+                raw_img = self.cache.put(("sheet", filename), preloader.load(path))
             
             if scale_to_tile:
                 # Scale relative to hex size
-                target_w = max(1, int(Config.HEX_SIZE * scale))
+                target_w = max(1, int(Config.HEX_SIZE * scale * self.pixel_scale))
                 w, h = raw_img.get_size()
                 ratio = target_w / w
-                target_h = int(h * ratio)
+                target_h = max(1, int(h * ratio))
                 img = pygame.transform.scale(raw_img, (target_w, target_h))
             else:
                 # Use raw size or simple scale multiply if scale != 1.0
@@ -173,10 +300,97 @@ class AssetManager:
                     w, h = raw_img.get_size()
                     img = pygame.transform.scale(raw_img, (int(w*scale), int(h*scale)))
                 else:
-                    img = raw_img
+                    return raw_img  # already cached (and charged) as the sheet
             
-            self.cache[key] = img
-            return img
+            return self.cache.put(key, img)
         except Exception as e:
             print(f"Failed to load {filename}: {e}")
             return None
+
+    def get_variant(self, filename, frame_index=0, flash_color=None,
+                    flipped=False, mini_scale=1.0, row=0, pinned=False):
+        """Animation frame tinted with `flash_color` (multiply), mirrored
+        and/or shrunk by `mini_scale` (see FrameStrip.variant).
+
+        `pinned` keeps a static texture's variant out of LRU eviction;
+        strips are only pinned once fully baked (see start_prebake).
+        """
+        strip = self.get_frames(filename, row)
+        if strip is not None:
+            return strip.variant(frame_index, flash_color, flipped, mini_scale)
+
+        # Static texture (no animation metadata)
+        base = self.get_image(filename)
+        if base is None or (flash_color is None and not flipped and mini_scale == 1.0):
+            return base
+        key = ("variant", filename, flash_color, flipped, mini_scale)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        return self.cache.put(key, make_variant(base, flash_color, flipped, mini_scale), pinned=pinned)
+
+    @property
+    def prebaking(self):
+        return self._baking is not None or bool(self._prebake_queue)
+
+    def start_prebake(self):
+        """Queue every flash/flip/mini variant of every entity frame.
+
+        `prebake_step()` builds them a time slice at a time (GameWindow
+        calls it once per frame), so combat never allocates a tinted or
+        mirrored surface mid-fight. Each fully baked strip is pinned in
+        the sprite cache while pinned memory stays under half its budget;
+        past that, prebaking stops and the rest is built on first use.
+        Strips pinned by an earlier session are skipped.
+        """
+        self._baking = None
+        self._prebake_queue = deque(
+            tex for tex in self.entity_textures
+            if not self.cache.is_pinned(("strip", tex, 0))
+        )
+
+    def prebake_step(self, budget_ms=None):
+        """Bake queued variants until `budget_ms` (default
+        Config.PREBAKE_SLICE_MS) is spent; returns how many surfaces were
+        prepared."""
+        if budget_ms is None:
+            budget_ms = Config.PREBAKE_SLICE_MS
+        deadline = time.perf_counter() + budget_ms / 1000.0
+        flashes = (None,) + self.FLASH_COLORS
+        baked = 0
+        while self.prebaking and time.perf_counter() < deadline:
+            if self._baking is None:
+                tex = self._prebake_queue.popleft()
+                strip = self.get_frames(tex)
+                if strip is not None:  # missing sheet otherwise
+                    self._baking = [strip, 0, (1.0,) + tuple(self.entity_textures[tex])]
+                continue
+
+            strip, frame, scales = self._baking
+            for flash in flashes:
+                for flipped in (False, True):
+                    for mini in scales:
+                        strip.variant(frame, flash, flipped, mini)
+                        baked += 1
+            self._baking[1] += 1
+            if self._baking[1] < strip.count:
+                continue
+
+            # Whole strip baked: pin it only if pinned memory stays in budget
+            self._baking = None
+            if strip.key not in self.cache:
+                continue  # evicted while baking; rebuilt on first use
+            if self.cache.pinned_bytes + strip.bytes > self.cache.budget_bytes // 2:
+                print(f"Prebake stopped with {len(self._prebake_queue)} sprite sheets left (cache budget)")
+                self._prebake_queue.clear()
+                break
+            self.cache.pin(strip.key)
+        return baked
+
+    def prebake_entity_variants(self):
+        """Bake every entity variant now, without a time limit (tests, tools).
+
+        Returns how many surfaces were prepared.
+        """
+        self.start_prebake()
+        return self.prebake_step(math.inf)
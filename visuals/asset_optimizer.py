@@ -0,0 +1,277 @@
+"""Asset optimiser — shrink animation sheets using what the definitions declare.
+
+Build-time tool (`python -m visuals.asset_optimizer [--write DIR] [--report CSV]`).
+For every sheet referenced by an animation in `assets/definitions` it:
+
+  - drops frames past each animation's `count` and rows no animation
+    uses, and packs the remaining cells tightly (rows are renumbered in
+    the definitions);
+  - trims the transparent border shared by all used cells. The trim is
+    symmetric so a frame's centre (where the renderer anchors it) does
+    not move; the crop offset is recorded as `"trim": [x, y]` next to
+    the new `fw`/`fh`;
+  - for monster definitions whose art is drawn smaller than its pixels
+    (`scale` below 1/2), downsamples by the integer factor `k` the art
+    is larger than needed and multiplies the definition's `scale` by
+    `k`, so it is drawn at the same size.
+
+A sheet is only replaced when the new PNG is smaller. Without `--write`
+nothing is written and only the report (bytes and decode time saved per
+sheet) is printed. With it, DIR receives a copy of `assets/` with the
+optimised sheets and definitions, ready to replace the originals.
+Static images are left alone: `get_image` sizes them from their width.
+"""
+
+import copy
+import csv
+import io
+import json
+import os
+import shutil
+import sys
+import time
+
+import pygame
+
+from core.asset_manifest import load_manifest
+from core.config import Config
+
+
+def _png_bytes(surface):
+    out = io.BytesIO()
+    pygame.image.save(surface, out, "sheet.png")
+    return out.getvalue()
+
+
+def decode_ms(data, repeats=3):
+    """Best-of-`repeats` time (ms) to decode PNG bytes."""
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        pygame.image.load(io.BytesIO(data), "sheet.png")
+        elapsed = (time.perf_counter() - start) * 1000.0
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def collect_sheets(definitions):
+    """{texture: [(category, file, animation name)]} over every animation."""
+    sheets = {}
+    for (category, name), data in definitions.items():
+        for anim_name, anim in data.get("animations", {}).items():
+            tex = anim.get("texture")
+            if tex:
+                sheets.setdefault(tex, []).append((category, name, anim_name))
+    return sheets
+
+
+def downscale_factor(data, own_sheets):
+    """Integer factor a monster definition's sheets can be shrunk by (1 = no).
+
+    The world renderer draws sprites at full resolution, `scale` of their
+    pixels, so `k` up to `1 / scale` loses nothing on screen. `k` must
+    divide every frame size so frames stay on whole pixels.
+    """
+    anims = list(data.get("animations", {}).values())
+    scale = float(data.get("scale", 1.0))
+    if not anims or not own_sheets or scale <= 0:
+        return 1
+    # texture_file outside the animations is sized from `scale` by get_image
+    tex = data.get("texture_file")
+    if tex and tex not in {a.get("texture") for a in anims}:
+        return 1
+
+    k = int(1.0 / scale)
+    while k > 1:
+        if all(a.get("fw", 32) % k == 0 and a.get("fh", 32) % k == 0 for a in anims):
+            return k
+        k -= 1
+    return 1
+
+
+def _cell_origin(sheet, fw, fh, row, index):
+    # Same fallbacks as AssetManager.get_frames: cells past an edge use column/row 0
+    x = index * fw
+    if x + fw > sheet.get_width():
+        x = 0
+    y = row * fh
+    if y + fh > sheet.get_height():
+        y = 0
+    return x, y
+
+
+def optimize_sheet(sheet, anims, k=1):
+    """Packed, trimmed (and `k`-downsampled) sheet for the animations using it.
+
+    `anims` are the animation dicts referencing the sheet (same fw/fh).
+    Returns (surface, {old row: new row}, trim (x, y), cell size) or None
+    when the animations disagree on their frame size.
+    """
+    sizes = {(a.get("fw", 32), a.get("fh", 32)) for a in anims}
+    if len(sizes) != 1:
+        return None
+    fw, fh = sizes.pop()
+
+    counts = {}
+    for a in anims:
+        row = a.get("row", 0)
+        counts[row] = max(counts.get(row, 0), max(1, a.get("count", 1)))
+    rows = sorted(counts)
+
+    # Union of the opaque area of every used cell, in cell coordinates
+    box = None
+    for row in rows:
+        for i in range(counts[row]):
+            x, y = _cell_origin(sheet, fw, fh, row, i)
+            rect = sheet.subsurface((x, y, fw, fh)).get_bounding_rect()
+            if rect.width and rect.height:
+                box = rect if box is None else box.union(rect)
+    if box is None:
+        box = pygame.Rect(0, 0, fw, fh)
+
+    # Symmetric trim keeps the frame centre; cells stay divisible by k
+    trim_x = min(box.left, fw - box.right)
+    trim_y = min(box.top, fh - box.bottom)
+    while trim_x and (fw - 2 * trim_x) % k:
+        trim_x -= 1
+    while trim_y and (fh - 2 * trim_y) % k:
+        trim_y -= 1
+    cw, ch = fw - 2 * trim_x, fh - 2 * trim_y
+
+    columns = max(counts.values())
+    packed = pygame.Surface((cw * columns, ch * len(rows)), pygame.SRCALPHA)
+    new_rows = {}
+    for new_row, row in enumerate(rows):
+        new_rows[row] = new_row
+        for i in range(counts[row]):
+            x, y = _cell_origin(sheet, fw, fh, row, i)
+            packed.blit(sheet.subsurface((x + trim_x, y + trim_y, cw, ch)), (i * cw, new_row * ch))
+
+    if k > 1:
+        packed = pygame.transform.scale(packed, (packed.get_width() // k, packed.get_height() // k))
+    return packed, new_rows, (trim_x, trim_y), (cw // k, ch // k)
+
+
+def optimize(write_dir=None, report_path=None):
+    """Optimise every animation sheet; returns the report rows."""
+    manifest = load_manifest()
+    definitions = {}
+    for category in Config.DIRS:
+        for name, data in manifest.definitions(category).items():
+            definitions[(category, name)] = copy.deepcopy(data)
+
+    sheets = collect_sheets(definitions)
+    owners = {tex: {(c, n) for c, n, _ in refs} for tex, refs in sheets.items()}
+
+    # Downsampling changes a definition's scale, so all of its sheets
+    # must be its own (no other definition reading them at the old size)
+    factors = {}
+    for key, data in definitions.items():
+        own = [a.get("texture") for a in data.get("animations", {}).values()]
+        own_sheets = all(owners.get(tex) == {key} for tex in own if tex)
+        if key[0] == "monster" and data.get("is_entity", True):
+            factors[key] = downscale_factor(data, own_sheets)
+        else:
+            factors[key] = 1
+
+    report = []
+    changed_sheets = {}
+    changed_defs = set()
+    for tex, refs in sorted(sheets.items()):
+        path = os.path.join(Config.ASSET_DIR, tex)
+        if not os.path.isfile(path):
+            continue
+        with open(path, "rb") as f:
+            old_bytes = f.read()
+        try:
+            sheet = pygame.image.load(io.BytesIO(old_bytes), tex)
+        except pygame.error as e:
+            print(f"Skipping {tex}: {e}")
+            continue
+
+        anims = [definitions[(c, n)]["animations"][a] for c, n, a in refs]
+        ks = {factors[(c, n)] for c, n, _ in refs}
+        k = ks.pop() if len(ks) == 1 else 1
+        result = optimize_sheet(sheet, anims, k)
+        row = {"texture": tex, "old_bytes": len(old_bytes), "new_bytes": len(old_bytes),
+               "old_decode_ms": decode_ms(old_bytes), "new_decode_ms": None, "notes": ""}
+        if result is None:
+            row["notes"] = "conflicting frame sizes"
+        else:
+            packed, new_rows, trim, (cw, ch) = result
+            new_bytes = _png_bytes(packed)
+            if len(new_bytes) >= len(old_bytes):
+                row["notes"] = "no gain"
+            else:
+                row["new_bytes"] = len(new_bytes)
+                row["new_decode_ms"] = decode_ms(new_bytes)
+                row["notes"] = (
+                    f"{sheet.get_width()}x{sheet.get_height()} -> "
+                    f"{packed.get_width()}x{packed.get_height()}, trim {trim[0]},{trim[1]}"
+                    + (f", 1/{k}" if k > 1 else "")
+                )
+                changed_sheets[tex] = new_bytes
+                for (c, n, a), anim in zip(refs, anims):
+                    anim["fw"], anim["fh"] = cw, ch
+                    anim["row"] = new_rows[anim.get("row", 0)]
+                    anim["trim"] = list(trim)
+                    changed_defs.add((c, n))
+        if row["new_decode_ms"] is None:
+            row["new_decode_ms"] = row["old_decode_ms"]
+        report.append(row)
+
+    # A definition's scale only grows once all its sheets were shrunk
+    for key in changed_defs:
+        k = factors[key]
+        own = [a.get("texture") for a in definitions[key].get("animations", {}).values()]
+        if k > 1:
+            if all(tex in changed_sheets for tex in own if tex):
+                definitions[key]["scale"] = float(definitions[key].get("scale", 1.0)) * k
+            else:
+                print(f"Warning: {key[1]} has sheets downsampled but not all of them")
+
+    if write_dir:
+        _write(write_dir, definitions, changed_defs, changed_sheets)
+    if report_path:
+        with open(report_path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(report[0]) if report else ["texture"])
+            writer.writeheader()
+            writer.writerows(report)
+    return report
+
+
+def _write(write_dir, definitions, changed_defs, changed_sheets):
+    shutil.copytree(Config.ASSET_DIR, write_dir, dirs_exist_ok=True)
+    for tex, data in changed_sheets.items():
+        with open(os.path.join(write_dir, tex), "wb") as f:
+            f.write(data)
+    for category, name in changed_defs:
+        folder = os.path.relpath(Config.DIRS[category], Config.ASSET_DIR)
+        with open(os.path.join(write_dir, folder, name), "w") as f:
+            json.dump(definitions[(category, name)], f, indent=4)
+
+
+def print_report(report):
+    old = sum(r["old_bytes"] for r in report)
+    new = sum(r["new_bytes"] for r in report)
+    old_ms = sum(r["old_decode_ms"] for r in report)
+    new_ms = sum(r["new_decode_ms"] for r in report)
+    print(f"{'sheet':<48}{'bytes saved':>12}{'ms saved':>10}  notes")
+    for r in report:
+        print(f"{r['texture'][:47]:<48}{r['old_bytes'] - r['new_bytes']:>12}"
+              f"{r['old_decode_ms'] - r['new_decode_ms']:>10.2f}  {r['notes']}")
+    print(f"Total: {old} -> {new} bytes, decode {old_ms:.1f} -> {new_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    options = {"--write": None, "--report": None}
+    while args:
+        flag = args.pop(0)
+        if flag in options and args:
+            options[flag] = args.pop(0)
+        else:
+            print(__doc__)
+            sys.exit(1)
+    pygame.init()
+    print_report(optimize(options["--write"], options["--report"]))
@@ -0,0 +1,100 @@
+"""Texture atlas — many small images packed into a few large pages.
+
+The renderer packs every tile and prop image of the world into pages of
+PAGE_SIZE pixels and draws them as (page, dest, area) blits. Runs of
+props are then one `Surface.blits` call instead of one Python-level blit
+per prop.
+
+Images are packed on shelves: each page is split into horizontal strips
+as tall as the first image placed in them, and an image goes to the
+first shelf it fits in (tallest images first when packing in bulk).
+Images larger than a page get a page of their own. A 1 px gap keeps
+neighbouring regions from bleeding into each other when scaled.
+"""
+
+import pygame
+
+
+class TextureAtlas:
+    PAGE_SIZE = 512
+    PADDING = 1
+
+    def __init__(self, page_size=None):
+        self.page_size = page_size or self.PAGE_SIZE
+        self.pages = []  # Surfaces
+        self._shelves = []  # per page: [[y, height, next_x]]
+        self._regions = {}  # key -> (page, Rect)
+
+    def __contains__(self, key):
+        return key in self._regions
+
+    def __len__(self):
+        return len(self._regions)
+
+    def get(self, key):
+        """(page surface, area Rect) of an image, or None."""
+        return self._regions.get(key)
+
+    def clear(self):
+        self.pages.clear()
+        self._shelves.clear()
+        self._regions.clear()
+
+    def add_many(self, images):
+        """Pack {key: surface}, tallest first for tighter shelves."""
+        for key, image in sorted(images.items(), key=lambda kv: -kv[1].get_height()):
+            self.add(key, image)
+
+    def add(self, key, image):
+        """Copy `image` into the atlas; returns its (page, area)."""
+        region = self._regions.get(key)
+        if region is not None:
+            return region
+
+        w, h = image.get_size()
+        pad = self.PADDING
+        if w + pad > self.page_size or h + pad > self.page_size:
+            page = self._new_page(w, h)
+            x, y = 0, 0
+        else:
+            page, x, y = self._place(w + pad, h + pad)
+
+        area = pygame.Rect(x, y, w, h)
+        # Pages start fully transparent, so MAX copies the pixels (alpha
+        # included) exactly where a normal blit would blend them
+        page.blit(image, area, special_flags=pygame.BLEND_RGBA_MAX)
+        self._regions[key] = (page, area)
+        return page, area
+
+    def _place(self, w, h):
+        size = self.page_size
+        for index, shelves in enumerate(self._shelves):
+            if shelves is None:
+                continue  # oversized single-image page
+            for shelf in shelves:
+                if h <= shelf[1] and shelf[2] + w <= size:
+                    x = shelf[2]
+                    shelf[2] += w
+                    return self.pages[index], x, shelf[0]
+            top = shelves[-1][0] + shelves[-1][1] if shelves else 0
+            if top + h <= size:
+                shelves.append([top, h, w])
+                return self.pages[index], 0, top
+
+        page = self._new_page(size, size, shelves=[[0, h, w]])
+        return page, 0, 0
+
+    def _new_page(self, w, h, shelves=None):
+        page = pygame.Surface((w, h), pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            page = page.convert_alpha()
+        page.fill((0, 0, 0, 0))
+        self.pages.append(page)
+        self._shelves.append(shelves)
+        return page
+
+    def stats(self):
+        used = sum(area.w * area.h for _, area in self._regions.values())
+        total = sum(p.get_width() * p.get_height() for p in self.pages)
+        return {"images": len(self._regions), "pages": len(self.pages),
+                "fill": used / total if total else 0.0}
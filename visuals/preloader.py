@@ -0,0 +1,167 @@
+"""Asset preloader — decode the current save's sprite sheets before they are drawn.
+
+Without it every sheet is decoded the first time something draws it, so
+the first monster of each type (and the renderer's cloud images) stalls
+a frame. The preloader works in two halves:
+
+  - a worker thread reads and decodes (`load_image`, from the asset
+    bundle or the loose PNG) every image the save refers to;
+  - the main thread, once per frame, calls `step()`, which runs
+    `convert_alpha` (it needs the display) on decoded images until
+    Config.PRELOAD_SLICE_MS is spent.
+
+`load(path)` hands out the converted surface, or loads it on the spot if
+it is not ready yet. From then on the path is claimed: the caller's
+cache owns the image and `start()` skips it, until the cache drops it
+and calls `release(path)`, which lets the next `start_for_save` queue it
+again. The list of images comes from the save database
+(tiles, props, items, castles, monsters, see `save_paths`), resolved
+through the asset manifest.
+"""
+
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+import pygame
+
+from core.asset_manifest import load_manifest
+from core.config import Config
+from database.db_manager import DatabaseManager
+from visuals.asset_bundle import asset_exists, load_image
+
+CLOUD_TEXTURES = [f"assetBank/clouds/Cloud {n}.png" for n in range(1, 21)]
+CLOUD_PATHS = [os.path.join(Config.ASSET_DIR, tex) for tex in CLOUD_TEXTURES]
+
+
+def definition_textures(data):
+    """Texture files one definition JSON draws with."""
+    textures = [data.get("texture_file")]
+    for anim in data.get("animations", {}).values():
+        textures.append(anim.get("texture"))
+    return [tex for tex in textures if tex]
+
+
+def current_save():
+    """Most recently played save slot, else the template new saves copy."""
+    saves = [f"game_data_{slot}.db" for slot in (1, 2, 3)]
+    saves = [f for f in saves if os.path.exists(f)]
+    if saves:
+        return max(saves, key=os.path.getmtime)
+    return "default.db" if os.path.exists("default.db") else None
+
+
+def save_paths(db_file):
+    """Image paths a save draws: its textures, the definitions it names
+    (monsters, castles), every player skin and chest, and the clouds."""
+    refs = set()
+    if db_file and os.path.exists(db_file):
+        db = DatabaseManager(db_file, read_only=True)
+        try:
+            refs = db.get_asset_refs()
+        except sqlite3.Error as e:
+            print(f"Could not list assets of {db_file}: {e}")
+        finally:
+            db.close()
+
+    manifest = load_manifest()
+    textures = set()
+    for ref in refs:
+        name = ref if ref.endswith(".json") else ref + ".json"
+        data = None
+        for category in Config.DIRS:
+            data = manifest.get(category, name)
+            if data:
+                break
+        if data:
+            textures.update(definition_textures(data))
+        else:
+            textures.add(ref)
+    for category in ("player", "chest"):
+        for data in manifest.definitions(category).values():
+            textures.update(definition_textures(data))
+
+    paths = [os.path.join(Config.ASSET_DIR, tex) for tex in sorted(textures)]
+    paths = [p for p in paths if asset_exists(p)]
+    return CLOUD_PATHS + paths
+
+
+class AssetPreloader:
+    def __init__(self):
+        self.surfaces = {}  # path -> converted surface, until load() hands it over
+        self._decoded = queue.Queue()  # (path, surface or None) from the worker
+        self._pending = set()  # queued for or being decoded
+        self._claimed = set()  # held by a caller's cache right now (see release())
+        self.total = 0
+        self.done = 0
+
+    @property
+    def active(self):
+        return self.done < self.total
+
+    @property
+    def progress(self):
+        """Fraction of requested images ready (1.0 when idle)."""
+        return self.done / self.total if self.total else 1.0
+
+    def start(self, paths):
+        """Queue `paths` (already loaded or queued ones are skipped)."""
+        new = [p for p in dict.fromkeys(paths)
+               if p not in self.surfaces and p not in self._pending and p not in self._claimed]
+        if not new:
+            return
+        self._pending.update(new)
+        self.total += len(new)
+        threading.Thread(target=self._decode, args=(new,), daemon=True).start()
+
+    def start_for_save(self, db_file=None):
+        self.start(save_paths(db_file or current_save()))
+
+    def _decode(self, paths):
+        # Worker thread: file IO and PNG decoding only, no display calls
+        for path in paths:
+            try:
+                surface = load_image(path)
+            except (pygame.error, OSError) as e:
+                print(f"Preload failed for {path}: {e}")
+                surface = None
+            self._decoded.put((path, surface))
+
+    def step(self, budget_ms=None):
+        """Convert decoded images until `budget_ms` is spent; returns `active`."""
+        if budget_ms is None:
+            budget_ms = Config.PRELOAD_SLICE_MS
+        deadline = time.perf_counter() + budget_ms / 1000.0
+        while time.perf_counter() < deadline:
+            try:
+                path, surface = self._decoded.get_nowait()
+            except queue.Empty:
+                break
+            self._pending.discard(path)
+            self.done += 1
+            # A path loaded early by load() is already owned by its caller
+            if surface is not None and path not in self._claimed:
+                self.surfaces[path] = surface.convert_alpha()
+        return self.active
+
+    def load(self, path):
+        """Display-format surface for `path`, preloaded or loaded now.
+
+        The preloader lets go of the surface: the caller's cache (bounded
+        by its budget) owns it from here on.
+        """
+        self._claimed.add(path)
+        surface = self.surfaces.pop(path, None)
+        if surface is None:
+            surface = load_image(path).convert_alpha()
+        return surface
+
+    def release(self, path):
+        """The cache that loaded `path` dropped it; preload it again next time."""
+        self._claimed.discard(path)
+
+
+# Shared by the screens, the asset managers and the renderer
+preloader = AssetPreloader()
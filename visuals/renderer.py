@@ -3,12 +3,47 @@ import pygame
 import math
 from core.config import Config
 from core.hexmath import HexMath
+from core.profiler import profiler
 from gameplay import world
+from gameplay.journal import ChangeKind
+from visuals.atlas import TextureAtlas
+from visuals.preloader import CLOUD_TEXTURES
+from visuals.terrain_cache import TerrainChunkCache
+from visuals.vfx import VFXLibrary
+from visuals.scene import (
+    DrawRecord, SceneGraph, RANK_PROP, RANK_PLAYER, RANK_MONSTER,
+    RANK_ASSISTANT, RANK_CHEST, RANK_ITEM, RANK_STAR,
+)
 
 
 class GameRenderer:
-    def __init__(self, asset_manager):
+    # Journal subscriber name used to invalidate cached terrain and props
+    JOURNAL_NAME = "renderer"
+
+    def __init__(self, asset_manager, render_scale=None):
+        """`asset_manager` loads art at full resolution (the HUD shares it).
+
+        Terrain (hex bases, tile textures, fog clouds) is drawn at base
+        resolution (1 / render_scale of the window) into an offscreen
+        surface and upscaled once per frame by an integer factor; tile
+        art is authored at that size. Sprites (props, castles, entities,
+        chests, items, VFX) are then drawn onto the window at full
+        resolution: their scales are mostly not multiples of
+        render_scale, so at base size they would lose detail. Terrain
+        layout values (shifts, CALIB_OFFSET_Y, HexMath pixels) are
+        full-resolution, so they are multiplied by `px` before use.
+        """
         self.assets = asset_manager
+        self.render_scale = max(1, int(render_scale or Config.RENDER_SCALE))
+        self.px = 1.0 / self.render_scale  # full-res pixel -> base pixel
+        self.calib_y = Config.CALIB_OFFSET_Y * self.px  # terrain only
+        # Hex corner offsets at base resolution (no trig per tile)
+        self._hex_offsets = HexMath.get_hex_polygon_offsets(self.px)
+
+        # Offscreen base-resolution target and the window area it scales into
+        self._view = None
+        self._view_dest = None
+        self._view_owner = None
         # Colors
         self.COLOR_BG = (17, 17, 17)  # #111
         self.COLOR_GRASS = (46, 59, 40)  # #2e3b28
@@ -16,364 +51,485 @@ class GameRenderer:
         self.COLOR_STONE = (56, 56, 56)  # #383838
         self.COLOR_OUTLINE = (34, 34, 34)  # #222
 
-        # render cache pool, to reduce lagging
-        self.image_cache = {}
-
-        # load cloud images into list
-        self.cloud_images = []
-
-        for image_number in range(1, 21):
-            image = pygame.image.load(
-                f"assets/assetBank/clouds/Cloud {image_number}.png"
-            ).convert_alpha()
-            self.cloud_images.append(image)
-
-    def render(self, screen, world, frame_index=0):
-        screen.fill(self.COLOR_BG)
+        # Static terrain (hexes, tile textures, fog clouds) baked into
+        # chunk surfaces; re-baked per chunk when the journal reports a
+        # discovery, or entirely when a level unlocks
+        self.terrain_chunks = TerrainChunkCache(
+            self._draw_terrain_tile, background=self.COLOR_BG, pixel_scale=self.px
+        )
 
+        # Tile and prop images of the world packed into a few pages, so
+        # runs of props are drawn with one Surface.blits call
+        self.atlas = TextureAtlas()
+        self._atlas_world = None
+
+        # Retained draw lists bucketed by world pixel row. Props and
+        # castle stars are added once; entities are re-bucketed when they move.
+        self._journal = None
+        self._scene_world = None
+        self.scene = SceneGraph()  # props, player, monsters, assistants, chests, items
+        self.castle_scene = SceneGraph()  # castles and their stars, drawn on top
+        self._prop_records = {}  # (q, r) -> DrawRecord
+        self._dynamic = {}  # id(object) -> DrawRecord
+        self._frame_stamp = 0
+
+        # Dirty rectangles: screen areas that changed since the last frame,
+        # or None when the whole window must be flipped (camera moved,
+        # terrain re-baked, props added, first frame)
+        self.dirty_rects = None
+        self._frame_rects = []  # screen rects of animated blits this frame
+        self._last_rects = []
+        self._last_camera = None
+        self._last_bakes = None
+        self._scene_changed = True
+
+        # load cloud images into list (decoded in the background by the
+        # preloader while the menus are up, then kept in the sprite cache
+        # so later sessions find them there)
+        self.cloud_images = [self.assets.get_image(tex, scale=1.0, scale_to_tile=False)
+                             for tex in CLOUD_TEXTURES]
+
+        # Star, heal and explosion frames, pre-scaled
+        self.vfx = VFXLibrary(self.assets)
+
+        # Scaled, alpha'd cloud surfaces by (image index, scale). Only 20
+        # images exist, so chunk bakes never smoothscale the same cloud twice
+        self._cloud_variants = {}
+
+    def render(self, screen, world, frame_index=0, alpha=0.0):
+        """Draw the world around the player.
+
+        `alpha` is how far the simulation is into its next fixed tick
+        (0..1); moving entities are drawn that much further along their
+        step so motion stays smooth at any frame rate.
+        """
         player = world.player
         if not player:
+            screen.fill(self.COLOR_BG)
+            self._scene_changed = True
+            self.dirty_rects = None
             return
 
-        cx = Config.CENTER_X
-        cy = Config.CENTER_Y
-        render_range = 15
-
-        # if the player is moving, let the camera focus on the player for interpolation
-        if getattr(player, "is_moving", False):
-            from_px, from_py = HexMath.hex_to_pixel(
-                player.move_from_q, player.move_from_r
-            )
-            to_px, to_py = HexMath.hex_to_pixel(player.move_to_q, player.move_to_r)
-            t = player.move_progress
-
-            ppx = from_px + (to_px - from_px) * t
-            ppy = from_py + (to_py - from_py) * t
-        else:
-            ppx, ppy = HexMath.hex_to_pixel(player.q, player.r)
-
-        terrain_layer = []
-        object_layer = []  # Scenery: Monsters, Player, Items, Chests
-        castle_layer = []  # Castles: Large structures rendered on top for visual clarity
-
-        # Iterate tiles around player
-        for q in range(player.q - render_range, player.q + render_range):
-            for r in range(player.r - render_range, player.r + render_range):
-                if HexMath.distance(q, r, player.q, player.r) > render_range:
+        view = self._begin_view(screen)
+        view.fill(self.COLOR_BG)
+        self._frame_rects = []
+        screen_w, screen_h = screen.get_size()
+        cull = 100
+
+        # Screen centre and camera sit on whole base pixels, so the
+        # upscaled terrain and the full-resolution sprites move together
+        k = self.render_scale
+        cx = (Config.CENTER_X // k) * k
+        cy = (Config.CENTER_Y // k) * k
+
+        # if the player is moving, let the camera focus on the player for interpolation.
+        ppx, ppy = self._entity_pixel(player, alpha)
+        ppx, ppy = math.floor(ppx / k) * k, math.floor(ppy / k) * k
+
+        with profiler.phase("render.terrain"):
+            # Draw Terrain: only the pre-rendered chunks overlapping the camera
+            if self._atlas_world is not world:
+                self._build_atlas(world)
+            self.terrain_chunks.bind(world)
+            self._sync_journal(world)
+            self.terrain_chunks.draw(view, (ppx - cx) // k, (ppy - cy) // k)
+
+        with profiler.phase("render.present"):
+            # Sprites are drawn over the upscaled terrain at full resolution
+            self._present(view, screen)
+
+        with profiler.phase("render.scene"):
+            # Update the retained draw lists: static props/stars, then whatever moved
+            if self._scene_world is not world:
+                self._rebuild_scene(world)
+            self._sync_dynamic(world, player, alpha, ppx, ppy)
+
+        # Culling window in world pixels
+        left = ppx - cx - cull
+        right = ppx - cx + screen_w + cull
+        top = ppy - cy - cull
+        bottom = ppy - cy + screen_h + cull
+
+        with profiler.phase("render.objects"):
+            # Draw Objects: walking the rows on screen is already depth order.
+            # Consecutive props are collected and drawn with one blits call
+            props = []
+            for rec in self.scene.walk(top, bottom):
+                if not (left < rec.x < right and top < rec.y < bottom):
                     continue
+                dx = cx + (rec.x - ppx)
+                dy = cy + (rec.y - ppy)
 
-                tile = world.get_tile(q, r)
-                if not tile:
+                kind = rec.kind
+                if kind == "prop":
+                    self._queue_prop(props, rec, dx, dy)
                     continue
+                if props:
+                    screen.blits(props, doreturn=False)
+                    props = []
+                if kind == "entity":
+                    # Monsters/assistants only show on tiles the player has discovered
+                    if rec.data and not self._on_discovered_tile(world, rec.ref):
+                        continue
+                    self._draw_entity(screen, rec.ref, dx, dy, frame_index)
+                elif kind == "item":
+                    if not self._on_discovered_tile(world, rec.ref):
+                        continue
+                    self._draw_item(screen, rec.ref, dx, dy, frame_index)
+                elif kind == "chest":
+                    self._draw_chest(screen, rec.ref, dx, dy)
+
+            if props:
+                screen.blits(props, doreturn=False)
+                props = []
+
+            # Castles are drawn after everything else (by depth among themselves) so
+            # they render over props, and stars sit on top of the castles
+            for rec in self.castle_scene.walk(top, bottom):
+                if not (left < rec.x < right and top < rec.y < bottom):
+                    continue
+                dx = cx + (rec.x - ppx)
+                dy = cy + (rec.y - ppy)
 
-                px, py = HexMath.hex_to_pixel(q, r)
-
-                draw_x = cx + (px - ppx)
-                draw_y = cy + (py - ppy)
-
-                # Culling
-                if (
-                    -100 < draw_x < Config.WINDOW_WIDTH + 100
-                    and -100 < draw_y < Config.WINDOW_HEIGHT + 100
-                ):
-                    terrain_layer.append((tile, draw_x, draw_y))
-                    if tile.discovered and tile.prop_texture:
-                        # NEW: Separate castles from standard objects
-                        obj_data = {
-                            "depth": draw_y,
-                            "type": "prop",
-                            "tile": tile,
-                            "x": draw_x,
-                            "y": draw_y,
-                        }
-                        if self.assets.is_castle(tile.prop_texture):
-                            castle_layer.append(obj_data)
-                        else:
-                            object_layer.append(obj_data)
-
-        # Add Player
-        object_layer.append(
-            {"depth": cy, "type": "entity", "entity": player, "x": cx, "y": cy}
-        )
-
-        # Add Monsters
-        for monster in world.monsters:
-            tile = world.get_tile(monster.q, monster.r)
-            if not tile or not tile.discovered:
-                continue
-
-            if getattr(monster, "is_moving", False):
-                from_px, from_py = HexMath.hex_to_pixel(
-                    monster.move_from_q, monster.move_from_r
-                )
-                to_px, to_py = HexMath.hex_to_pixel(
-                    monster.move_to_q, monster.move_to_r
-                )
-                t = monster.move_progress
-
-                mqx = from_px + (to_px - from_px) * t
-                mqy = from_py + (to_py - from_py) * t
-            else:
-                mqx, mqy = HexMath.hex_to_pixel(monster.q, monster.r)
-
-            mdx = cx + (mqx - ppx)
-            mdy = cy + (mqy - ppy)
-
-            # Culling
-            if (
-                -100 < mdx < Config.WINDOW_WIDTH + 100
-                and -100 < mdy < Config.WINDOW_HEIGHT + 100
-            ):
-                object_layer.append(
-                    {
-                        "depth": mdy,
-                        "type": "entity",
-                        "entity": monster,
-                        "x": mdx,
-                        "y": mdy,
-                    }
-                )
-
-        # Add Assistants
-        for assistant in getattr(world, "assistants", []):
-            tile = world.get_tile(assistant.q, assistant.r)
-            # Only render if the tile is discovered by the player
-            if not tile or not tile.discovered:
-                continue
-
-            # Handle smooth tile-to-tile movement interpolation
-            if getattr(assistant, "is_moving", False):
-                from_px, from_py = HexMath.hex_to_pixel(assistant.move_from_q, assistant.move_from_r)
-                to_px, to_py = HexMath.hex_to_pixel(assistant.move_to_q, assistant.move_to_r)
-                t = assistant.move_progress
-
-                aqx = from_px + (to_px - from_px) * t
-                aqy = from_py + (to_py - from_py) * t
-            else:
-                # Stand still if not moving
-                aqx, aqy = HexMath.hex_to_pixel(assistant.q, assistant.r)
-                
-            # Convert world hex coordinates to screen pixel coordinates
-            adx = cx + (aqx - ppx)
-            ady = cy + (aqy - ppy)
-            
-            # Culling: Only add to the render list if it's within the screen bounds
-            if (
-                -100 < adx < Config.WINDOW_WIDTH + 100
-                and -100 < ady < Config.WINDOW_HEIGHT + 100
-            ):
-                # Add to the depth-sorted object layer
-                # We use "type": "entity" so it reuses the monster/player drawing logic
-                object_layer.append(
-                    {"depth": ady, "type": "entity", "entity": assistant, "x": adx, "y": ady}
-                )
-                
-        # Add Chests
-        for chest in world.chests:
-            cqx, cqy = HexMath.hex_to_pixel(chest.q, chest.r)
-            cdxp = cx + (cqx - ppx)
-            cdyp = cy + (cqy - ppy)
-            if (
-                -100 < cdxp < Config.WINDOW_WIDTH + 100
-                and -100 < cdyp < Config.WINDOW_HEIGHT + 100
-            ):
-                object_layer.append(
-                    {
-                        "depth": cdyp,
-                        "type": "chest",
-                        "chest": chest,
-                        "x": cdxp,
-                        "y": cdyp,
-                    }
-                )
-
-        # Add Castle Stars
-        if hasattr(world, "castles"):
-            for castle in world.castles:
-                if castle.is_conquered and castle.level <= world.current_level:
-                    cqx, cqy = HexMath.hex_to_pixel(castle.q, castle.r)
-                    cdxp = cx + (cqx - ppx)
-                    cdyp = cy + (cqy - ppy)
-                    if (
-                        -100 < cdxp < Config.WINDOW_WIDTH + 100
-                        and -100 < cdyp < Config.WINDOW_HEIGHT + 100
-                    ):
-                        tile = world.get_tile(castle.q, castle.r)
-                        star_y = 50.0
-                        if tile and tile.prop_texture:
-                            _, _, _, star_y = self.assets.get_layout(tile.prop_texture)
-
-                        # NEW: Stars are handled in a separate pass to ensure they sit on top of massive castles
-                        castle_layer.append(
-                            {
-                                "depth": cdyp,
-                                "type": "castle_star",
-                                "x": cdxp,
-                                "y": cdyp,
-                                "star_y": star_y,
-                            }
+                if rec.kind == "prop":
+                    self._queue_prop(props, rec, dx, dy)
+                    continue
+                if props:
+                    screen.blits(props, doreturn=False)
+                    props = []
+                if rec.kind == "castle_star":
+                    castle = rec.ref
+                    if castle.is_conquered and castle.level <= world.current_level:
+                        self._draw_castle_star(
+                            screen, dx, dy, frame_index, star_y_offset=rec.data
                         )
+            if props:
+                screen.blits(props, doreturn=False)
 
-        # Add Ground Items
-        for item in world.ground_items:
-            # We add q, r to the item object for rendering by converting the tile id to q, r
-            tile = world.get_tile(item.q, item.r)
-
-            if not tile or not tile.discovered:
-                continue
-
-            iqx, iqy = HexMath.hex_to_pixel(item.q, item.r)
-            idx = cx + (iqx - ppx)
-            idy = cy + (iqy - ppy)
-
-            # Culling (don't draw if off screen)
-            if (
-                -100 < idx < Config.WINDOW_WIDTH + 100
-                and -100 < idy < Config.WINDOW_HEIGHT + 100
-            ):
-                object_layer.append(
-                    {"depth": idy, "type": "item", "item": item, "x": idx, "y": idy}
-                )
+        with profiler.phase("render.vfx"):
+            # Iterate through all active visual effects in the world
+            if hasattr(world, "effects"):
+                for effect in world.effects:
+                    edx, edy = 0, 0
 
-        # Draw Terrain (Sorted by Y for slight depth effect if needed, but mostly Z-order matters)
-        terrain_layer.sort(key=lambda t: t[2])
-        for tile, dx, dy in terrain_layer:
-            self._draw_hex_base(screen, tile, dx, dy)
-
-            # clouds that cover locked levels
-            if world.is_tile_locked(tile.q, tile.r):
-                if tile.discovered:
-                    continue  # if already discovered, don't draw clouds
-
-                # cloud couverage
-                if (tile.q * 5 + tile.r * 7) % 200 != 0:
-                    # cloud selection (images in the list)
-                    idx = abs(tile.q * 31 + tile.r * 17) % len(self.cloud_images)
-                    img = self.cloud_images[idx]
-
-                    self._draw_cloud_overlay(screen, img, dx, dy, scale=2.3)
-
-        # Draw Objects (Sorted by Depth Y)
-        object_layer.sort(key=lambda obj: obj["depth"])
-
-        for obj in object_layer:
-            if obj["type"] == "prop":
-                self._draw_prop(screen, obj["tile"], obj["x"], obj["y"])
-            elif obj["type"] == "entity":
-                self._draw_entity(
-                    screen, obj["entity"], obj["x"], obj["y"], frame_index
-                )
-            elif obj["type"] == "item":
-                self._draw_item(screen, obj["item"], obj["x"], obj["y"], frame_index)
-            elif obj["type"] == "chest":
-                self._draw_chest(screen, obj["chest"], obj["x"], obj["y"])
-
-        # Drawin castles sorted by depth Y ensuring they render over props etc while respecting their own relative depth
-        castle_layer.sort(key=lambda obj: obj["depth"])
-        for obj in castle_layer:
-            if obj["type"] == "prop":
-                self._draw_prop(screen, obj["tile"], obj["x"], obj["y"])
-            elif obj["type"] == "castle_star":
-                # Render star on top of the castle center
-                self._draw_castle_star(
-                    screen,
-                    obj["x"],
-                    obj["y"],
-                    frame_index,
-                    star_y_offset=obj.get("star_y", 50),
-                )
+                    # Special handling for the Healing Effect (follows a target)
+                    if effect.__class__.__name__ == "HealEffect":
+                        target = effect.target
 
-        # Iterate through all active visual effects in the world
-        if hasattr(world, "effects"):
-            for effect in world.effects:
-                edx, edy = 0, 0
-
-                # Special handling for the Healing Effect (follows a target)
-                if effect.__class__.__name__ == "HealEffect":
-                    target = effect.target
-
-                    # Smoothly follow the target if they are currently moving between tiles
-                    if getattr(target, "is_moving", False):
-                        from_px, from_py = HexMath.hex_to_pixel(target.move_from_q, target.move_from_r)
-                        to_px, to_py = HexMath.hex_to_pixel(target.move_to_q, target.move_to_r)
-                        t = target.move_progress
-                        eqx = from_px + (to_px - from_px) * t
-                        eqy = from_py + (to_py - from_py) * t
-                    else:
-                        eqx, eqy = HexMath.hex_to_pixel(target.q, target.r)
+                        # Smoothly follow the target if they are currently moving between tiles
+                        eqx, eqy = self._entity_pixel(target, alpha)
                         
-                    # Apply camera offset to get final screen position
-                    edx = cx + (eqx - ppx)
-                    edy = cy + (eqy - ppy)
+                        # Apply camera offset to get final screen position
+                        edx = cx + (eqx - ppx)
+                        edy = cy + (eqy - ppy)
                 
-                    # Fetch the raw sprite sheet from assets
-                    sheet = self.assets.get_image("Heal_Effect.png", scale_to_tile=False) 
-                    
-                    if sheet:
-                        fw = 192
-                        fh = 180
-
-                        current_frame = (effect.anim_tick // effect.anim_speed) % effect.frame_count
-                        crop_rect = (current_frame * fw, 0, fw, fh)
-                        try:
-                            frame = sheet.subsurface(crop_rect)
-                            display_w = 96 
-                            display_h = 90
-                            frame = pygame.transform.smoothscale(frame, (display_w, display_h))
-                            
+                        # Pre-scaled frame of the heal sheet
+                        frame = self.vfx.heal_frame(effect)
+                        if frame:
                             rect = frame.get_rect(centerx=edx, centery=edy + 60 - Config.CALIB_OFFSET_Y)
                             screen.blit(frame, rect)
-                        except ValueError:
-                            pass
-                    
+                            self._mark(rect)
+
                         continue
             
-                # Convert hex coordinates to pixel coordinates
-                eqx, eqy = HexMath.hex_to_pixel(effect.q, effect.r)
+                    # Convert hex coordinates to pixel coordinates
+                    eqx, eqy = self._world_pixel(effect.q, effect.r)
 
-                # Apply camera offset to keep VFX fixed on the map
-                edx = cx + (eqx - ppx)
-                edy = cy + (eqy - ppy)
+                    # Apply camera offset to keep VFX fixed on the map
+                    edx = cx + (eqx - ppx)
+                    edy = cy + (eqy - ppy)
 
-                if (
-                    -200 < edx < Config.WINDOW_WIDTH + 200
-                    and -200 < edy < Config.WINDOW_HEIGHT + 200
-                ):
-                    # Calculate alpha for fade-out effect (160 -> 0)
-                    progress = effect.current_radius / effect.max_pixel_radius
-                    alpha = int(160 * (1.0 - progress))
-                    alpha = max(0, min(255, alpha))
+                    if (
+                        -2 * cull < edx < screen_w + 2 * cull
+                        and -2 * cull < edy < screen_h + 2 * cull
+                    ):
+                        # Ring frame (radius and 160 -> 0 fade) baked per explosion kind
+                        ring = self.vfx.explosion_frame(effect)
+                        if ring is None:
+                            continue
 
-                    if alpha <= 0:
-                        continue
+                        rect = ring.get_rect(
+                            centerx=edx, centery=edy - Config.CALIB_OFFSET_Y
+                        )
+                        screen.blit(ring, rect)
+                        self._mark(rect)
+
+        self._update_dirty_rects(screen, (ppx, ppy))
+
+    def _world_pixel(self, q, r):
+        """Full-resolution world pixel of a hex centre (sprites are drawn at it)."""
+        return HexMath.hex_to_pixel(q, r)
+
+    def _begin_view(self, screen):
+        """Surface the world is drawn into this frame.
+
+        At render_scale 1 that is the screen itself; otherwise a base
+        resolution surface that `_present` scales onto the screen.
+        """
+        if self.render_scale == 1:
+            return screen
+
+        if self._view_owner is not screen or self._view_dest.get_size() != (
+            (screen.get_width() // self.render_scale) * self.render_scale,
+            (screen.get_height() // self.render_scale) * self.render_scale,
+        ):
+            k = self.render_scale
+            w, h = screen.get_width() // k, screen.get_height() // k
+            self._view = pygame.Surface((w, h)).convert(screen)
+            self._view_dest = screen.subsurface((0, 0, w * k, h * k))
+            self._view_owner = screen
+            self._scene_changed = True
+            # Pixels past the last whole base pixel stay background
+            screen.fill(self.COLOR_BG)
+        return self._view
+
+    def _present(self, view, screen):
+        """One integer nearest-neighbour upscale of the terrain onto the screen."""
+        if view is screen:
+            return
+        pygame.transform.scale(view, self._view_dest.get_size(), self._view_dest)
+
+    def _mark(self, rect):
+        """Record a blit that can change between frames (entities, items, VFX)."""
+        self._frame_rects.append(pygame.Rect(rect))
+
+    def _update_dirty_rects(self, screen, camera):
+        """Set `dirty_rects` for this frame: last and current blits, in screen pixels.
+
+        Props and terrain only change when the camera moves or the scene is
+        invalidated, and those frames need a full flip anyway.
+        """
+        bakes = self.terrain_chunks.bakes
+        full = (
+            self._scene_changed
+            or camera != self._last_camera
+            or bakes != self._last_bakes
+        )
+        self._scene_changed = False
+        self._last_camera = camera
+        self._last_bakes = bakes
+
+        frame_rects = self._frame_rects
+        previous, self._last_rects = self._last_rects, frame_rects
+        if full:
+            self.dirty_rects = None
+            return
 
-                    # Create a temporary surface with per-pixel alpha
-                    surf_size = int(effect.max_pixel_radius * 2)
-                    if surf_size <= 0:
-                        continue
+        bounds = screen.get_rect()
+        rects = []
+        for rect in previous + frame_rects:
+            rect = rect.clip(bounds)
+            if rect.w and rect.h:
+                rects.append(rect)
+        self.dirty_rects = rects
+
+    def _entity_pixel(self, entity, alpha=0.0):
+        """World pixel position of an entity, interpolated while it moves.
+
+        move_progress is the position at the last simulation tick; `alpha`
+        of the entity's per-tick speed is added on top (clamped to the
+        destination) to place it between ticks.
+        """
+        if not getattr(entity, "is_moving", False):
+            return self._world_pixel(entity.q, entity.r)
+
+        from_px, from_py = self._world_pixel(entity.move_from_q, entity.move_from_r)
+        to_px, to_py = self._world_pixel(entity.move_to_q, entity.move_to_r)
+        # Player speed depends on weight/mount; monsters have a fixed move_speed
+        step = getattr(entity, "speed", None) or getattr(entity, "move_speed", 0.0)
+        t = min(1.0, entity.move_progress + step * alpha)
+
+        return (
+            from_px + (to_px - from_px) * t,
+            from_py + (to_py - from_py) * t,
+        )
 
-                    temp_surf = pygame.Surface((surf_size, surf_size), pygame.SRCALPHA)
-                    center = (surf_size // 2, surf_size // 2)
+    def _sync_journal(self, world):
+        """Drop cached terrain chunks that the journal says changed, add new props."""
+        journal = getattr(world, "journal", None)
+        if journal is None:
+            # No change feed: nothing can be trusted between frames
+            self.terrain_chunks.invalidate_all()
+            self._scene_world = None
+            return
 
-                    # Draw the circle with color and alpha
-                    pygame.draw.circle(
-                        temp_surf,
-                        (*effect.color, alpha),
-                        center,
-                        int(effect.current_radius),
-                    )
+        if journal is not self._journal:
+            self._journal = journal
+            journal.subscribe(self.JOURNAL_NAME)
+            self.terrain_chunks.invalidate_all()
+            self._scene_world = None
+
+        for change in journal.drain(self.JOURNAL_NAME):
+            if change.kind is ChangeKind.RESYNC:
+                self.terrain_chunks.invalidate_all()
+                self._scene_world = None
+            elif change.kind is ChangeKind.LEVEL_UNLOCKED:
+                # Clouds lift off the whole level; other chunks keep theirs
+                self.terrain_chunks.invalidate_level(change.data)
+            elif change.kind is ChangeKind.TILE_DISCOVERED:
+                self.terrain_chunks.invalidate_tile(change.q, change.r)
+                if self._scene_world is not None and change.target is not None:
+                    self._add_prop(change.target)
+
+    # Retained draw lists
+    def _rebuild_scene(self, world):
+        """Re-create every draw record (first frame, new world or resync)."""
+        self.scene.clear()
+        self.castle_scene.clear()
+        self._prop_records.clear()
+        self._dynamic.clear()
+
+        for tile in getattr(world, "tiles", {}).values():
+            self._add_prop(tile)
+
+        for castle in getattr(world, "castles", []):
+            tile = world.get_tile(castle.q, castle.r)
+            star_y = 50.0
+            if tile and tile.prop_texture:
+                _, _, _, star_y = self.assets.get_layout(tile.prop_texture)
+
+            # Stars are handled in the castle pass so they sit on top of massive castles
+            rec = DrawRecord("castle_star", castle, RANK_STAR, star_y)
+            self.castle_scene.add(rec, *self._world_pixel(castle.q, castle.r))
+
+        self._scene_world = world
+        self._scene_changed = True
+
+    def _add_prop(self, tile):
+        """Add the prop of a discovered tile (castles go to the castle pass)."""
+        if not (tile.discovered and tile.prop_texture):
+            return
+        key = (tile.q, tile.r)
+        if key in self._prop_records:
+            return
 
-                    # Blit onto the main screen
-                    rect = temp_surf.get_rect(
-                        centerx=edx, centery=edy - Config.CALIB_OFFSET_Y
-                    )
-                    screen.blit(temp_surf, rect)
+        # Atlas region and layout offsets are resolved once, not per frame
+        data = None
+        region = self._atlas_image(tile.prop_texture, tile.prop_scale)
+        if region is not None:
+            data = region + (
+                tile.prop_x_shift,
+                -Config.CALIB_OFFSET_Y - tile.prop_shift,
+            )
+        rec = DrawRecord("prop", tile, RANK_PROP, data)
+        scene = self.castle_scene if self.assets.is_castle(tile.prop_texture) else self.scene
+        scene.add(rec, *self._world_pixel(tile.q, tile.r))
+        self._prop_records[key] = rec
+        self._scene_changed = True
+
+    def _sync_dynamic(self, world, player, alpha, ppx, ppy):
+        """Place the player, monsters, assistants, chests and ground items.
+
+        Only objects that moved get a new position (and maybe a new bucket);
+        records of objects that are gone are dropped.
+        """
+        self._frame_stamp += 1
+        stamp = self._frame_stamp
+
+        # The camera follows the player, so it is always drawn at the centre
+        self._place(player, "entity", RANK_PLAYER, stamp, alpha, pos=(ppx, ppy))
+        for monster in world.monsters:
+            self._place(monster, "entity", RANK_MONSTER, stamp, alpha, hidden_in_fog=True)
+        for assistant in getattr(world, "assistants", []):
+            self._place(assistant, "entity", RANK_ASSISTANT, stamp, alpha, hidden_in_fog=True)
+        for chest in world.chests:
+            self._place(chest, "chest", RANK_CHEST, stamp, alpha)
+        for item in world.ground_items:
+            self._place(item, "item", RANK_ITEM, stamp, alpha)
+
+        stale = [key for key, rec in self._dynamic.items() if rec.stamp != stamp]
+        for key in stale:
+            self.scene.remove(self._dynamic.pop(key))
+
+    def _place(self, obj, kind, rank, stamp, alpha, pos=None, hidden_in_fog=False):
+        rec = self._dynamic.get(id(obj))
+        if rec is None or rec.ref is not obj:
+            if rec is not None:
+                self.scene.remove(rec)
+            rec = DrawRecord(kind, obj, rank, hidden_in_fog)
+            self._dynamic[id(obj)] = rec
+        rec.stamp = stamp
+
+        if pos is None:
+            if getattr(obj, "is_moving", False):
+                pos = self._entity_pixel(obj, alpha)
+                # Recompute once more after the move ends
+                rec.q = rec.r = None
+            elif rec.row is not None and rec.q == obj.q and rec.r == obj.r:
+                return  # standing where it was drawn last frame
+            else:
+                pos = self._world_pixel(obj.q, obj.r)
+                rec.q, rec.r = obj.q, obj.r
+
+        if rec.row is None:
+            self.scene.add(rec, *pos)
+        else:
+            self.scene.move(rec, *pos)
+
+    # Atlas
+    def _build_atlas(self, world):
+        """Pack every tile texture (base resolution) and prop image (full
+        resolution) of `world` into the atlas."""
+        self.atlas.clear()
+        images = {}
+        for tile in getattr(world, "tiles", {}).values():
+            for key in self._atlas_keys(tile):
+                if key not in images:
+                    img = self.assets.get_image(key[0], scale=key[1])
+                    if img:
+                        images[key] = img
+        self.atlas.add_many(images)
+        self._atlas_world = world
+
+    def _atlas_keys(self, tile):
+        if tile.texture:
+            yield (tile.texture, self.assets.get_layout(tile.texture)[0] * self.px)
+        if tile.prop_texture:
+            yield (tile.prop_texture, tile.prop_scale)
+
+    def _atlas_image(self, texture, scale):
+        """(page, area) of an image, added to the atlas on first use."""
+        key = (texture, scale)
+        region = self.atlas.get(key)
+        if region is None:
+            img = self.assets.get_image(texture, scale=scale)
+            if not img:
+                return None
+            region = self.atlas.add(key, img)
+        return region
+
+    def _queue_prop(self, batch, rec, x, y):
+        """Add a prop's (page, dest, area) to a Surface.blits batch."""
+        if rec.data is None:
+            return
+        page, area, x_shift, y_shift = rec.data
+        rect = pygame.Rect(0, 0, area.w, area.h)
+        rect.centerx = x + x_shift
+        rect.centery = y + y_shift
+        batch.append((page, rect, area))
+
+    def _on_discovered_tile(self, world, obj):
+        tile = world.get_tile(obj.q, obj.r)
+        return bool(tile and tile.discovered)
+
+    def _draw_terrain_tile(self, surface, world, tile, x, y):
+        """Chunk bake callback: hex base plus the cloud over locked, undiscovered tiles."""
+        self._draw_hex_base(surface, tile, x, y)
+
+        # clouds that cover locked levels
+        if tile.discovered or not world.is_tile_locked(tile.q, tile.r):
+            return
+
+        # cloud couverage
+        if (tile.q * 5 + tile.r * 7) % 200 != 0:
+            # cloud selection (images in the list)
+            idx = abs(tile.q * 31 + tile.r * 17) % len(self.cloud_images)
+
+            self._draw_cloud_overlay(surface, idx, x, y, scale=2.3)
 
     def _draw_hex_base(self, screen, tile, x, y):
-        # HexMath returns list of floats, Pygame needs list of tuples
-        poly_floats = HexMath.get_hex_polygon(x, y)
-        # Convert flat list [x1, y1, x2, y2...] to [(x1,y1), (x2,y2)...]
-        poly_points = list(zip(poly_floats[0::2], poly_floats[1::2]))
+        # Corner offsets come from HexMath's table, already in base pixels
+        poly_points = [(x + vx, y + vy) for vx, vy in self._hex_offsets]
 
         if not tile.discovered:
             pygame.draw.polygon(screen, (0, 0, 0), poly_points)
@@ -390,23 +546,14 @@ class GameRenderer:
 
         if tile.texture:
             scale, x_shift, y_shift, _ = self.assets.get_layout(tile.texture)
-            img = self.assets.get_image(tile.texture, scale=scale)
-            if img:
+            region = self._atlas_image(tile.texture, scale * self.px)
+            if region:
+                page, area = region
                 # Center horizontally, shift vertically or horizontally
-                rect = img.get_rect(
-                    centerx=x + x_shift, centery=y - Config.CALIB_OFFSET_Y - y_shift
-                )
-                screen.blit(img, rect)
-
-    def _draw_prop(self, screen, tile, x, y):
-        if tile.prop_texture:
-            img = self.assets.get_image(tile.prop_texture, scale=tile.prop_scale)
-            if img:
-                rect = img.get_rect(
-                    centerx=x + tile.prop_x_shift,
-                    centery=y - Config.CALIB_OFFSET_Y - tile.prop_shift,
-                )
-                screen.blit(img, rect)
+                rect = pygame.Rect(0, 0, area.w, area.h)
+                rect.centerx = x + x_shift * self.px
+                rect.centery = y - self.calib_y - y_shift * self.px
+                screen.blit(page, rect, area)
 
     def _draw_entity(self, screen, entity, x, y, frame_index):
         if entity.texture:
@@ -422,24 +569,20 @@ class GameRenderer:
             else:
                 use_frame = frame_index
 
-            base_img = self.assets.get_anim_frame(entity.texture, use_frame)
-            if not base_img:
-                return
-
             flash_color = None
 
             # first check poison state
             if getattr(entity, "poison_flash_timer", 0) > 0:
-                flash_color = (180, 50, 255)
+                flash_color = self.assets.FLASH_POISON
             # add red flash effect to both player and monster
             elif getattr(entity, "damage_flash_timer", 0) > 0:
-                flash_color = (255, 50, 50)
+                flash_color = self.assets.FLASH_DAMAGE
             elif getattr(entity, "heal_flash_timer", 0) > 0:
-                flash_color = (50, 255, 50)
+                flash_color = self.assets.FLASH_HEAL
 
             if hasattr(entity, "anim_state") and hasattr(entity, "anim_tick"):
                 if entity.anim_state.endswith("die") and entity.anim_tick < 4:
-                    flash_color = (255, 50, 50)
+                    flash_color = self.assets.FLASH_DAMAGE
 
             # Change the texture direction with player and monsters direction
             is_flipped = getattr(entity, "flip_x", False)
@@ -451,30 +594,20 @@ class GameRenderer:
             # special scale mark for small stone monster
             mini_override = getattr(entity, "mini_scale_override", 1.0)
 
-            cache_key = (id(base_img), flash_color, is_flipped, mini_override)
-
-            # First look in cache, if not found, generate new one and cache it
-            if cache_key in self.image_cache:
-                img = self.image_cache[cache_key]
+            # The entity keeps its sliced strip, so a frame is a list index;
+            # it is fetched again when the texture (animation) changes or the
+            # cache evicted it (variants built on an evicted strip go uncharged)
+            strip = entity.anim_frames
+            if strip is None or strip.texture != entity.texture or strip.key not in self.assets.cache:
+                strip = entity.anim_frames = self.assets.get_frames(entity.texture)
+            if strip is not None:
+                img = strip.variant(use_frame, flash_color, is_flipped, mini_override)
             else:
-                img = base_img
-
-                if flash_color is not None:
-                    flash_img = img.copy()  # make a copy of origin img
-                    flash_img.fill(flash_color, special_flags=pygame.BLEND_RGB_MULT)
-                    img = flash_img
-
-                if is_flipped:
-                    img = pygame.transform.flip(img, True, False)
-
-                # Get the size after scaling
-                if mini_override != 1.0:
-                    new_w = int(img.get_width() * mini_override)
-                    new_h = int(img.get_height() * mini_override)
-                    img = pygame.transform.smoothscale(img, (new_w, new_h))
-
-                # cache it
-                self.image_cache[cache_key] = img
+                img = self.assets.get_variant(
+                    entity.texture, use_frame, flash_color, is_flipped, mini_override
+                )
+            if not img:
+                return
 
             scale, x_shift, y_shift, _ = self.assets.get_layout(entity.texture)
             override_y = getattr(entity, "y_shift_override", None)
@@ -482,9 +615,11 @@ class GameRenderer:
             final_y_shift = override_y if override_y is not None else y_shift
 
             rect = img.get_rect(
-                centerx=x + x_shift, centery=y - Config.CALIB_OFFSET_Y - final_y_shift
+                centerx=x + x_shift,
+                centery=y - Config.CALIB_OFFSET_Y - final_y_shift,
             )
             screen.blit(img, rect)
+            self._mark(rect)
 
             if hasattr(entity, "hp") and hasattr(entity, "max_hp"):
                 if entity.hp < entity.max_hp and entity.hp > 0:
@@ -513,8 +648,11 @@ class GameRenderer:
                     pygame.draw.rect(
                         screen, (20, 20, 20), (bar_x, bar_y, bar_w, bar_h), 1
                     )
+                    self._mark(pygame.Rect(bar_x, bar_y, bar_w, bar_h))
         else:
-            pygame.draw.circle(screen, (255, 0, 0), (int(x), int(y)), 10)
+            self._mark(
+                pygame.draw.circle(screen, (255, 0, 0), (int(x), int(y)), 10)
+            )
 
     def _draw_chest(self, screen, chest, x, y):
         if not chest.texture:
@@ -530,6 +668,7 @@ class GameRenderer:
             centery=y - Config.CALIB_OFFSET_Y - y_shift,
         )
         screen.blit(img, rect)
+        self._mark(rect)
 
     def _draw_item(self, screen, item, x, y, frame_index):
         if not item.texture:
@@ -541,48 +680,24 @@ class GameRenderer:
 
         if img:
             rect = img.get_rect(
-                centerx=x + x_shift, centery=y - Config.CALIB_OFFSET_Y - y_shift
+                centerx=x + x_shift,
+                centery=y - Config.CALIB_OFFSET_Y - y_shift,
             )
             screen.blit(img, rect)
+            self._mark(rect)
 
     def _draw_castle_star(self, screen, x, y, frame_index, star_y_offset=50):
-        # We use scale_to_tile=False to get the raw high-res asset
-        img_sheet = self.assets.get_image("star.png", scale_to_tile=False)
+        # Slow down the animation works by skipping every 4 frames
+        frame_surf = self.vfx.star_frame(frame_index, anim_slowdown=4)
 
-        if img_sheet:
-            width = img_sheet.get_width()
-            height = img_sheet.get_height()
-
-            # Since there are 13 frames side-by-side
-            count = 13
-            fw = width // count
-            fh = height
-
-            # Slow down the animation works by skipping every 4 frames
-            anim_slowdown = 4
-            safe_idx = (frame_index // anim_slowdown) % count
-
-            try:
-                # Extract correct frame
-                crop = (safe_idx * fw, 0, fw, fh)
-                frame_surf = img_sheet.subsurface(crop)
-
-                target_size = 48
-                star_scale = target_size / fw
-
-                sw, sh = frame_surf.get_size()
-                frame_surf = pygame.transform.smoothscale(
-                    frame_surf, (int(sw * star_scale), int(sh * star_scale))
-                )
-
-                # Draw the specific frame, offset upwards to sit on the castle
-                rect = frame_surf.get_rect(
-                    centerx=x, centery=y - Config.CALIB_OFFSET_Y - star_y_offset
-                )
-                screen.blit(frame_surf, rect)
-                return
-            except ValueError:
-                pass
+        if frame_surf:
+            # Draw the specific frame, offset upwards to sit on the castle
+            rect = frame_surf.get_rect(
+                centerx=x, centery=y - Config.CALIB_OFFSET_Y - star_y_offset
+            )
+            screen.blit(frame_surf, rect)
+            self._mark(rect)
+            return
 
         # Fallback star if asset is missing (auto generated)
         points = []
@@ -598,14 +713,26 @@ class GameRenderer:
                 )
             )
         pygame.draw.polygon(screen, (255, 215, 0), points)
-        pygame.draw.polygon(screen, (255, 255, 255), points, 2)
+        self._mark(
+            pygame.draw.polygon(screen, (255, 255, 255), points, 2)
+        )
 
     # cloud helper function
-    def _draw_cloud_overlay(self, screen, img, x, y, scale=1.3):
-        width = int(img.get_width() * scale * 1.15)  # slightly wider
-        height = int(img.get_height() * scale * 0.9)  # slightly shorter
-        cloud = pygame.transform.smoothscale(img, (width, height))
-        cloud.set_alpha(210)  # soft fog
-        rect = cloud.get_rect(center=(x, y - Config.CALIB_OFFSET_Y))
+    def _draw_cloud_overlay(self, screen, idx, x, y, scale=1.3):
+        cloud = self._cloud_variant(idx, scale)
+        rect = cloud.get_rect(center=(x, y - self.calib_y))
         screen.blit(cloud, rect)
 
+    def _cloud_variant(self, idx, scale):
+        """Cloud image `idx` scaled for the fog overlay, built once per (idx, scale)."""
+        key = (idx, scale)
+        cloud = self._cloud_variants.get(key)
+        if cloud is None:
+            img = self.cloud_images[idx]
+            width = max(1, int(img.get_width() * scale * 1.15 * self.px))  # slightly wider
+            height = max(1, int(img.get_height() * scale * 0.9 * self.px))  # slightly shorter
+            cloud = pygame.transform.smoothscale(img, (width, height))
+            cloud.set_alpha(210)  # soft fog
+            self._cloud_variants[key] = cloud
+        return cloud
+
@@ -0,0 +1,118 @@
+"""Retained draw list — depth-ordered records kept between frames.
+
+The renderer draws props, entities, chests and items back to front by
+their world y. Instead of building a dict per object and sorting the
+whole list every frame, each object owns one `DrawRecord` that stays in
+a `SceneGraph` bucket keyed by its pixel row. Records only move between
+buckets when their row changes, so a frame is a walk over the rows on
+screen, which is already in depth order.
+
+Buckets are tiny (the objects sharing one pixel row) and are kept sorted
+by (y, rank): on an exact tie, props are drawn before the player, the
+player before monsters, and so on, matching the old sort order.
+"""
+
+import math
+
+# Draw order for records at exactly the same depth
+RANK_PROP = 0
+RANK_PLAYER = 1
+RANK_MONSTER = 2
+RANK_ASSISTANT = 3
+RANK_CHEST = 4
+RANK_ITEM = 5
+RANK_STAR = 6
+
+
+class DrawRecord:
+    """One drawable object: `kind` picks the draw call, `ref` is the object."""
+
+    __slots__ = ("kind", "ref", "rank", "x", "y", "row", "q", "r", "stamp", "data")
+
+    def __init__(self, kind, ref, rank, data=None):
+        self.kind = kind
+        self.ref = ref
+        self.rank = rank
+        self.data = data
+        self.x = 0.0
+        self.y = 0.0
+        self.row = None  # None while not in a graph
+        self.q = None  # hex the position was computed for
+        self.r = None
+        self.stamp = 0  # last frame the owner saw this object
+
+
+class SceneGraph:
+    def __init__(self):
+        self._rows = {}  # row -> [DrawRecord] sorted by (y, rank)
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def clear(self):
+        for bucket in self._rows.values():
+            for record in bucket:
+                record.row = None
+        self._rows.clear()
+        self._count = 0
+
+    def add(self, record, x, y):
+        record.x = x
+        record.y = y
+        self._insert(record)
+        self._count += 1
+
+    def move(self, record, x, y):
+        """Update a record's position; re-bucket only if its row changed."""
+        record.x = x
+        if record.y == y:
+            return
+        row = math.floor(y)
+        if row == record.row:
+            # Same bucket: keep it sorted
+            record.y = y
+            bucket = self._rows[row]
+            bucket.remove(record)
+            self._insort(bucket, record)
+            return
+        self._detach(record)
+        record.y = y
+        self._insert(record)
+
+    def remove(self, record):
+        if record.row is None:
+            return
+        self._detach(record)
+        self._count -= 1
+
+    def walk(self, top, bottom):
+        """Yield records with top <= y < bottom + 1, back to front."""
+        rows = self._rows
+        for row in range(math.floor(top), math.floor(bottom) + 1):
+            bucket = rows.get(row)
+            if bucket:
+                yield from bucket
+
+    def _insert(self, record):
+        record.row = math.floor(record.y)
+        bucket = self._rows.get(record.row)
+        if bucket is None:
+            self._rows[record.row] = [record]
+        else:
+            self._insort(bucket, record)
+
+    def _detach(self, record):
+        bucket = self._rows[record.row]
+        bucket.remove(record)
+        if not bucket:
+            del self._rows[record.row]
+        record.row = None
+
+    @staticmethod
+    def _insort(bucket, record):
+        key = (record.y, record.rank)
+        i = len(bucket)
+        while i > 0 and (bucket[i - 1].y, bucket[i - 1].rank) > key:
+            i -= 1
+        bucket.insert(i, record)
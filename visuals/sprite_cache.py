@@ -0,0 +1,164 @@
+"""Sprite cache — one bounded LRU for sheets, scaled frames and variants.
+
+Every surface is stored under a stable asset key (file name, frame,
+row, scale, tint...) rather than `id()` of another surface, so a key can
+never point at a freed or recycled image. Each entry is charged its
+pixel memory (width * height * bytes per pixel); when the total passes
+the budget the least recently used entries are dropped. Anything
+evicted is simply rebuilt from disk on the next miss.
+
+Pinned entries (see `put(..., pinned=True)`) count towards the total
+(and `pinned_bytes`) but are never evicted. Animation strips are stored
+as one entry whose charge grows with the variants built from it
+(`grow`); a pinned entry that grows goes back into the LRU, so pinned
+memory only ever holds what was measured when it was pinned.
+
+`on_evict(key)` is called for every entry the budget or `clear()`
+drops, so whoever handed the cache a surface (the preloader) can take
+the key back.
+"""
+
+from collections import OrderedDict
+
+from core.config import Config
+
+
+class SpriteCache:
+    def __init__(self, budget_bytes=None, on_evict=None):
+        if budget_bytes is None:
+            budget_bytes = Config.SPRITE_CACHE_BYTES
+        self.budget_bytes = budget_bytes
+        self.on_evict = on_evict
+
+        self._entries = OrderedDict()  # key -> (surface, size), oldest first
+        self._pinned = {}  # key -> (surface, size), never evicted
+        self.bytes = 0
+        self.pinned_bytes = 0
+
+        # Counters for the debug overlay / log
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def surface_bytes(surface):
+        """Pixel memory of a surface (subsurfaces are charged as if they owned it)."""
+        w, h = surface.get_size()
+        return w * h * surface.get_bytesize()
+
+    def get(self, key):
+        """Cached surface for `key` (now most recently used), or None."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        else:
+            entry = self._pinned.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, surface, pinned=False, size=None):
+        """Store `surface` under `key`, evicting old entries past the budget.
+
+        Values that are not surfaces (e.g. a whole FrameStrip) pass their
+        `size` in bytes.
+        """
+        if surface is None:
+            return None
+
+        self.discard(key)
+
+        if size is None:
+            size = self.surface_bytes(surface)
+        if pinned:
+            self._pinned[key] = (surface, size)
+            self.pinned_bytes += size
+        else:
+            self._entries[key] = (surface, size)
+        self.bytes += size
+
+        self._evict()
+        return surface
+
+    def pin(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._pinned[key] = entry
+            self.pinned_bytes += entry[1]
+
+    def grow(self, key, nbytes):
+        """Charge `nbytes` more to an entry that grew in place (new variants).
+
+        A growing entry is in use, so it becomes the most recently used
+        one and older entries are evicted before it. A pinned entry is
+        unpinned first: only the LRU absorbs growth.
+        """
+        entry = self._pinned.pop(key, None)
+        if entry is not None:
+            self.pinned_bytes -= entry[1]
+            self._entries[key] = entry
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries[key] = (entry[0], entry[1] + nbytes)
+            self._entries.move_to_end(key)
+            self.bytes += nbytes
+            self._evict()
+
+    def discard(self, key):
+        old = self._entries.pop(key, None)
+        if old is None:
+            old = self._pinned.pop(key, None)
+            if old is not None:
+                self.pinned_bytes -= old[1]
+        if old is not None:
+            self.bytes -= old[1]
+
+    def clear(self):
+        if self.on_evict is not None:
+            for key in list(self._entries) + list(self._pinned):
+                self.on_evict(key)
+        self._entries.clear()
+        self._pinned.clear()
+        self.bytes = 0
+        self.pinned_bytes = 0
+
+    def _evict(self):
+        # Oldest first; pinned surfaces are not in the LRU at all
+        while self.bytes > self.budget_bytes and self._entries:
+            key, (_, size) = self._entries.popitem(last=False)
+            self.bytes -= size
+            self.evictions += 1
+            if self.on_evict is not None:
+                self.on_evict(key)
+
+    def __contains__(self, key):
+        return key in self._entries or key in self._pinned
+
+    def is_pinned(self, key):
+        return key in self._pinned
+
+    def __len__(self):
+        return len(self._entries) + len(self._pinned)
+
+    def stats(self):
+        return {
+            "entries": len(self),
+            "pinned": len(self._pinned),
+            "pinned_bytes": self.pinned_bytes,
+            "bytes": self.bytes,
+            "budget": self.budget_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def report(self):
+        """One-line occupancy summary for the debug overlay or a log."""
+        mb = 1024 * 1024
+        return (
+            f"sprites {len(self)} ({len(self._pinned)} pinned) "
+            f"{self.bytes / mb:.1f}/{self.budget_bytes / mb:.0f} MB "
+            f"hit {self.hits} miss {self.misses} evict {self.evictions}"
+        )
@@ -0,0 +1,164 @@
+"""Terrain chunk cache — static terrain pre-rendered in world pixel space.
+
+The map is cut into square chunks of CHUNK_SIZE world pixels. Each chunk
+is baked once into its own surface (hex fills, outlines, tile textures
+and the fog clouds of locked levels) and then blitted whole, so a frame
+costs a handful of blits instead of hundreds of polygon draws.
+
+Tile art spills past its hex, so a chunk draws every tile whose centre
+lies within `margin` pixels of it, in the same y order as the full map,
+clipped to the chunk. Those hexes come straight from the chunk's pixel
+rect (`HexMath.hexes_in_rect`), so a bake never scans the whole map. Neighbouring chunks therefore join without seams
+and the surfaces can be opaque.
+
+Nothing here knows about the journal: the renderer calls
+`invalidate_tile` when a tile is discovered and `invalidate_level` when
+a level unlocks (its fog clouds disappear), and only the chunks that
+draw an affected tile are baked again.
+"""
+
+import math
+import pygame
+from core.config import Config
+from core.hexmath import HexMath
+
+
+class TerrainChunkCache:
+    CHUNK_SIZE = 512
+
+    def __init__(self, draw_tile, background=(0, 0, 0), margin=None, pixel_scale=1.0):
+        """`draw_tile(surface, world, tile, x, y)` paints one tile at (x, y).
+
+        `pixel_scale` converts HexMath pixels to the pixels chunks are
+        drawn in (the renderer's base resolution).
+        """
+        self.draw_tile = draw_tile
+        self.background = background
+        self.pixel_scale = pixel_scale
+        # Clouds are the widest thing drawn for a tile (~2.7 hexes wide)
+        if margin is None:
+            margin = Config.HEX_SIZE * 4 * pixel_scale
+        self.margin = margin
+
+        self._world = None
+        self._chunks_by_level = {}  # level -> {(kx, ky)} drawing a tile of it
+        self._chunks = {}  # (kx, ky) -> Surface, or None for empty chunks
+        self.bakes = 0  # chunks baked so far; the renderer flips the whole window when it grows
+
+    # Indexing
+    def bind(self, world):
+        """Index `world`'s tiles; a different world drops every chunk."""
+        if world is self._world:
+            return
+        self._world = world
+        self._chunks.clear()
+
+        by_level = {}
+        for tile in getattr(world, "tiles", {}).values():
+            px, py = self._pixel(tile.q, tile.r)
+            by_level.setdefault(getattr(tile, "level", None), set()).update(
+                self._chunks_near(px, py)
+            )
+        self._chunks_by_level = by_level
+
+    def _pixel(self, q, r):
+        x, y = HexMath.hex_to_pixel(q, r)
+        return x * self.pixel_scale, y * self.pixel_scale
+
+    def _chunks_near(self, px, py):
+        """Keys of every chunk within `margin` of the point (px, py)."""
+        size = self.CHUNK_SIZE
+        m = self.margin
+        kx0 = math.floor((px - m) / size)
+        kx1 = math.floor((px + m) / size)
+        ky0 = math.floor((py - m) / size)
+        ky1 = math.floor((py + m) / size)
+        return [
+            (kx, ky)
+            for ky in range(ky0, ky1 + 1)
+            for kx in range(kx0, kx1 + 1)
+        ]
+
+    # Invalidation
+    def invalidate_tile(self, q, r):
+        """Re-bake every chunk the tile at (q, r) draws into."""
+        px, py = self._pixel(q, r)
+        for key in self._chunks_near(px, py):
+            self._chunks.pop(key, None)
+
+    def invalidate_level(self, level):
+        """Re-bake every chunk that draws a tile of `level`."""
+        for key in self._chunks_by_level.get(level, ()):
+            self._chunks.pop(key, None)
+
+    def invalidate_all(self):
+        self._chunks.clear()
+
+    # Drawing
+    def draw(self, screen, cam_x, cam_y):
+        """Blit the chunks covering the screen; (cam_x, cam_y) is its top-left in world pixels."""
+        size = self.CHUNK_SIZE
+        width, height = screen.get_size()
+        # Whole pixels, so neighbouring chunks always land exactly side by side
+        cam_x, cam_y = math.floor(cam_x), math.floor(cam_y)
+
+        kx0 = math.floor(cam_x / size)
+        kx1 = math.floor((cam_x + width) / size)
+        ky0 = math.floor(cam_y / size)
+        ky1 = math.floor((cam_y + height) / size)
+
+        for ky in range(ky0, ky1 + 1):
+            for kx in range(kx0, kx1 + 1):
+                surf = self._get_chunk((kx, ky))
+                if surf is not None:
+                    screen.blit(surf, (kx * size - cam_x, ky * size - cam_y))
+
+        self._evict(kx0 - 1, kx1 + 1, ky0 - 1, ky1 + 1)
+
+    def _get_chunk(self, key):
+        if key in self._chunks:
+            return self._chunks[key]
+        surf = self._bake(key)
+        self._chunks[key] = surf
+        return surf
+
+    def _bake(self, key):
+        self.bakes += 1
+        size = self.CHUNK_SIZE
+        ox, oy = key[0] * size, key[1] * size
+        m = self.margin
+
+        # Only the hexes whose centre falls inside the chunk plus its margin,
+        # already back to front
+        tiles = getattr(self._world, "tiles", {})
+        entries = []
+        for q, r in HexMath.hexes_in_rect(
+            ox - m, oy - m, ox + size + m, oy + size + m, self.pixel_scale
+        ):
+            tile = tiles.get((q, r))
+            if tile is not None:
+                entries.append(tile)
+        if not entries:
+            return None
+
+        surf = pygame.Surface((size, size))
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert()
+        surf.fill(self.background)
+
+        for tile in entries:
+            px, py = self._pixel(tile.q, tile.r)
+            self.draw_tile(surf, self._world, tile, px - ox, py - oy)
+        return surf
+
+    def _evict(self, kx0, kx1, ky0, ky1):
+        """Free chunks more than one chunk away from the screen."""
+        stale = [
+            key for key in self._chunks
+            if not (kx0 <= key[0] <= kx1 and ky0 <= key[1] <= ky1)
+        ]
+        for key in stale:
+            del self._chunks[key]
+
+    def __len__(self):
+        return len(self._chunks)
@@ -0,0 +1,124 @@
+"""VFX frame library — effect sprites scaled once, not on every draw.
+
+The castle star and heal sheets are cut into frames and scaled to their
+on-screen size when the renderer is created. Explosion rings depend only
+on their colour and maximum radius, and CircleExplosion grows by a fixed
+step per update, so every frame of a ring (radius and fade) is drawn
+once into a table the first time that kind of explosion appears and then
+just blitted.
+"""
+
+import pygame
+
+
+class VFXLibrary:
+    STAR_SHEET = "star.png"
+    STAR_FRAMES = 13
+    STAR_SIZE = 48  # on-screen width of a star frame, full resolution
+
+    HEAL_SHEET = "Heal_Effect.png"
+    HEAL_FRAME_SIZE = (192, 180)  # frame size inside the sheet
+    HEAL_FRAMES = 11
+    HEAL_SIZE = (96, 90)  # on-screen size, full resolution
+
+    EXPLOSION_ALPHA = 160  # ring opacity at radius 0, fading to 0 at the max radius
+
+    def __init__(self, asset_manager, px=1.0):
+        """`px` converts full-resolution sizes to the pixels being drawn."""
+        self.assets = asset_manager
+        self.px = px
+
+        self.star_frames = self._bake_star()
+        self.heal_frames = self._bake_heal()
+        self._explosions = {}  # (color, max_pixel_radius) -> [Surface or None]
+
+    # Baking
+    def _bake_star(self):
+        sheet = self.assets.get_image(self.STAR_SHEET, scale_to_tile=False)
+        if not sheet:
+            return []
+
+        fw = sheet.get_width() // self.STAR_FRAMES
+        fh = sheet.get_height()
+        star_scale = self.STAR_SIZE * self.px / fw
+        size = (max(1, int(fw * star_scale)), max(1, int(fh * star_scale)))
+
+        frames = []
+        for i in range(self.STAR_FRAMES):
+            frame = sheet.subsurface((i * fw, 0, fw, fh))
+            frames.append(pygame.transform.smoothscale(frame, size))
+        return frames
+
+    def _bake_heal(self):
+        sheet = self.assets.get_image(self.HEAL_SHEET, scale_to_tile=False)
+        if not sheet:
+            return []
+
+        fw, fh = self.HEAL_FRAME_SIZE
+        size = (
+            max(1, int(self.HEAL_SIZE[0] * self.px)),
+            max(1, int(self.HEAL_SIZE[1] * self.px)),
+        )
+
+        frames = []
+        for i in range(self.HEAL_FRAMES):
+            try:
+                frame = sheet.subsurface((i * fw, 0, fw, fh))
+            except ValueError:
+                # Sheet shorter than expected: that frame is simply not drawn
+                frames.append(None)
+                continue
+            frames.append(pygame.transform.smoothscale(frame, size))
+        return frames
+
+    def _bake_explosion(self, color, max_radius, start_radius, step):
+        """One surface per update of a CircleExplosion, None once fully faded."""
+        surf_size = int(max_radius * 2 * self.px)
+        frames = []
+        radius = start_radius
+        while radius < max_radius:
+            alpha = int(self.EXPLOSION_ALPHA * (1.0 - radius / max_radius))
+            alpha = max(0, min(255, alpha))
+
+            if alpha <= 0 or surf_size <= 0:
+                frames.append(None)
+            else:
+                surf = pygame.Surface((surf_size, surf_size), pygame.SRCALPHA)
+                center = (surf_size // 2, surf_size // 2)
+                pygame.draw.circle(surf, (*color, alpha), center, int(radius * self.px))
+                frames.append(surf)
+            radius += step
+        return frames
+
+    # Lookup
+    def star_frame(self, frame_index, anim_slowdown=4):
+        """Castle star frame; the animation advances every `anim_slowdown` ticks."""
+        if not self.star_frames:
+            return None
+        return self.star_frames[(frame_index // anim_slowdown) % len(self.star_frames)]
+
+    def heal_frame(self, effect):
+        if not self.heal_frames:
+            return None
+        current_frame = (effect.anim_tick // effect.anim_speed) % effect.frame_count
+        if current_frame >= len(self.heal_frames):
+            return None
+        return self.heal_frames[current_frame]
+
+    def explosion_frame(self, effect):
+        """Baked ring for a CircleExplosion at its current size, or None."""
+        key = (tuple(effect.color), effect.max_pixel_radius)
+        frames = self._explosions.get(key)
+        if frames is None:
+            # Every explosion starts at radius 5 and grows by max / 15 per update
+            frames = self._bake_explosion(
+                effect.color, effect.max_pixel_radius, 5.0, effect.expand_speed
+            )
+            self._explosions[key] = frames
+
+        frame = getattr(effect, "frame", None)
+        if frame is None:
+            frame = round((effect.current_radius - 5.0) / effect.expand_speed)
+        if not 0 <= frame < len(frames):
+            return None
+        return frames[frame]